@@ -5,19 +5,43 @@ from axelrod.version import __version__
 from axelrod.load_data_ import load_pso_tables, load_weights
 from axelrod import graph
 from axelrod.action import Action
-from axelrod.random_ import random_choice, random_flip, seed, Pdf
+from axelrod.random_ import (
+    random_choice,
+    random_flip,
+    random_mask,
+    seed,
+    use_random_buffer,
+    Pdf,
+)
 from axelrod.plot import Plot
 from axelrod.game import DefaultGame, Game
-from axelrod.history import History, LimitedHistory
+from axelrod.history import ArrayHistory, History, LimitedHistory
 from axelrod.player import is_basic, obey_axelrod, Player
 from axelrod.evolvable_player import EvolvablePlayer
 from axelrod.mock_player import MockPlayer
 from axelrod.match import Match
-from axelrod.moran import MoranProcess, ApproximateMoranProcess
+from axelrod.moran import (
+    ApproximateMoranProcess,
+    CountMoranProcess,
+    MoranProcess,
+    type_payoff_matrix,
+)
+from axelrod.fixation import (
+    estimate_fixation,
+    exact_fixation,
+    two_type_fixation,
+    wilson_interval,
+)
 from axelrod.strategies import *
-from axelrod.deterministic_cache import DeterministicCache
+from axelrod.deterministic_cache import (
+    DeterministicCache,
+    PersistentDeterministicCache,
+    SharedDeterministicCache,
+)
+from axelrod.batch_match import BatchMatch
 from axelrod.match_generator import *
+from axelrod.executors import BrokerExecutor, Executor, run_worker
 from axelrod.tournament import Tournament
-from axelrod.result_set import ResultSet
+from axelrod.result_set import ResultAggregator, ResultSet
 from axelrod.ecosystem import Ecosystem
 from axelrod.fingerprint import AshlockFingerprint, TransitiveFingerprint
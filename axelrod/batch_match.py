@@ -0,0 +1,257 @@
+"""
+Vectorised play of repeated matches between pairs of memory one players.
+
+A match between two memory one players (see
+:code:`axelrod.strategies.memoryone.MemoryOnePlayer`) is entirely determined by
+their four-vectors, their initial moves and the noise. This module plays all
+repetitions of such a match at the same time using numpy arrays, one row per
+repetition.
+
+Actions are encoded by their value (C = 0, D = 1) and the state of a turn,
+from the point of view of the first player, by :code:`2 * a1 + a2` so that the
+states 0, 1, 2 and 3 correspond to CC, CD, DC and DD: the order of the entries
+of a four-vector.
+"""
+import numpy as np
+
+from axelrod import DEFAULT_TURNS
+from axelrod.action import Action
+from axelrod.game import Game
+
+from .markov_chain import STATES, is_memory_one_player, memory_one_parameters
+from .match import sample_length
+
+C, D = Action.C, Action.D
+
+
+def play_memory_one_actions(
+    four_vectors, initial_actions, turns, repetitions, noise=0, generators=None
+):
+    """
+    Plays repetitions of a match between two memory one players.
+
+    Parameters
+    ----------
+    four_vectors : tuple
+        A pair of arrays of length 4: the probabilities of cooperating after
+        each of the states CC, CD, DC and DD (from the point of view of each
+        player).
+    initial_actions : tuple
+        The values of the initial actions of both players.
+    turns : integer
+        The number of turns played in each repetition
+    repetitions : integer
+        The number of repetitions
+    noise : float
+        The probability that a player's intended action should be flipped
+    generators : list
+        If given, one numpy.random.Generator per repetition from which all the
+        random numbers of that repetition are drawn, so that each repetition
+        only depends on its own generator. By default the random numbers are
+        drawn from numpy's global random state.
+
+    Returns
+    -------
+    numpy.ndarray
+        An array of shape (repetitions, turns, 2) of action values.
+    """
+    plays = np.empty((repetitions, turns, 2), dtype=np.int8)
+    actions = np.empty((repetitions, 2), dtype=np.int8)
+    actions[:] = initial_actions
+    if generators is not None:
+        # The random numbers of a turn are the two draws deciding the actions
+        # and the two draws deciding the noise. Drawing them turn by turn
+        # makes the first turns of a repetition independent of `turns`.
+        uniforms = np.array(
+            [generator.random((turns, 4)) for generator in generators]
+        ).reshape((repetitions, turns, 4))
+    for turn in range(turns):
+        if turn > 0:
+            previous = plays[:, turn - 1]
+            probabilities = np.column_stack(
+                (
+                    four_vectors[0][2 * previous[:, 0] + previous[:, 1]],
+                    four_vectors[1][2 * previous[:, 1] + previous[:, 0]],
+                )
+            )
+            if generators is None:
+                draws = np.random.random((repetitions, 2))
+            else:
+                draws = uniforms[:, turn, :2]
+            # As in `random_choice`: cooperate if the draw is below p.
+            actions = (draws >= probabilities).astype(np.int8)
+        if noise:
+            if generators is None:
+                draws = np.random.random((repetitions, 2))
+            else:
+                draws = uniforms[:, turn, 2:]
+            actions = actions ^ (draws < noise)
+        plays[:, turn] = actions
+    return plays
+
+
+class BatchMatch(object):
+    """
+    The BatchMatch class conducts all repetitions of a match between two memory
+    one players at once.
+
+    It gives the same interactions as repeatedly playing an axelrod.Match,
+    although for stochastic players or noisy matches the random numbers are not
+    drawn in the same order so that a given seed leads to different results.
+    Each repetition can also be given its own seed, in which case its
+    interactions do not depend on the other repetitions played with it.
+    """
+
+    def __init__(
+        self,
+        players,
+        repetitions=1,
+        turns=None,
+        prob_end=None,
+        game=None,
+        noise=0,
+        match_attributes=None,
+    ):
+        """
+        Parameters
+        ----------
+        players : tuple
+            A pair of memory one axelrod.Player objects
+        repetitions : integer
+            The number of repetitions of the match
+        turns : integer
+            The number of turns per match
+        prob_end : float
+            The probability of a given turn ending a match
+        game : axelrod.Game
+            The game object used to score the match
+        noise : float
+            The probability that a player's intended action should be flipped
+        match_attributes : dict
+            Mapping attribute names to values which should be passed to players.
+            The default is to use the correct values for turns, game and noise
+            but these can be overridden if desired.
+        """
+        for player in players:
+            if not is_memory_one_player(player):
+                raise ValueError(
+                    "{} is not a memory one player: it cannot be played in a "
+                    "batch match.".format(player)
+                )
+
+        defaults = {
+            (True, True): (DEFAULT_TURNS, 0),
+            (True, False): (float("inf"), prob_end),
+            (False, True): (turns, 0),
+            (False, False): (turns, prob_end),
+        }
+        self.turns, self.prob_end = defaults[(turns is None, prob_end is None)]
+
+        self.repetitions = repetitions
+        self.noise = noise
+
+        if game is None:
+            self.game = Game()
+        else:
+            self.game = game
+
+        if match_attributes is None:
+            known_turns = self.turns if prob_end is None else float("inf")
+            self.match_attributes = {
+                "length": known_turns,
+                "game": self.game,
+                "noise": self.noise,
+            }
+        else:
+            self.match_attributes = match_attributes
+
+        self.players = list(players)
+        self.result = []
+        self.plays = None
+        self.lengths = None
+
+    def play(self, seeds=None):
+        """
+        Plays all repetitions of the match.
+
+        Parameters
+        ----------
+        seeds : list
+            If given, one seed per repetition: the length and the actions of
+            each repetition are drawn from a numpy.random.Generator seeded
+            with its seed. By default they are drawn from the global random
+            states.
+
+        Returns
+        -------
+        A list with one entry per repetition, each of which is a list of the
+        form returned by axelrod.Match.play:
+
+            [(C, C), (C, D)]
+        """
+        if seeds is None:
+            generators = None
+            samples = [sample_length(self.prob_end) for _ in range(self.repetitions)]
+        else:
+            if len(seeds) != self.repetitions:
+                raise ValueError("There must be one seed per repetition.")
+            generators = [np.random.default_rng(seed_) for seed_ in seeds]
+            samples = [
+                sample_length(self.prob_end, generator.random())
+                for generator in generators
+            ]
+        self.lengths = np.array(
+            [min(sample, self.turns) for sample in samples], dtype=int
+        )
+        four_vectors, initial_actions = [], []
+        for player in self.players:
+            player.reset()
+            player.set_match_attributes(**self.match_attributes)
+            four_vector, initial_action = memory_one_parameters(player)
+            four_vectors.append(four_vector)
+            initial_actions.append(initial_action)
+
+        turns = int(self.lengths.max()) if self.repetitions else 0
+        self.plays = play_memory_one_actions(
+            four_vectors,
+            initial_actions,
+            turns,
+            self.repetitions,
+            self.noise,
+            generators,
+        )
+
+        codes = 2 * self.plays[:, :, 0] + self.plays[:, :, 1]
+        self.result = [
+            [STATES[code] for code in row[:length]]
+            for row, length in zip(codes.tolist(), self.lengths)
+        ]
+        return self.result
+
+    def _turn_mask(self):
+        """An array indicating which turns were played in each repetition."""
+        return np.arange(self.plays.shape[1]) < self.lengths[:, None]
+
+    def scores(self):
+        """
+        Returns an array of shape (repetitions, turns, 2) of the scores of each
+        turn. Turns that were not played (when prob_end is used) score 0.
+        """
+        payoffs = np.array([self.game.score(state) for state in STATES])
+        codes = 2 * self.plays[:, :, 0] + self.plays[:, :, 1]
+        return payoffs[codes] * self._turn_mask()[:, :, None]
+
+    def final_scores(self):
+        """Returns an array of shape (repetitions, 2) of final scores."""
+        return self.scores().sum(axis=1)
+
+    def final_scores_per_turn(self):
+        """Returns an array of shape (repetitions, 2) of mean scores per turn."""
+        return self.final_scores() / self.lengths[:, None]
+
+    def cooperations(self):
+        """Returns an array of shape (repetitions, 2) of cooperation counts."""
+        return ((self.plays == C.value) * self._turn_mask()[:, :, None]).sum(axis=1)
+
+    def __len__(self):
+        return self.turns
@@ -12,16 +12,102 @@ else:
     ...
 """
 
+import hashlib
+import multiprocessing
+import os
 import pickle
+import sqlite3
 from collections import UserDict
-from typing import List, Tuple
+from collections.abc import Sequence
+from typing import Iterator, List, Optional, Tuple
+
+import numpy as np
 
 from .action import Action
 from .player import Player
 
+C, D = Action.C, Action.D
+
 CachePlayerKey = Tuple[Player, Player]
 CacheKey = Tuple[str, str]
 
+# The pairs of actions indexed by their two bit code.
+_PAIRS = ((C, C), (C, D), (D, C), (D, D))
+
+
+class PackedInteractions(Sequence):
+    """A compact, read only, list of interactions.
+
+    Each turn is stored on two bits (the values of both actions) so that four
+    turns fit in a byte. The interactions are only decoded when they are
+    indexed or iterated over: indexing with a slice returns a list of pairs of
+    actions, as does converting to a list.
+
+    Parameters
+    ----------
+    interactions : list
+        A list of pairs of actions.
+    """
+
+    def __init__(self, interactions=()) -> None:
+        bits = np.array(
+            [action.value for interaction in interactions for action in interaction],
+            dtype=np.uint8,
+        )
+        self.data = np.packbits(bits).tobytes()
+        self.turns = len(bits) // 2
+
+    @classmethod
+    def from_bytes(cls, data: bytes, turns: int) -> "PackedInteractions":
+        """Creates the interactions from previously packed data."""
+        interactions = cls()
+        interactions.data = bytes(data)
+        interactions.turns = turns
+        return interactions
+
+    def _decode(self, start: int, stop: int) -> List[Tuple[Action, Action]]:
+        """Decodes the turns in range(start, stop)."""
+        if stop <= start:
+            return []
+        first_byte = start // 4
+        packed = np.frombuffer(self.data, dtype=np.uint8)[first_byte : (stop + 3) // 4]
+        bits = np.unpackbits(packed)[2 * (start - 4 * first_byte) :]
+        codes = 2 * bits[0 : 2 * (stop - start) : 2] + bits[1 : 2 * (stop - start) : 2]
+        return [_PAIRS[code] for code in codes.tolist()]
+
+    def __len__(self) -> int:
+        return self.turns
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            start, stop, step = key.indices(self.turns)
+            if step == 1:
+                return self._decode(start, stop)
+            return self._decode(0, self.turns)[key]
+        if key < 0:
+            key += self.turns
+        if not 0 <= key < self.turns:
+            raise IndexError("interaction index out of range")
+        shift = 6 - 2 * (key % 4)
+        return _PAIRS[(self.data[key // 4] >> shift) & 3]
+
+    def __iter__(self):
+        return iter(self._decode(0, self.turns))
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, PackedInteractions):
+            return (self.turns, self.data) == (other.turns, other.data)
+        if isinstance(other, (list, tuple)):
+            return len(other) == self.turns and self._decode(0, self.turns) == list(
+                other
+            )
+        return NotImplemented
+
+    __hash__ = None  # type: ignore
+
+    def __repr__(self) -> str:
+        return repr(self._decode(0, self.turns))
+
 
 def _key_transform(key: CachePlayerKey) -> CacheKey:
     """Convert a CachePlayerKey to a CacheKey
@@ -34,6 +120,31 @@ def _key_transform(key: CachePlayerKey) -> CacheKey:
     return key[0].name, key[1].name
 
 
+def _hash_key(key: CachePlayerKey) -> str:
+    """Convert a CachePlayerKey to a stable content-addressed key.
+
+    The key is a hash of the representation of both players (which includes
+    their parameters) and of the match attributes they were given (the game
+    and the noise, as well as the known length of the match for players that
+    make use of it), so that it does not depend on the process or the session
+    in which it is computed.
+
+    Parameters
+    ----------
+    key: tuple
+        A 2-tuple: (player instance, player instance)
+    """
+    lines = []
+    for player in key:
+        attributes = sorted(
+            (name, value)
+            for name, value in player.match_attributes.items()
+            if name != "length" or "length" in player.classifier["makes_use_of"]
+        )
+        lines.extend([repr(player), repr(attributes)])
+    return hashlib.sha256("\n".join(lines).encode()).hexdigest()
+
+
 def _is_valid_key(key: CachePlayerKey) -> bool:
     """Validate a deterministic cache player key.
 
@@ -66,7 +177,8 @@ def _is_valid_key(key: CachePlayerKey) -> bool:
 def _is_valid_value(value: List) -> bool:
     """Validate a deterministic cache value.
 
-    The value just needs to be a list, with any contents.
+    The value just needs to be a list (or already packed interactions), with
+    any contents.
 
     Parameters
     ----------
@@ -76,7 +188,14 @@ def _is_valid_value(value: List) -> bool:
     -------
     Boolean indicating if the value is valid
     """
-    return isinstance(value, list)
+    return isinstance(value, (list, PackedInteractions))
+
+
+def _pack(value) -> PackedInteractions:
+    """Packs a list of interactions (unless it already is)."""
+    if isinstance(value, PackedInteractions):
+        return value
+    return PackedInteractions(value)
 
 
 class DeterministicCache(UserDict):
@@ -97,6 +216,9 @@ class DeterministicCache(UserDict):
 
     (axelrod.Cooperator, axelrod.Alternator): [(C, C), (C, D), (C, C)]
 
+    The interactions are stored as PackedInteractions (two bits per turn) and
+    are only decoded when indexed.
+
     Most of the functionality is provided by the UserDict class (which uses an
     instance of dict as the 'data' attribute to hold the dictionary entries).
 
@@ -121,7 +243,7 @@ class DeterministicCache(UserDict):
     def __delitem__(self, key: CachePlayerKey):
         return super().__delitem__(_key_transform(key))
 
-    def __getitem__(self, key: CachePlayerKey) -> List[Tuple[Action, Action]]:
+    def __getitem__(self, key: CachePlayerKey) -> PackedInteractions:
         return super().__getitem__(_key_transform(key))
 
     def __contains__(self, key):
@@ -142,7 +264,7 @@ class DeterministicCache(UserDict):
                 "Value must be a list with length equal to turns attribute"
             )
 
-        super().__setitem__(_key_transform(key), value)
+        super().__setitem__(_key_transform(key), _pack(value))
 
     def save(self, file_name: str) -> bool:
         """Serialise the cache dictionary to a file.
@@ -168,10 +290,305 @@ class DeterministicCache(UserDict):
             data = pickle.load(io)
 
         if isinstance(data, dict):
-            self.data = data
+            # Files saved before interactions were packed hold lists.
+            self.data = {key: _pack(value) for key, value in data.items()}
         else:
             raise ValueError(
                 "Cache file exists but is not the correct format. "
                 "Try deleting and re-building the cache file."
             )
         return True
+
+
+class PersistentDeterministicCache(DeterministicCache):
+    """A deterministic cache stored in an sqlite database.
+
+    Contrary to DeterministicCache, entries are keyed on a hash of the full
+    representation of the players and of their match attributes (see
+    _hash_key): players that share a name but not their parameters, or that
+    play a different game, do not collide.
+
+    Entries are only read from the database when they are requested, so that
+    a large cache does not need to be loaded before it is used, and are
+    written as soon as they are set. Any number of processes can thus share
+    (and update) a single cache file.
+    """
+
+    def __init__(self, file_name: str = ":memory:") -> None:
+        """Initialize a cache stored in the given file.
+
+        Parameters
+        ----------
+        file_name : string
+            Path to the database file, which is created if it does not exist.
+            By default the database is held in memory.
+        """
+        super().__init__(file_name=file_name)
+
+    def load(self, file_name: str) -> bool:
+        """Use the database in the given file to store the cache.
+
+        Parameters
+        ----------
+        file_name : string
+            Path to the database file, which is created if it does not exist.
+        """
+        if file_name != ":memory:" and os.path.isfile(file_name):
+            with open(file_name, "rb") as io:
+                header = io.read(16)
+            if header and header != b"SQLite format 3\x00":
+                raise ValueError(
+                    "Cache file exists but is not the correct format. "
+                    "Try deleting and re-building the cache file."
+                )
+        self.file_name = file_name
+        self._pid = None  # type: Optional[int]
+        self.data = {}
+        self._connect()
+        return True
+
+    def _connect(self) -> sqlite3.Connection:
+        """Returns a connection to the database, opening a new one in a
+        process that does not have one yet (connections can not be shared
+        with a forked process)."""
+        if self._pid != os.getpid():
+            self._connection = sqlite3.connect(
+                self.file_name, timeout=60, isolation_level=None
+            )
+            if self.file_name != ":memory:":
+                self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS interactions "
+                "(key TEXT PRIMARY KEY, turns INTEGER, data BLOB)"
+            )
+            self._pid = os.getpid()
+        return self._connection
+
+    def _read(self, hashed_key: str) -> Optional[PackedInteractions]:
+        """Returns the interactions stored for a hashed key (or None)."""
+        if hashed_key not in self.data:
+            row = (
+                self._connect()
+                .execute(
+                    "SELECT turns, data FROM interactions WHERE key = ?",
+                    (hashed_key,),
+                )
+                .fetchone()
+            )
+            if row is None:
+                return None
+            turns, data = row
+            self.data[hashed_key] = PackedInteractions.from_bytes(data, turns)
+        return self.data[hashed_key]
+
+    def __getitem__(self, key: CachePlayerKey) -> PackedInteractions:
+        value = self._read(_hash_key(key))
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key):
+        if not _is_valid_key(key):
+            return False
+        return self._read(_hash_key(key)) is not None
+
+    def __setitem__(self, key: CachePlayerKey, value):
+        """Validate the key and value before writing them to the database.
+
+        If a longer list of interactions is already stored (for example by
+        another process) it is kept."""
+        if not self.mutable:
+            raise ValueError("Cannot update cache unless mutable is True.")
+
+        if not _is_valid_key(key):
+            raise ValueError(
+                "Key must be a tuple of 2 deterministic axelrod Player classes"
+            )
+
+        if not _is_valid_value(value):
+            raise ValueError(
+                "Value must be a list with length equal to turns attribute"
+            )
+
+        hashed_key = _hash_key(key)
+        value = _pack(value)
+        self._connect().execute(
+            "INSERT INTO interactions VALUES (?, ?, ?) ON CONFLICT(key) DO UPDATE "
+            "SET turns = excluded.turns, data = excluded.data "
+            "WHERE excluded.turns > interactions.turns",
+            (hashed_key, value.turns, value.data),
+        )
+        self.data.pop(hashed_key, None)
+
+    def __delitem__(self, key: CachePlayerKey):
+        hashed_key = _hash_key(key)
+        if key not in self:
+            raise KeyError(key)
+        self._connect().execute(
+            "DELETE FROM interactions WHERE key = ?", (hashed_key,)
+        )
+        self.data.pop(hashed_key, None)
+
+    def __len__(self) -> int:
+        return self._connect().execute("SELECT COUNT(*) FROM interactions").fetchone()[0]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterates over the hashed keys of the cache."""
+        for (hashed_key,) in self._connect().execute("SELECT key FROM interactions"):
+            yield hashed_key
+
+    def __repr__(self) -> str:
+        return "{}({!r})".format(self.__class__.__name__, self.file_name)
+
+    def __getstate__(self):
+        """Used for pickling: the connection is reopened when required."""
+        state = self.__dict__.copy()
+        state["_connection"] = None
+        state["_pid"] = None
+        state["data"] = {}
+        return state
+
+    def save(self, file_name: str) -> bool:
+        """Copy the database to a file.
+
+        Parameters
+        ----------
+        file_name : string
+            File path to which the cache should be saved
+        """
+        destination = sqlite3.connect(file_name)
+        try:
+            self._connect().backup(destination)
+        finally:
+            destination.close()
+        return True
+
+
+class SharedDeterministicCache(DeterministicCache):
+    """A deterministic cache shared between processes.
+
+    Entries are held by a multiprocessing manager: a process (for example a
+    worker of a parallel tournament) that inherits the cache, or to which the
+    cache is passed, reads the entries set by all other processes and publishes
+    the entries it sets to all of them. Entries that have been read are kept in
+    a local dictionary so that each entry only needs to be transferred once
+    per process.
+
+    As for PersistentDeterministicCache, entries are keyed on a hash of the
+    full representation of the players and of their match attributes (see
+    _hash_key).
+    """
+
+    def __init__(self, file_name: str = None) -> None:
+        """Initialize a new cache.
+
+        Parameters
+        ----------
+        file_name : string
+            Path to a cache file previously saved by a SharedDeterministicCache
+        """
+        self._manager = multiprocessing.Manager()
+        self._shared = self._manager.dict()
+        super().__init__(file_name=file_name)
+
+    def _read(self, hashed_key: str) -> Optional[PackedInteractions]:
+        """Returns the interactions stored for a hashed key (or None)."""
+        if hashed_key not in self.data:
+            value = self._shared.get(hashed_key)
+            if value is None:
+                return None
+            self.data[hashed_key] = value
+        return self.data[hashed_key]
+
+    def __getitem__(self, key: CachePlayerKey) -> PackedInteractions:
+        value = self._read(_hash_key(key))
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key):
+        if not _is_valid_key(key):
+            return False
+        return self._read(_hash_key(key)) is not None
+
+    def __setitem__(self, key: CachePlayerKey, value):
+        """Validate the key and value before publishing them.
+
+        If a longer list of interactions has already been published (for
+        example by another process) it is kept."""
+        if not self.mutable:
+            raise ValueError("Cannot update cache unless mutable is True.")
+
+        if not _is_valid_key(key):
+            raise ValueError(
+                "Key must be a tuple of 2 deterministic axelrod Player classes"
+            )
+
+        if not _is_valid_value(value):
+            raise ValueError(
+                "Value must be a list with length equal to turns attribute"
+            )
+
+        hashed_key = _hash_key(key)
+        published = self._shared.get(hashed_key)
+        if published is None or len(published) < len(value):
+            self._shared[hashed_key] = _pack(value)
+        self.data.pop(hashed_key, None)
+
+    def __delitem__(self, key: CachePlayerKey):
+        hashed_key = _hash_key(key)
+        self.data.pop(hashed_key, None)
+        try:
+            del self._shared[hashed_key]
+        except KeyError:
+            raise KeyError(key)
+
+    def __len__(self) -> int:
+        return len(self._shared)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterates over the hashed keys of the cache."""
+        return iter(self._shared.keys())
+
+    def __repr__(self) -> str:
+        return "{}({} entries)".format(self.__class__.__name__, len(self))
+
+    def __getstate__(self):
+        """Used for pickling: only the proxy to the shared entries is kept."""
+        state = self.__dict__.copy()
+        state["_manager"] = None
+        state["data"] = {}
+        return state
+
+    def save(self, file_name: str) -> bool:
+        """Serialise the shared entries to a file.
+
+        Parameters
+        ----------
+        file_name : string
+            File path to which the cache should be saved
+        """
+        with open(file_name, "wb") as io:
+            pickle.dump(self._shared.copy(), io)
+        return True
+
+    def load(self, file_name: str) -> bool:
+        """Publish the entries of a previously saved cache.
+
+        Parameters
+        ----------
+        file_name : string
+            Path to a cache file previously saved by a SharedDeterministicCache
+        """
+        with open(file_name, "rb") as io:
+            data = pickle.load(io)
+
+        if not isinstance(data, dict) or not all(
+            isinstance(value, PackedInteractions) for value in data.values()
+        ):
+            raise ValueError(
+                "Cache file exists but is not the correct format. "
+                "Try deleting and re-building the cache file."
+            )
+        self._shared.update(data)
+        return True
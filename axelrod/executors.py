@@ -0,0 +1,254 @@
+"""
+Executors playing the chunks of matches of a tournament.
+
+By default a tournament plays its chunks of matches (see
+MatchGenerator.build_match_chunks) either in the current process or in
+sub-processes of the current machine. An executor passed to Tournament.play
+replaces both: it is given the tournament and its chunks and yields the
+results of each chunk as they are played, which the tournament writes as
+usual.
+
+The BrokerExecutor hands the chunks out over sockets to workers which may run
+on other machines. Each worker connects to the broker, receives the tournament
+once and then plays one chunk at a time. The chunk held by a worker that
+disconnects (or takes longer than a given timeout) is put back in the queue
+and handed to another worker, so that a tournament completes as long as some
+worker remains. A worker is started on any machine with::
+
+    python -c "import axelrod; axelrod.run_worker(('host', port), b'authkey')"
+"""
+import os
+import queue
+import threading
+import traceback
+from multiprocessing import Process
+from multiprocessing.connection import Client, Listener
+from typing import Iterator, List, Optional, Tuple
+
+
+class Executor(object):
+    """
+    The interface of the executors which play the chunks of a tournament.
+
+    Attributes
+    ----------
+    workers : int
+        The number of workers expected to play the chunks, used to schedule
+        the chunks with adaptive chunking
+    """
+
+    workers = 1
+
+    def run(self, tournament, chunks, build_results: bool = True) -> Iterator:
+        """
+        Plays the chunks of a tournament.
+
+        Parameters
+        ----------
+        tournament : axelrod.Tournament
+            The tournament to which the chunks belong
+        chunks : iterable
+            The chunks (or batches of chunks) to play
+        build_results : bool
+            whether or not to build a results set
+
+        Returns
+        -------
+        An iterator over the result of each chunk (see Tournament._play_chunk),
+        in any order. If the tournament stops early (see ResultAggregator), the
+        iterator is closed, if it can be, before all the results are read.
+        """
+        raise NotImplementedError
+
+
+class WorkerError(Exception):
+    """Raised when a worker fails to play a chunk."""
+
+
+class _Failure(object):
+    """The traceback of an exception raised by a worker."""
+
+    def __init__(self, message: str) -> None:
+        self.message = message
+
+
+def run_worker(address: Tuple[str, int], authkey: bytes) -> None:
+    """
+    Connects to a broker and plays the chunks it sends until it has no more.
+
+    Parameters
+    ----------
+    address : tuple
+        The host and port of the broker
+    authkey : bytes
+        The authentication key of the broker
+    """
+    connection = Client(tuple(address), authkey=authkey)
+    try:
+        tournament, build_results = connection.recv()
+        while True:
+            chunk = connection.recv()
+            if chunk is None:
+                break
+            try:
+                results = tournament._play_chunk(chunk, build_results)
+            except Exception:
+                results = _Failure(traceback.format_exc())
+            connection.send(results)
+    except (EOFError, OSError):
+        # The broker has gone away.
+        pass
+    finally:
+        connection.close()
+
+
+class BrokerExecutor(Executor):
+    """
+    An executor handing the chunks of a tournament out to workers connecting
+    over sockets, possibly from other machines (see run_worker).
+
+    The broker listens as soon as it is created, so that the address (with
+    the port chosen by the system if 0 was given) can be passed to the
+    workers. The chunk held by a worker is put back in the queue when the
+    worker disconnects or when it takes longer than timeout seconds.
+
+    Parameters
+    ----------
+    address : tuple
+        The host and port on which to listen for workers
+    authkey : bytes
+        The key the workers authenticate with (a random key by default). The
+        chunks and results are pickled, so a broker reachable from other
+        machines must only be given to trusted workers.
+    local_workers : int
+        The number of worker processes to start on this machine
+    workers : int
+        The number of workers expected, used to schedule the chunks with
+        adaptive chunking (by default the number of local workers)
+    timeout : float
+        The time (in seconds) after which a worker playing a chunk is
+        considered lost (by default a worker is only lost when it disconnects)
+    """
+
+    def __init__(
+        self,
+        address: Tuple[str, int] = ("localhost", 0),
+        authkey: bytes = None,
+        local_workers: int = 0,
+        workers: int = None,
+        timeout: float = None,
+    ) -> None:
+        if authkey is None:
+            authkey = os.urandom(32)
+        self.authkey = authkey
+        self.local_workers = local_workers
+        if workers is None:
+            workers = max(1, local_workers)
+        self.workers = workers
+        self.timeout = timeout
+        self._listener = Listener(tuple(address), authkey=authkey)
+        self.address = self._listener.address
+        self.requeued = 0
+        self._pending = queue.Queue()  # type: queue.Queue
+        self._results = queue.Queue()  # type: queue.Queue
+        self._done = threading.Event()
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self) -> None:
+        """Stops listening for workers."""
+        self._listener.close()
+
+    def run(self, tournament, chunks, build_results: bool = True) -> Iterator:
+        self._pending = queue.Queue()
+        self._results = queue.Queue()
+        self._done = threading.Event()
+        remaining = 0
+        for chunk in chunks:
+            self._pending.put(chunk)
+            remaining += 1
+
+        work = (tournament, build_results)
+        acceptor = threading.Thread(target=self._accept, args=(work,), daemon=True)
+        acceptor.start()
+        processes = []  # type: List[Process]
+        for _ in range(self.local_workers):
+            process = Process(target=run_worker, args=(self.address, self.authkey))
+            process.start()
+            processes.append(process)
+
+        try:
+            while remaining:
+                results = self._results.get()
+                if isinstance(results, _Failure):
+                    raise WorkerError(results.message)
+                remaining -= 1
+                yield results
+        finally:
+            self._done.set()
+            self._stop_accepting()
+            acceptor.join()
+            for process in processes:
+                process.join()
+
+    def _accept(self, work) -> None:
+        """Accepts the connections of workers until the chunks are played."""
+        while True:
+            try:
+                connection = self._listener.accept()
+            except (EOFError, OSError):
+                # A failed authentication or a closed listener.
+                if self._done.is_set():
+                    return
+                continue
+            if self._done.is_set():
+                connection.close()
+                return
+            threading.Thread(
+                target=self._serve, args=(connection, work), daemon=True
+            ).start()
+
+    def _stop_accepting(self) -> None:
+        """Wakes up the thread waiting for workers so that it can stop."""
+        try:
+            Client(self.address, authkey=self.authkey).close()
+        except (EOFError, OSError):
+            pass
+
+    def _next_chunk(self):
+        """Returns the next chunk to play or None once all are played."""
+        while not self._done.is_set():
+            try:
+                return self._pending.get(timeout=0.05)
+            except queue.Empty:
+                continue
+        return None
+
+    def _serve(self, connection, work) -> None:
+        """Hands chunks out to a worker until all are played or it is lost."""
+        chunk = None  # type: Optional[object]
+        try:
+            connection.send(work)
+            while True:
+                chunk = self._next_chunk()
+                if chunk is None:
+                    connection.send(None)
+                    return
+                connection.send(chunk)
+                if self.timeout is not None and not connection.poll(self.timeout):
+                    raise TimeoutError
+                results = connection.recv()
+                chunk = None
+                self._results.put(results)
+        except (EOFError, OSError):
+            if chunk is not None:
+                with self._lock:
+                    self.requeued += 1
+                self._pending.put(chunk)
+        finally:
+            connection.close()
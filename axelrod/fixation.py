@@ -0,0 +1,363 @@
+"""
+Fixation probabilities of Moran processes.
+
+A Moran process without mutation (a MoranProcess or a CountMoranProcess)
+eventually fixates on a single type. The probability that each type fixates,
+and the mean number of rounds it takes, are estimated by playing many
+independent replicates of the process, possibly in parallel. For a process of
+two types on a complete graph they are also computed exactly, from the birth
+death Markov chain of the number of players of the first type.
+"""
+import random
+from collections import Counter, namedtuple
+from math import sqrt
+from multiprocessing import Pool, cpu_count
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+from scipy.linalg import solve_banded
+from scipy.stats import norm
+
+from axelrod import DEFAULT_TURNS, Game, Player
+
+from .moran import CountMoranProcess, MoranProcess, type_payoff_matrix
+from .random_ import derive_seed, seed
+
+FixationEstimate = namedtuple(
+    "FixationEstimate",
+    "replicates fixations probabilities confidence_intervals mean_fixation_times",
+)
+
+ExactFixation = namedtuple("ExactFixation", "probabilities absorption_times")
+
+# The process played by each worker process, set once by _set_process.
+_process = None
+
+
+def _set_process(process) -> None:
+    global _process
+    _process = process
+
+
+def _play_replicates(process, seed_: int, start: int, stop: int) -> List[Tuple]:
+    """
+    Plays the replicates of a process numbered from start to stop, each
+    seeded from seed_ and its number.
+
+    Returns
+    -------
+    A list of tuples of the name of the type which fixated and the number of
+    rounds until fixation.
+    """
+    outcomes = []
+    for replicate in range(start, stop):
+        seed(derive_seed(seed_, replicate))
+        process.reset()
+        outcomes.append(process.fixate())
+    return outcomes
+
+
+def _play_replicates_in_worker(arguments: Tuple) -> List[Tuple]:
+    return _play_replicates(_process, *arguments)
+
+
+def wilson_interval(
+    successes: int, trials: int, confidence: float = 0.95
+) -> Tuple[float, float]:
+    """
+    Returns the Wilson score interval of a probability estimated from a number
+    of successes in a number of trials.
+
+    Parameters
+    ----------
+    successes:
+        The number of successes
+    trials:
+        The number of trials
+    confidence:
+        The confidence level of the interval
+
+    Returns
+    -------
+    A tuple of the lower and upper bounds of the interval
+    """
+    z = norm.ppf(1 - (1 - confidence) / 2)
+    p = successes / trials
+    denominator = 1 + z ** 2 / trials
+    centre = (p + z ** 2 / (2 * trials)) / denominator
+    half_width = (
+        z * sqrt(p * (1 - p) / trials + z ** 2 / (4 * trials ** 2)) / denominator
+    )
+    return max(0.0, centre - half_width), min(1.0, centre + half_width)
+
+
+def _estimate(
+    names: List[str], outcomes: List[Tuple], confidence: float
+) -> FixationEstimate:
+    """Summarises the outcomes of the replicates played so far."""
+    replicates = len(outcomes)
+    fixations = Counter(name for name, _ in outcomes)
+    rounds = dict()  # type: Dict[str, List[int]]
+    for name, fixation_rounds in outcomes:
+        rounds.setdefault(name, []).append(fixation_rounds)
+    return FixationEstimate(
+        replicates=replicates,
+        fixations=fixations,
+        probabilities={name: fixations[name] / replicates for name in names},
+        confidence_intervals={
+            name: wilson_interval(fixations[name], replicates, confidence)
+            for name in names
+        },
+        mean_fixation_times={
+            name: np.mean(rounds[name]) if name in rounds else np.nan
+            for name in names
+        },
+    )
+
+
+def _precise_enough(estimate: FixationEstimate, tolerance: float) -> bool:
+    """
+    Whether the half width of the confidence interval of every fixation
+    probability is at most tolerance.
+    """
+    return all(
+        (high - low) / 2 <= tolerance
+        for low, high in estimate.confidence_intervals.values()
+    )
+
+
+def estimate_fixation(
+    process,
+    replicates: int = 1000,
+    processes: int = None,
+    seed_: int = None,
+    batch_size: int = 100,
+    tolerance: float = None,
+    confidence: float = 0.95,
+) -> FixationEstimate:
+    """
+    Estimates the fixation probability and the mean fixation time of each type
+    of a Moran process by playing independent replicates of it.
+
+    Replicate i is seeded from seed_ and i (see random_.derive_seed), so that
+    the estimate only depends on the seed, whatever the number of processes.
+    The process is copied to each worker process once, with the scores it
+    holds: the payoffs of a CountMoranProcess or, for a MoranProcess with
+    incremental scores, the scores of the matches between deterministic
+    types, which are computed once beforehand.
+
+    Parameters
+    ----------
+    process:
+        A MoranProcess or CountMoranProcess without mutation. It is reset and
+        played by the replicates.
+    replicates:
+        The maximum number of replicates to play
+    processes:
+        The number of processes to use (by default the replicates are played
+        in the current process, 0 uses all the available CPUs)
+    seed_:
+        The seed of the replicates (by default drawn from the random module)
+    batch_size:
+        The number of replicates played at once by a process
+    tolerance:
+        If given, stop once the half width of the confidence interval of
+        every fixation probability is at most tolerance (checked after each
+        batch)
+    confidence:
+        The confidence level of the intervals
+
+    Returns
+    -------
+    A FixationEstimate of the number of replicates played, the number of
+    fixations of each type, and for each type of the initial population its
+    fixation probability, the confidence interval of the probability and the
+    mean number of rounds until it fixates (nan if it never did).
+    """
+    if process.mutation_rate != 0:
+        raise ValueError("A process with mutation never fixates.")
+    if replicates < 1 or batch_size < 1:
+        raise ValueError("The number of replicates and the batch size must be positive.")
+    if seed_ is None:
+        seed_ = random.getrandbits(32)
+    if isinstance(process, MoranProcess) and process.incremental_scores:
+        process._fill_type_pair_scores()
+    process.reset()
+    names = sorted(process.populations[0])
+
+    batches = [
+        (seed_, start, min(start + batch_size, replicates))
+        for start in range(0, replicates, batch_size)
+    ]
+    outcomes = []  # type: List[Tuple]
+    if processes is None or processes == 1:
+        for batch in batches:
+            outcomes.extend(_play_replicates(process, *batch))
+            estimate = _estimate(names, outcomes, confidence)
+            if tolerance is not None and _precise_enough(estimate, tolerance):
+                break
+    else:
+        if not 2 <= processes <= cpu_count():
+            processes = cpu_count()
+        with Pool(processes, initializer=_set_process, initargs=(process,)) as pool:
+            for batch_outcomes in pool.imap(_play_replicates_in_worker, batches):
+                outcomes.extend(batch_outcomes)
+                estimate = _estimate(names, outcomes, confidence)
+                if tolerance is not None and _precise_enough(estimate, tolerance):
+                    break
+    return estimate
+
+
+def _solve_birth_death_chain(
+    up: np.ndarray, down: np.ndarray, boundary: float, constant: float
+) -> np.ndarray:
+    """
+    Solves the equations of a birth death chain on the states 0 to N,
+    absorbing in 0 and N:
+
+        (up[i] + down[i]) x[i] - down[i] x[i - 1] - up[i] x[i + 1] = constant
+
+    for 0 < i < N, with x[0] = 0 and x[N] = boundary.
+
+    Parameters
+    ----------
+    up:
+        The probabilities of moving from state i to i + 1, for 0 < i < N
+    down:
+        The probabilities of moving from state i to i - 1, for 0 < i < N
+    boundary:
+        The value of x[N]
+    constant:
+        The right hand side of the equations
+
+    Returns
+    -------
+    The array x of the values in all the states from 0 to N
+    """
+    size = len(up)
+    banded = np.zeros((3, size))
+    banded[0, 1:] = -up[:-1]
+    banded[1] = up + down
+    banded[2, :-1] = -down[1:]
+    right_hand_side = np.full(size, float(constant))
+    right_hand_side[-1] += up[-1] * boundary
+    interior = solve_banded((1, 1), banded, right_hand_side)
+    return np.concatenate([[0], interior, [boundary]])
+
+
+def exact_fixation(process: CountMoranProcess) -> ExactFixation:
+    """
+    Computes the fixation probabilities and the expected absorption times of
+    a CountMoranProcess of two types without mutation.
+
+    The number of players of the first type is a birth death Markov chain. Its
+    probabilities of moving up and down (see
+    CountMoranProcess._change_probabilities) give the fixation probabilities
+    and the expected absorption times from each state as the solutions of two
+    tridiagonal systems of equations. If the fitness of all the players is
+    zero, the player which reproduces is chosen uniformly, so that the
+    process is neutral.
+
+    Parameters
+    ----------
+    process:
+        A CountMoranProcess of two types without mutation
+
+    Returns
+    -------
+    An ExactFixation of two arrays indexed by the number of players of the
+    first type, from 0 to the population size: the probability that the first
+    type fixates and the expected number of rounds until either type fixates.
+    """
+    if len(process.names) != 2:
+        raise ValueError("The process must have exactly two types.")
+    if process.mutation_rate != 0:
+        raise ValueError("A process with mutation never fixates.")
+    size = process.population_size
+    up = np.zeros(size - 1)
+    down = np.zeros(size - 1)
+    counts = process.counts
+    for state in range(1, size):
+        process.counts = np.array([state, size - state])
+        changes = process._change_probabilities()
+        up[state - 1] = changes[0, 1]
+        down[state - 1] = changes[1, 0]
+    process.counts = counts
+    return ExactFixation(
+        probabilities=_solve_birth_death_chain(up, down, boundary=1, constant=0),
+        absorption_times=_solve_birth_death_chain(up, down, boundary=0, constant=1),
+    )
+
+
+def two_type_fixation(
+    player1: Player,
+    player2: Player,
+    population_size: int,
+    turns: int = DEFAULT_TURNS,
+    prob_end: float = None,
+    noise: float = 0,
+    game: Game = None,
+    mode: str = "bd",
+    fitness_transformation: Callable = None,
+    repetitions: int = 1,
+) -> ExactFixation:
+    """
+    Computes the fixation probabilities and the expected absorption times of
+    the Moran process of two types of players on a complete graph (see
+    exact_fixation).
+
+    The fitness of the players is computed from the mean scores of each type
+    against each type (see type_payoff_matrix). This is exact for
+    deterministic players and, using the expected scores of the matches, for
+    memory one players. For other stochastic players the mean scores are
+    estimated from `repetitions` matches.
+
+    Parameters
+    ----------
+    player1:
+        A player of the first type
+    player2:
+        A player of the second type
+    population_size:
+        The number of players
+    turns:
+        The number of turns in each pairwise interaction
+    prob_end :
+        The probability of a given turn ending a match
+    noise:
+        The background noise, if any. Randomly flips plays with probability
+        `noise`.
+    game: axelrod.Game
+        The game object used to score matches.
+    mode:
+        Birth-Death (bd) or Death-Birth (db)
+    fitness_transformation:
+        A function mapping a score to a (non-negative) float
+    repetitions:
+        The number of times the matches between stochastic players (other
+        than memory one players) are played
+
+    Returns
+    -------
+    An ExactFixation of two arrays indexed by the number of players of the
+    first type, from 0 to population_size: the probability that the first
+    type fixates and the expected number of rounds until either type fixates.
+    For example, probabilities[1] is the fixation probability of a single
+    player of the first type.
+    """
+    payoffs = type_payoff_matrix(
+        [player1, player2],
+        turns=turns,
+        prob_end=prob_end,
+        noise=noise,
+        game=game,
+        repetitions=repetitions,
+    )
+    process = CountMoranProcess(
+        payoffs,
+        [1, population_size - 1],
+        names=[str(player1), str(player2)],
+        mode=mode,
+        fitness_transformation=fitness_transformation,
+    )
+    return exact_fixation(process)
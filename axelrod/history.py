@@ -1,8 +1,12 @@
 from collections import Counter
 
+import numpy as np
+
 from axelrod.action import Action, actions_to_str
 
 C, D = Action.C, Action.D
+# The actions indexed by their value.
+_ACTIONS = (C, D)
 
 
 class History(object):
@@ -78,6 +82,26 @@ class History(object):
     def state_distribution(self):
         return self._state_distribution
 
+    def count(self, action, start=None, stop=None):
+        """Returns the number of times action was played in the window
+        [start:stop] of the history (with the semantics of list slices)."""
+        return self._plays[start:stop].count(action)
+
+    def count_coplays(self, action, start=None, stop=None):
+        """Returns the number of times action was played by the coplayer in
+        the window [start:stop] of the history."""
+        return self._coplays[start:stop].count(action)
+
+    def play_values(self, start=None, stop=None):
+        """Returns the values of the plays (C = 0, D = 1) in the window
+        [start:stop] of the history as an array."""
+        return np.array([action.value for action in self._plays[start:stop]], dtype=np.uint8)
+
+    def coplay_values(self, start=None, stop=None):
+        """Returns the values of the coplays (C = 0, D = 1) in the window
+        [start:stop] of the history as an array."""
+        return np.array([action.value for action in self._coplays[start:stop]], dtype=np.uint8)
+
     def __eq__(self, other):
         if isinstance(other, list):
             return self._plays == other
@@ -131,3 +155,196 @@ class LimitedHistory(History):
             first_play, first_coplay = self._plays.pop(0), self._coplays.pop(0)
             self._actions[first_play] -= 1
             self._state_distribution[(first_play, first_coplay)] -= 1
+
+
+class ArrayHistory(History):
+    """
+    History class storing the values of the plays and coplays (C = 0, D = 1)
+    in preallocated arrays, along with the running counts of defections.
+
+    It has the same interface as History, but:
+
+    - the number of cooperations or defections in any window of the history
+      (see count and count_coplays) is computed in constant time,
+    - play_values and coplay_values return read only views of the arrays
+      rather than copies,
+    - the lists of plays and coplays (for example the coplays property, or
+      indexing the history) are only built when they are first requested,
+      and are then kept up to date.
+
+    Strategies counting the actions of a window of the history should use
+    count rather than slicing the history, so that they run in constant time
+    with an ArrayHistory (and no slower with a History).
+    """
+
+    def __init__(self, plays=None, coplays=None, capacity=64):
+        """
+        Parameters
+        ----------
+        plays:
+            An ordered iterable of the actions of the player.
+        coplays:
+            An ordered iterable of the actions of the coplayer (aka opponent).
+        capacity: int
+            The number of turns for which space is initially allocated (this
+            grows as required).
+        """
+        self._length = 0
+        self._values = np.zeros((2, capacity), dtype=np.uint8)
+        # The entry [i, n] is the number of defections in the first n turns.
+        self._defection_counts = np.zeros((2, capacity + 1), dtype=np.int64)
+        self._state_counts = [0, 0, 0, 0]
+        self._play_list = None
+        self._coplay_list = None
+        if plays:
+            self.extend(plays, coplays)
+
+    def _reserve(self, length):
+        """Grows the arrays so that they can hold length turns."""
+        capacity = self._values.shape[1]
+        if length <= capacity:
+            return
+        capacity = max(2 * capacity, length)
+        values = np.zeros((2, capacity), dtype=np.uint8)
+        values[:, : self._length] = self._values[:, : self._length]
+        defection_counts = np.zeros((2, capacity + 1), dtype=np.int64)
+        defection_counts[:, : self._length + 1] = self._defection_counts[
+            :, : self._length + 1
+        ]
+        self._values, self._defection_counts = values, defection_counts
+
+    def append(self, play, coplay):
+        """Appends a new (play, coplay) pair an updates metadata for
+        number of cooperations and defections, and the state distribution."""
+        length = self._length
+        self._reserve(length + 1)
+        play_value, coplay_value = play.value, coplay.value
+        self._values[0, length] = play_value
+        self._values[1, length] = coplay_value
+        self._defection_counts[0, length + 1] = (
+            self._defection_counts[0, length] + play_value
+        )
+        self._defection_counts[1, length + 1] = (
+            self._defection_counts[1, length] + coplay_value
+        )
+        self._state_counts[2 * play_value + coplay_value] += 1
+        self._length = length + 1
+        if self._play_list is not None:
+            self._play_list.append(play)
+        if self._coplay_list is not None:
+            self._coplay_list.append(coplay)
+
+    def extend(self, plays, coplays):
+        """A function that emulates list.extend."""
+        plays, coplays = list(plays), list(coplays)
+        length, new_length = self._length, self._length + len(plays)
+        self._reserve(new_length)
+        for row, actions in enumerate((plays, coplays)):
+            values = np.array([action.value for action in actions], dtype=np.uint8)
+            self._values[row, length:new_length] = values
+            self._defection_counts[row, length + 1 : new_length + 1] = (
+                self._defection_counts[row, length] + np.cumsum(values)
+            )
+        states = 2 * self._values[0, length:new_length] + self._values[1, length:new_length]
+        for state, count in enumerate(np.bincount(states, minlength=4).tolist()):
+            self._state_counts[state] += count
+        self._length = new_length
+        if self._play_list is not None:
+            self._play_list.extend(plays)
+        if self._coplay_list is not None:
+            self._coplay_list.extend(coplays)
+
+    def copy(self):
+        """Returns a new object with the same data."""
+        new = self.__class__(capacity=self._values.shape[1])
+        new._length = self._length
+        new._values = self._values.copy()
+        new._defection_counts = self._defection_counts.copy()
+        new._state_counts = list(self._state_counts)
+        return new
+
+    def reset(self):
+        """Clears all data in the History object."""
+        self._length = 0
+        self._state_counts = [0, 0, 0, 0]
+        self._play_list = None
+        self._coplay_list = None
+
+    def _action_list(self, row, key=slice(None)):
+        """Returns the list of actions in a slice of a row of the arrays."""
+        return [_ACTIONS[value] for value in self._values[row, : self._length][key].tolist()]
+
+    @property
+    def _plays(self):
+        if self._play_list is None:
+            self._play_list = self._action_list(0)
+        return self._play_list
+
+    @property
+    def _coplays(self):
+        if self._coplay_list is None:
+            self._coplay_list = self._action_list(1)
+        return self._coplay_list
+
+    @property
+    def cooperations(self):
+        return self._length - int(self._defection_counts[0, self._length])
+
+    @property
+    def defections(self):
+        return int(self._defection_counts[0, self._length])
+
+    @property
+    def state_distribution(self):
+        states = [(C, C), (C, D), (D, C), (D, D)]
+        return Counter(
+            {state: count for state, count in zip(states, self._state_counts) if count}
+        )
+
+    def _count(self, row, action, start, stop):
+        start, stop, _ = slice(start, stop).indices(self._length)
+        if stop <= start:
+            return 0
+        defections = int(
+            self._defection_counts[row, stop] - self._defection_counts[row, start]
+        )
+        return defections if action == D else stop - start - defections
+
+    def count(self, action, start=None, stop=None):
+        """Returns the number of times action was played in the window
+        [start:stop] of the history (with the semantics of list slices)."""
+        return self._count(0, action, start, stop)
+
+    def count_coplays(self, action, start=None, stop=None):
+        """Returns the number of times action was played by the coplayer in
+        the window [start:stop] of the history."""
+        return self._count(1, action, start, stop)
+
+    def _view(self, row, start, stop):
+        view = self._values[row, : self._length][start:stop]
+        view.flags.writeable = False
+        return view
+
+    def play_values(self, start=None, stop=None):
+        """Returns a read only view of the values of the plays (C = 0, D = 1)
+        in the window [start:stop] of the history."""
+        return self._view(0, start, stop)
+
+    def coplay_values(self, start=None, stop=None):
+        """Returns a read only view of the values of the coplays (C = 0,
+        D = 1) in the window [start:stop] of the history."""
+        return self._view(1, start, stop)
+
+    def __getitem__(self, key):
+        if self._play_list is None:
+            self._play_list = self._action_list(0)
+        return self._play_list[key]
+
+    def __iter__(self):
+        return iter(self._plays)
+
+    def __str__(self):
+        return actions_to_str(self._plays)
+
+    def __len__(self):
+        return self._length
@@ -0,0 +1,282 @@
+"""
+A binary log of the interactions of a tournament, written as the tournament is
+played. It holds the same data as the CSV file written by the Tournament class,
+but is smaller and much faster to write and read back.
+
+The file is made of a header followed by blocks of rows (one row per player per
+interaction, as in the CSV file). All numbers are little endian.
+
+The header is:
+
+    - the 8 bytes b"AXLLOG1\\n",
+    - one byte: 1 if the rows include the results of the interactions and 0
+      otherwise,
+    - the number of players (uint32) followed, for each player, by the length
+      (uint32) and the utf-8 encoding of their name.
+
+Each block is stored column by column:
+
+    - the number n of rows of the block (uint32),
+    - one byte: 1 if all the scores of the block are integers and 0 otherwise,
+    - the number of turns of each row (n uint32),
+    - each of the INDEX_COLUMNS (and of the STORED_RESULT_COLUMNS if the rows
+      include the results) as n values of the given type,
+    - the actions of the player of each row, one bit per action (C = 0,
+      D = 1), each row padded to a whole number of bytes.
+
+The other columns of the CSV file are not stored but recomputed when reading
+the log: the names of the players (from their indices), the number of turns
+(from the actions) and the scores per turn.
+"""
+import struct
+from typing import List
+
+import numpy as np
+import pandas as pd
+
+MAGIC = b"AXLLOG1\n"
+
+INDEX_COLUMNS = [
+    ("Interaction index", "<u8"),
+    ("Player index", "<u4"),
+    ("Opponent index", "<u4"),
+    ("Repetition", "<u4"),
+]
+
+STATE_COLUMNS = ["CC count", "CD count", "DC count", "DD count"]
+
+STATE_TO_ACTION_COLUMNS = [
+    "{} to {} count".format(state, action)
+    for state in ("CC", "CD", "DC", "DD")
+    for action in ("C", "D")
+]
+
+# The columns of the results, in the order of the CSV file, along with their
+# position in a row written by the Tournament class.
+RESULT_COLUMNS = [
+    "Score",
+    "Score difference",
+    "Turns",
+    "Score per turn",
+    "Score difference per turn",
+    "Win",
+    "Initial cooperation",
+    "Cooperation count",
+] + STATE_COLUMNS + STATE_TO_ACTION_COLUMNS + ["Good partner"]
+RESULT_POSITIONS = {name: 7 + index for index, name in enumerate(RESULT_COLUMNS)}
+
+STORED_RESULT_COLUMNS = (
+    [
+        ("Score", "<f8"),
+        ("Score difference", "<f8"),
+        ("Win", "u1"),
+        ("Initial cooperation", "?"),
+        ("Cooperation count", "<u4"),
+    ]
+    + [(column, "<u4") for column in STATE_COLUMNS + STATE_TO_ACTION_COLUMNS]
+    + [("Good partner", "u1")]
+)
+
+
+def is_interaction_log(filename: str) -> bool:
+    """Returns True if the given file is a binary log of interactions."""
+    with open(filename, "rb") as file_obj:
+        return file_obj.read(len(MAGIC)) == MAGIC
+
+
+class InteractionLogWriter(object):
+    """
+    Writes the rows of interactions of a tournament to a binary log.
+
+    The rows have the same form as those of the CSV file (see
+    Tournament._write_interactions_to_file) and are written in blocks of
+    rows_per_block rows, so that the log can be streamed to without holding
+    the whole tournament in memory.
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        player_names: List[str],
+        build_results: bool = True,
+        rows_per_block: int = 2 ** 16,
+        offset: int = None,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        filename : string
+            The file to which the log is written
+        player_names : list
+            The names of the players of the tournament
+        build_results : bool
+            Whether or not the rows include the results of the interactions
+        rows_per_block : int
+            The number of rows written at once
+        offset : int
+            If given, the rows are appended to an existing log from this
+            position (see tell), discarding anything written after it
+        """
+        self.build_results = build_results
+        self.rows_per_block = rows_per_block
+        self.columns = [
+            (position, dtype) for position, (_, dtype) in enumerate(INDEX_COLUMNS)
+        ]
+        if build_results:
+            self.columns.extend(
+                (RESULT_POSITIONS[name], dtype)
+                for name, dtype in STORED_RESULT_COLUMNS
+            )
+        self._rows = []  # type: List[list]
+
+        if offset is not None:
+            self.file_obj = open(filename, "r+b")
+            self.file_obj.seek(offset)
+            self.file_obj.truncate()
+            return
+
+        self.file_obj = open(filename, "wb")
+        header = [MAGIC, struct.pack("<BI", build_results, len(player_names))]
+        for name in player_names:
+            encoded = name.encode("utf-8")
+            header.extend([struct.pack("<I", len(encoded)), encoded])
+        self.file_obj.write(b"".join(header))
+
+    def writerow(self, row: list) -> None:
+        """Adds a row to the log. The actions are a string of C and D."""
+        self._rows.append(row)
+        if len(self._rows) >= self.rows_per_block:
+            self.flush()
+
+    def flush(self) -> None:
+        """Writes the rows added since the last block as a new block."""
+        if not self._rows:
+            return
+        rows = self._rows
+        integer_scores = self.build_results and all(
+            isinstance(row[RESULT_POSITIONS["Score"]], (int, np.integer))
+            for row in rows
+        )
+        actions = [row[6].encode("ascii") for row in rows]
+        block = [
+            struct.pack("<IB", len(rows), integer_scores),
+            np.array([len(a) for a in actions], dtype="<u4").tobytes(),
+        ]
+        for position, dtype in self.columns:
+            values = [row[position] for row in rows]
+            block.append(np.array(values, dtype=dtype).tobytes())
+        for a in actions:
+            bits = np.frombuffer(a, dtype=np.uint8) == ord("D")
+            block.append(np.packbits(bits).tobytes())
+        self.file_obj.write(b"".join(block))
+        self._rows = []
+
+    def tell(self) -> int:
+        """
+        Writes the rows added since the last block and returns the position in
+        the file after them.
+        """
+        self.flush()
+        self.file_obj.flush()
+        return self.file_obj.tell()
+
+    def close(self) -> None:
+        """Writes the remaining rows and closes the file."""
+        self.flush()
+        self.file_obj.close()
+
+
+def _read(file_obj, size: int) -> bytes:
+    """Reads exactly size bytes from a file."""
+    data = file_obj.read(size)
+    if len(data) != size:
+        raise ValueError("The interaction log is truncated.")
+    return data
+
+
+def _decode_actions(packed: bytes, lengths: np.ndarray) -> List[str]:
+    """Decodes the bit packed actions of the rows of a block."""
+    chars = np.where(
+        np.unpackbits(np.frombuffer(packed, dtype=np.uint8)), ord("D"), ord("C")
+    )
+    chars = chars.astype(np.uint8).tobytes().decode("ascii")
+    starts = np.concatenate([[0], np.cumsum(8 * ((lengths + 7) // 8))])
+    return [
+        chars[start : start + length]
+        for start, length in zip(starts.tolist(), lengths.tolist())
+    ]
+
+
+def read_interaction_log(filename: str, actions: bool = True) -> pd.DataFrame:
+    """
+    Reads a binary log of interactions.
+
+    Parameters
+    ----------
+    filename : string
+        The file from which to read the interactions
+    actions : bool
+        Whether or not to decode the actions of the players (these are not
+        needed to build a ResultSet)
+
+    Returns
+    -------
+    A pandas.DataFrame with the same columns (and dtypes) as would be read
+    from the CSV file of the same tournament.
+    """
+    with open(filename, "rb") as file_obj:
+        if _read(file_obj, len(MAGIC)) != MAGIC:
+            raise ValueError("{} is not an interaction log.".format(filename))
+        build_results, number_of_players = struct.unpack("<BI", _read(file_obj, 5))
+        names = []
+        for _ in range(number_of_players):
+            (length,) = struct.unpack("<I", _read(file_obj, 4))
+            names.append(_read(file_obj, length).decode("utf-8"))
+
+        columns = INDEX_COLUMNS + (STORED_RESULT_COLUMNS if build_results else [])
+        values = {name: [] for name, _ in columns}  # type: dict
+        turns = []
+        histories = []  # type: List[str]
+        integer_scores = True
+        while True:
+            header = file_obj.read(5)
+            if not header:
+                break
+            rows, block_integer_scores = struct.unpack("<IB", header)
+            integer_scores = integer_scores and block_integer_scores
+            lengths = np.frombuffer(_read(file_obj, 4 * rows), dtype="<u4")
+            lengths = lengths.astype(np.int64)
+            turns.append(lengths)
+            for name, dtype in columns:
+                size = np.dtype(dtype).itemsize * rows
+                values[name].append(np.frombuffer(_read(file_obj, size), dtype=dtype))
+            packed = _read(file_obj, int(((lengths + 7) // 8).sum()))
+            if actions:
+                histories.extend(_decode_actions(packed, lengths))
+
+    data = {}
+    for name, dtype in columns:
+        column = np.concatenate(values[name]) if values[name] else np.array([], dtype)
+        if np.dtype(dtype).kind == "u":
+            column = column.astype(np.int64)
+        data[name] = column
+
+    player_names = np.array(names, dtype=object)
+    data["Player name"] = player_names[data["Player index"]]
+    data["Opponent name"] = player_names[data["Opponent index"]]
+    if actions:
+        data["Actions"] = histories
+    if build_results:
+        data["Turns"] = np.concatenate(turns) if turns else np.array([], np.int64)
+        data["Score per turn"] = data["Score"] / data["Turns"]
+        data["Score difference per turn"] = data["Score difference"] / data["Turns"]
+        if integer_scores:
+            data["Score"] = data["Score"].astype(np.int64)
+            data["Score difference"] = data["Score difference"].astype(np.int64)
+
+    order = [name for name, _ in INDEX_COLUMNS] + ["Player name", "Opponent name"]
+    if actions:
+        order.append("Actions")
+    if build_results:
+        order.extend(RESULT_COLUMNS)
+    return pd.DataFrame(data, columns=order)
@@ -7,17 +7,127 @@ form:
 This is used by both the Match class and the ResultSet class which analyse
 interactions.
 """
-from collections import Counter, defaultdict
+from collections import Counter, defaultdict, namedtuple
 
+import numpy as np
 import pandas as pd
 import tqdm
 from axelrod.action import Action, str_to_actions
 
 from .game import Game
+from .interaction_log import is_interaction_log, read_interaction_log
 
 C, D = Action.C, Action.D
 
 
+MatchStatistics = namedtuple(
+    "MatchStatistics",
+    "scores turns scores_per_turn winner_index initial_cooperations "
+    "cooperations state_distribution state_to_action_distributions",
+)
+
+STATES = [(C, C), (C, D), (D, C), (D, D)]
+STATE_TO_ACTIONS = [(state, action) for state in STATES for action in (C, D)]
+
+
+def _final_score(states, state_counts, game, index):
+    """
+    Returns the final score of one player from the states of a match and their
+    counts, as the sum of the scores of each turn would give it.
+    """
+    payoffs = [game.score(state)[index] for state in STATES]
+    terms = [(count, payoff) for count, payoff in zip(state_counts, payoffs) if count]
+    if all(isinstance(payoff, (int, np.integer)) for _, payoff in terms):
+        return sum(count * payoff for count, payoff in terms)
+    # Floats are summed turn by turn (cumsum is sequential), in the same order
+    # as the scores of each turn.
+    return np.cumsum(np.array(payoffs, dtype=float)[states])[-1].item()
+
+
+def compute_match_statistics(interactions, game=None):
+    """
+    Returns all the statistics of a given set of interactions, computed in a
+    single pass.
+
+    The interactions are converted once to an array of states (0 for (C, C),
+    1 for (C, D), 2 for (D, C) and 3 for (D, D)) from which everything else is
+    counted with numpy. The results are the same (in value and type) as those
+    of the other functions of this module, which are computed from these.
+
+    Parameters
+    ----------
+    interactions : iterable of tuples
+        The interactions of the match as shown at the top of this file.
+    game : axelrod.Game
+        The game used to score the interactions.
+
+    Returns
+    -------
+    MatchStatistics : namedtuple or None
+        None if there are no interactions, otherwise with the following
+        entries:
+
+        - scores: the final score of each player
+        - turns: the number of turns
+        - scores_per_turn: the mean score per turn of each player
+        - winner_index: the index of the winner, or False if there is none
+        - initial_cooperations: whether each player cooperated on the first
+          turn
+        - cooperations: the count of cooperations of each player
+        - state_distribution: a Counter of the states
+        - state_to_action_distributions: a Counter of the state to action
+          pairs of each player (see compute_state_to_action_distribution)
+    """
+    if not game:
+        game = Game()
+    states = np.array(
+        [2 * (play is D) + (coplay is D) for play, coplay in interactions],
+        dtype=np.intp,
+    )
+    turns = len(states)
+    if turns == 0:
+        return None
+
+    state_counts = np.bincount(states, minlength=4).tolist()
+    scores = tuple(
+        _final_score(states, state_counts, game, index) for index in range(2)
+    )
+    if scores[0] == scores[1]:
+        winner_index = False  # No winner
+    else:
+        winner_index = int(scores[1] > scores[0])
+
+    cooperations = (
+        state_counts[0] + state_counts[1],
+        state_counts[0] + state_counts[2],
+    )
+    initial_cooperations = (bool(states[0] < 2), bool(states[0] % 2 == 0))
+    state_distribution = Counter(
+        {state: count for state, count in zip(STATES, state_counts) if count}
+    )
+
+    state_to_action_distributions = []
+    for index in range(2):
+        actions = (states[1:] >> (1 - index)) & 1
+        counts = np.bincount(2 * states[:-1] + actions, minlength=8).tolist()
+        state_to_action_distributions.append(
+            Counter(
+                {key: count for key, count in zip(STATE_TO_ACTIONS, counts) if count}
+            )
+        )
+
+    return MatchStatistics(
+        scores=scores,
+        turns=turns,
+        scores_per_turn=tuple(score / turns for score in scores),
+        winner_index=winner_index,
+        initial_cooperations=initial_cooperations,
+        cooperations=cooperations,
+        state_distribution=state_distribution,
+        state_to_action_distributions=state_to_action_distributions,
+    )
+
+
 def compute_scores(interactions, game=None):
     """Returns the scores of a given set of interactions."""
     if not game:
@@ -27,54 +137,55 @@ def compute_scores(interactions, game=None):
 
 def compute_final_score(interactions, game=None):
     """Returns the final score of a given set of interactions."""
-    scores = compute_scores(interactions, game)
-    if len(scores) == 0:
+    statistics = compute_match_statistics(interactions, game)
+    if statistics is None:
         return None
+    return statistics.scores
 
-    final_score = tuple(
-        sum([score[player_index] for score in scores]) for player_index in [0, 1]
-    )
-    return final_score
+
+def compute_final_score_of_cycle(interactions, start, period, game=None):
+    """
+    Returns the final score of a given set of interactions which repeat a
+    cycle of length period from index start onwards, only scoring the turns
+    before the cycle and a single period.
+    """
+    repeats, remainder = divmod(len(interactions) - start, period)
+    parts = [
+        (1, interactions[:start]),
+        (repeats, interactions[start : start + period]),
+        (1, interactions[start : start + remainder]),
+    ]
+    final_score = [0, 0]
+    for multiplier, part in parts:
+        for scores in compute_scores(part, game):
+            final_score[0] += multiplier * scores[0]
+            final_score[1] += multiplier * scores[1]
+    return tuple(final_score)
 
 
 def compute_final_score_per_turn(interactions, game=None):
     """Returns the mean score per round for a set of interactions"""
-    scores = compute_scores(interactions, game)
-    num_turns = len(interactions)
-
-    if len(scores) == 0:
+    statistics = compute_match_statistics(interactions, game)
+    if statistics is None:
         return None
-
-    final_score_per_turn = tuple(
-        sum([score[player_index] for score in scores]) / num_turns
-        for player_index in [0, 1]
-    )
-    return final_score_per_turn
+    return statistics.scores_per_turn
 
 
 def compute_winner_index(interactions, game=None):
     """Returns the index of the winner of the Match"""
-    scores = compute_final_score(interactions, game)
-
-    if scores is not None:
-        if scores[0] == scores[1]:
-            return False  # No winner
-        return max([0, 1], key=lambda i: scores[i])
-    return None
+    statistics = compute_match_statistics(interactions, game)
+    if statistics is None:
+        return None
+    return statistics.winner_index
 
 
 def compute_cooperations(interactions):
     """Returns the count of cooperations by each player for a set of
     interactions"""
-
-    if len(interactions) == 0:
+    statistics = compute_match_statistics(interactions)
+    if statistics is None:
         return None
-
-    cooperation = tuple(
-        sum([play[player_index] == C for play in interactions])
-        for player_index in [0, 1]
-    )
-    return cooperation
+    return statistics.cooperations
 
 
 def compute_normalised_cooperation(interactions):
@@ -107,9 +218,10 @@ def compute_state_distribution(interactions):
         Dictionary where the keys are the states and the values are the number
         of times that state occurs.
     """
-    if not interactions:
+    statistics = compute_match_statistics(interactions)
+    if statistics is None:
         return None
-    return Counter(interactions)
+    return statistics.state_distribution
 
 
 def compute_normalised_state_distribution(interactions):
@@ -131,7 +243,7 @@ def compute_normalised_state_distribution(interactions):
     if not interactions:
         return None
 
-    interactions_count = Counter(interactions)
+    interactions_count = compute_state_distribution(interactions)
     total = sum(interactions_count.values(), 0)
 
     normalized_count = Counter(
@@ -169,19 +281,10 @@ def compute_state_to_action_distribution(interactions):
         the values the counts. The
         first/second Counter corresponds to the first/second player.
     """
-    if not interactions:
+    statistics = compute_match_statistics(interactions)
+    if statistics is None:
         return None
-
-    distributions = [
-        Counter(
-            [
-                (state, outcome[j])
-                for state, outcome in zip(interactions, interactions[1:])
-            ]
-        )
-        for j in range(2)
-    ]
-    return distributions
+    return statistics.state_to_action_distributions
 
 
 def compute_normalised_state_to_action_distribution(interactions):
@@ -252,12 +355,15 @@ def compute_sparklines(interactions, c_symbol="█", d_symbol=" "):
 
 def read_interactions_from_file(filename, progress_bar=True):
     """
-    Reads a file and returns a dictionary mapping tuples of player pairs to
-    lists of interactions
+    Reads a file (either a CSV file or a binary log of interactions) and
+    returns a dictionary mapping tuples of player pairs to lists of
+    interactions
     """
-    df = pd.read_csv(filename)[
-        ["Interaction index", "Player index", "Opponent index", "Actions"]
-    ]
+    if is_interaction_log(filename):
+        df = read_interaction_log(filename)
+    else:
+        df = pd.read_csv(filename)
+    df = df[["Interaction index", "Player index", "Opponent index", "Actions"]]
     groupby = df.groupby("Interaction index")
     if progress_bar:
         groupby = tqdm.tqdm(groupby)
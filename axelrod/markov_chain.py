@@ -0,0 +1,227 @@
+"""
+Exact analysis of matches between pairs of memory one players.
+
+A match between two memory one players (see
+:code:`axelrod.strategies.memoryone.MemoryOnePlayer`) is a Markov chain on the
+four states CC, CD, DC and DD (from the point of view of the first player):
+the probability of each state in a given turn only depends on the state of the
+previous turn. The expected outcome of such a match can thus be computed from
+the transition matrix of the chain, without playing it.
+
+States are ordered as the entries of a four-vector and actions are encoded by
+their value (C = 0, D = 1), so that the state of a turn in which the players
+play a1 and a2 has index :code:`2 * a1 + a2`.
+"""
+from collections import Counter
+
+import numpy as np
+
+from axelrod.action import Action
+from axelrod.strategies.memoryone import MemoryOnePlayer
+
+C, D = Action.C, Action.D
+STATES = [(C, C), (C, D), (D, C), (D, D)]
+
+
+def is_memory_one_player(player):
+    """
+    Returns True if the behaviour of a player is fully described by its
+    four-vector and its initial move.
+
+    Subclasses of MemoryOnePlayer that override the strategy method (for
+    example after a strategy transformer has been applied) are excluded.
+    """
+    return (
+        isinstance(player, MemoryOnePlayer)
+        and type(player).strategy is MemoryOnePlayer.strategy
+    )
+
+
+def memory_one_parameters(player):
+    """
+    Returns the four-vector of a memory one player as an array, together with
+    the value of its initial action.
+
+    Note that the match attributes need to have been passed to the player as
+    some four-vectors (for example that of GTFT) depend on the game.
+    """
+    four_vector = np.array([player._four_vector[state] for state in STATES])
+    return four_vector, player._initial.value
+
+
+def _apply_noise(probabilities, noise):
+    """Returns the probabilities of cooperating once noise has been applied."""
+    return probabilities * (1 - noise) + (1 - probabilities) * noise
+
+
+def _joint_distribution(p1, p2):
+    """
+    Returns the distribution of the states given the probabilities of each
+    player cooperating (which may be arrays of the same shape).
+    """
+    return np.stack(
+        (p1 * p2, p1 * (1 - p2), (1 - p1) * p2, (1 - p1) * (1 - p2)), axis=-1
+    )
+
+
+def transition_matrix(four_vectors, noise=0):
+    """
+    Returns the transition matrix of a match between two memory one players.
+
+    Parameters
+    ----------
+    four_vectors : tuple
+        A pair of arrays of length 4: the probabilities of cooperating after
+        each of the states CC, CD, DC and DD (from the point of view of each
+        player).
+    noise : float
+        The probability that a player's intended action should be flipped
+
+    Returns
+    -------
+    numpy.ndarray
+        A 4 by 4 array: the entry (i, j) is the probability of moving from
+        state i to state j.
+    """
+    p1 = _apply_noise(np.asarray(four_vectors[0], dtype=float), noise)
+    # The second player sees the states CD and DC the other way round.
+    p2 = _apply_noise(np.asarray(four_vectors[1], dtype=float), noise)[[0, 2, 1, 3]]
+    return _joint_distribution(p1, p2)
+
+
+def initial_distribution(initial_actions, noise=0):
+    """
+    Returns the distribution of the state of the first turn of a match.
+
+    Parameters
+    ----------
+    initial_actions : tuple
+        The values of the initial actions of both players.
+    noise : float
+        The probability that a player's intended action should be flipped
+    """
+    p1, p2 = (_apply_noise(1.0 - action, noise) for action in initial_actions)
+    return _joint_distribution(p1, p2)
+
+
+def _geometric_sum(matrix, n):
+    """
+    Returns I + M + M ^ 2 + ... + M ^ (n - 1) using O(log(n)) matrix products.
+    """
+    total = np.zeros(matrix.shape)
+    power = np.eye(len(matrix))
+    for bit in bin(n)[2:]:
+        total = total + power @ total
+        power = power @ power
+        if bit == "1":
+            total = total + power
+            power = power @ matrix
+    return total
+
+
+def expected_state_counts(four_vectors, initial_actions, turns, noise=0, prob_end=0):
+    """
+    Returns the expected number of times each state occurs in a match between
+    two memory one players.
+
+    Parameters
+    ----------
+    four_vectors : tuple
+        A pair of arrays of length 4: the four-vectors of both players.
+    initial_actions : tuple
+        The values of the initial actions of both players.
+    turns : integer
+        The number of turns of the match (which can be infinite if prob_end
+        is positive)
+    noise : float
+        The probability that a player's intended action should be flipped
+    prob_end : float
+        The probability of a given turn ending a match
+
+    Returns
+    -------
+    numpy.ndarray
+        An array of length 4 indexed by state.
+    """
+    if turns == float("inf") and not prob_end:
+        raise ValueError("The expected state counts of an infinite match diverge.")
+
+    # A turn is reached with probability (1 - prob_end) after the previous one.
+    matrix = (1 - prob_end) * transition_matrix(four_vectors, noise)
+    initial = initial_distribution(initial_actions, noise)
+    if turns == float("inf"):
+        return np.linalg.solve((np.eye(4) - matrix).T, initial)
+    return initial @ _geometric_sum(matrix, int(turns))
+
+
+def expected_state_distribution(
+    four_vectors, initial_actions, turns, noise=0, prob_end=0
+):
+    """
+    Returns the expected normalised state distribution of a match between two
+    memory one players: the expected state counts divided by the expected
+    number of turns.
+
+    The parameters are those of expected_state_counts.
+    """
+    counts = expected_state_counts(
+        four_vectors, initial_actions, turns, noise=noise, prob_end=prob_end
+    )
+    return counts / counts.sum()
+
+
+def stationary_distribution(four_vectors, noise=0):
+    """
+    Returns the stationary distribution of the states of a match between two
+    memory one players: the long run frequency of each state.
+
+    Parameters
+    ----------
+    four_vectors : tuple
+        A pair of arrays of length 4: the four-vectors of both players.
+    noise : float
+        The probability that a player's intended action should be flipped
+
+    Raises
+    ------
+    ValueError
+        If the chain has more than one stationary distribution, in which case
+        the long run behaviour depends on the initial state. This can only
+        happen if the noise is 0 or 1.
+    """
+    matrix = transition_matrix(four_vectors, noise)
+    if np.linalg.matrix_rank(matrix - np.eye(4)) < 3:
+        raise ValueError(
+            "The match does not have a unique stationary distribution: use a "
+            "finite number of turns or add noise."
+        )
+    system = np.vstack((matrix.T - np.eye(4), np.ones(4)))
+    solution = np.linalg.lstsq(system, np.array([0, 0, 0, 0, 1]), rcond=None)[0]
+    return np.clip(solution, 0, 1)
+
+
+def distribution_to_counter(distribution):
+    """Converts an array indexed by state to a Counter with states as keys."""
+    return Counter(
+        {state: float(value) for state, value in zip(STATES, distribution) if value > 0}
+    )
+
+
+def expected_score_per_turn(distribution, game):
+    """
+    Returns the expected score per turn of both players given the distribution
+    of the states.
+    """
+    payoffs = np.array([game.score(state) for state in STATES])
+    return tuple(float(score) for score in distribution @ payoffs)
+
+
+def expected_cooperation(distribution):
+    """
+    Returns the expected cooperation rate of both players given the
+    distribution of the states.
+    """
+    return (
+        float(distribution[0] + distribution[1]),
+        float(distribution[0] + distribution[2]),
+    )
@@ -1,10 +1,18 @@
 import random
 from math import ceil, log
 
+import numpy as np
+
 import axelrod.interaction_utils as iu
+import axelrod.markov_chain as mc
 from axelrod import DEFAULT_TURNS
 from axelrod.action import Action
 from axelrod.game import Game
+from axelrod.random_ import random_mask
+from axelrod.strategies.finite_state_machines import (
+    is_deterministic_fsm_player,
+    play_fsm_match,
+)
 
 from .deterministic_cache import DeterministicCache
 
@@ -29,7 +37,9 @@ class Match(object):
         deterministic_cache=None,
         noise=0,
         match_attributes=None,
-        reset=True
+        reset=True,
+        detect_cycles=False,
+        noise_masks=None,
     ):
         """
         Parameters
@@ -52,6 +62,15 @@ class Match(object):
             but these can be overridden if desired.
         reset : bool
             Whether to reset players or not
+        detect_cycles : bool
+            Whether to stop stepping a deterministic match between players of
+            finite memory depth once the last plays repeat, and extrapolate
+            the remaining turns from the cycle found.
+        noise_masks : array
+            The flips of the actions of the two players to replay, of shape
+            (2, n) for n at least the number of turns played (for example the
+            noise_masks recorded by a previous play). By default the flips
+            are sampled with probability noise at the start of each play.
         """
 
         defaults = {
@@ -63,7 +82,14 @@ class Match(object):
         self.turns, self.prob_end = defaults[(turns is None, prob_end is None)]
 
         self.result = []
+        self._cycle = None
         self.noise = noise
+        self.noise_masks = None
+        if noise_masks is not None:
+            noise_masks = np.asarray(noise_masks, dtype=bool)
+            if noise_masks.ndim != 2 or len(noise_masks) != 2:
+                raise ValueError("noise_masks must be of shape (2, turns).")
+        self._replayed_masks = noise_masks
 
         if game is None:
             self.game = Game()
@@ -87,6 +113,7 @@ class Match(object):
 
         self.players = list(players)
         self.reset = reset
+        self.detect_cycles = detect_cycles
 
     @property
     def players(self):
@@ -107,7 +134,14 @@ class Match(object):
         A boolean to show whether a match between two players would be
         stochastic.
         """
-        return is_stochastic(self.players, self.noise)
+        return is_stochastic(self.players, self._noisy)
+
+    @property
+    def _noisy(self):
+        """
+        A boolean to show whether the actions of the players may be flipped.
+        """
+        return bool(self.noise) or self._replayed_masks is not None
 
     @property
     def _cache_update_required(self):
@@ -115,11 +149,84 @@ class Match(object):
         A boolean to show whether the deterministic cache should be updated.
         """
         return (
-            not self.noise
+            not self._noisy
             and self._cache.mutable
             and not (any(p.classifier["stochastic"] for p in self.players))
         )
 
+    def _fsm_fast_path_available(self, turns):
+        """
+        A boolean to show whether the match can be played on the transition
+        tables of two deterministic finite state machine players.
+        """
+        return (
+            not self._noisy
+            and turns != float("inf")
+            and all(is_deterministic_fsm_player(p) for p in self.players)
+            and all(len(p.history) == 0 for p in self.players)
+        )
+
+    def _cycle_detection_available(self, turns):
+        """
+        A boolean to show whether the match can be short-circuited once the
+        joint state of the last plays repeats.
+        """
+        return (
+            self.detect_cycles
+            and not self._stochastic
+            and turns != float("inf")
+            and all(
+                p.classifier["memory_depth"] < float("inf")
+                and "length" not in p.classifier["makes_use_of"]
+                for p in self.players
+            )
+        )
+
+    def _signature(self, depth):
+        """
+        Returns the joint state that determines the next plays of players
+        of memory depth at most depth: their last depth plays and coplays.
+        """
+        signature = []
+        for player in self.players:
+            start = len(player.history) - depth
+            signature.append(tuple(player.history[start:]))
+            signature.append(tuple(player.history.coplays[start:]))
+        return tuple(signature)
+
+    def _play_until_cycle(self, turns):
+        """
+        Plays the match turn by turn until the joint state of the last plays
+        repeats, then fills in the remaining turns from the cycle found.
+
+        The histories of the players are extended with the extrapolated turns
+        but the players are not stepped through them: any other attribute
+        is left as it was when the cycle was found.
+        """
+        player, opponent = self.players
+        depth = max(p.classifier["memory_depth"] for p in self.players)
+        result = []
+        seen = {}
+        while len(result) < turns:
+            result.append(player.play(opponent, self.noise))
+            if min(len(player.history), len(opponent.history)) < depth:
+                continue
+            signature = self._signature(depth)
+            if signature in seen:
+                start = seen[signature]
+                cycle = result[start:]
+                self._cycle = (start, len(cycle))
+                repeats, remainder = divmod(turns - len(result), len(cycle))
+                extrapolated = cycle * repeats + cycle[:remainder]
+                plays = [plays for plays, _ in extrapolated]
+                coplays = [coplays for _, coplays in extrapolated]
+                player.history.extend(plays, coplays)
+                opponent.history.extend(coplays, plays)
+                result.extend(extrapolated)
+                break
+            seen[signature] = len(result)
+        return result
+
     def _cached_enough_turns(self, cache_key, turns):
         """
         Returns true iff there are is a entry in self._cache for the given key and
@@ -129,6 +236,21 @@ class Match(object):
             return False
         return len(self._cache[cache_key]) >= turns
 
+    def _get_noise_masks(self, turns):
+        """
+        Returns the flips of the actions of the two players for each turn, as
+        an array of shape (2, turns): the replayed masks or a sample of them.
+        """
+        if self._replayed_masks is None:
+            return random_mask(self.noise, (2, turns))
+        if self._replayed_masks.shape[1] < turns:
+            raise ValueError(
+                "The noise masks have {} turns, {} are needed.".format(
+                    self._replayed_masks.shape[1], turns
+                )
+            )
+        return self._replayed_masks[:, :turns]
+
     def play(self):
         """
         The resulting list of actions from a match between two players.
@@ -137,6 +259,17 @@ class Match(object):
         the deterministic cache and returns it from there if so. If not, it
         calls the play method for player1 and returns the list from there.
 
+        Matches without noise between two deterministic finite state machine
+        players are played directly on the transition tables of the machines
+        (see axelrod.strategies.finite_state_machines.play_fsm_match).
+
+        If detect_cycles is True, deterministic matches between players of
+        finite memory depth are only played until the last plays repeat.
+
+        With noise, the flips of the actions of both players are sampled for
+        all the turns before the match is played and kept in noise_masks, so
+        that the match can be replayed (see the noise_masks parameter).
+
         Returns
         -------
         A list of the form:
@@ -149,16 +282,29 @@ class Match(object):
         """
         turns = min(sample_length(self.prob_end), self.turns)
         cache_key = (self.players[0], self.players[1])
+        self._cycle = None
+        self.noise_masks = None
 
         if self._stochastic or not self._cached_enough_turns(cache_key, turns):
             for p in self.players:
                 if self.reset:
                     p.reset()
                 p.set_match_attributes(**self.match_attributes)
-            result = []
-            for _ in range(turns):
-                plays = self.players[0].play(self.players[1], self.noise)
-                result.append(plays)
+            if self._fsm_fast_path_available(turns):
+                result = play_fsm_match(self.players[0], self.players[1], turns)
+            elif self._cycle_detection_available(turns):
+                result = self._play_until_cycle(turns)
+            elif self._noisy:
+                self.noise_masks = self._get_noise_masks(turns)
+                result = []
+                for flips in zip(*self.noise_masks.tolist()):
+                    plays = self.players[0].play(self.players[1], flips=flips)
+                    result.append(plays)
+            else:
+                result = []
+                for _ in range(turns):
+                    plays = self.players[0].play(self.players[1])
+                    result.append(plays)
 
             if self._cache_update_required:
                 self._cache[cache_key] = result
@@ -174,10 +320,16 @@ class Match(object):
 
     def final_score(self):
         """Returns the final score for a Match."""
+        if self._cycle is not None:
+            return iu.compute_final_score_of_cycle(
+                self.result, *self._cycle, game=self.game
+            )
         return iu.compute_final_score(self.result, self.game)
 
     def final_score_per_turn(self):
         """Returns the mean score per round for a Match."""
+        if self._cycle is not None:
+            return tuple(score / len(self.result) for score in self.final_score())
         return iu.compute_final_score_per_turn(self.result, self.game)
 
     def winner(self):
@@ -212,11 +364,75 @@ class Match(object):
     def sparklines(self, c_symbol="█", d_symbol=" "):
         return iu.compute_sparklines(self.result, c_symbol, d_symbol)
 
+    def _expected_distribution(self, stationary=False):
+        """
+        Returns the expected normalised state distribution as an array, computed
+        exactly from the Markov chain of a match between memory one players.
+        """
+        for player in self.players:
+            if not mc.is_memory_one_player(player):
+                raise ValueError(
+                    "{} is not a memory one player: the expected outcome of the "
+                    "match cannot be computed.".format(player)
+                )
+        four_vectors, initial_actions = zip(
+            *(mc.memory_one_parameters(player) for player in self.players)
+        )
+        if stationary:
+            return mc.stationary_distribution(four_vectors, self.noise)
+        return mc.expected_state_distribution(
+            four_vectors,
+            initial_actions,
+            self.turns,
+            noise=self.noise,
+            prob_end=self.prob_end,
+        )
+
+    def expected_normalised_state_distribution(self, stationary=False):
+        """
+        Returns the expected normalised count of each state, without playing
+        the match. Only available for matches between memory one players.
+
+        Parameters
+        ----------
+        stationary : bool
+            Whether to use the long run (stationary) distribution of the states
+            instead of the distribution over the turns of the match.
+        """
+        return mc.distribution_to_counter(self._expected_distribution(stationary))
+
+    def expected_final_score_per_turn(self, stationary=False):
+        """
+        Returns the expected mean score per round, without playing the match.
+        Only available for matches between memory one players.
+
+        Parameters
+        ----------
+        stationary : bool
+            Whether to use the long run (stationary) distribution of the states
+            instead of the distribution over the turns of the match.
+        """
+        distribution = self._expected_distribution(stationary)
+        return mc.expected_score_per_turn(distribution, self.game)
+
+    def expected_normalised_cooperation(self, stationary=False):
+        """
+        Returns the expected cooperation rate of each player, without playing
+        the match. Only available for matches between memory one players.
+
+        Parameters
+        ----------
+        stationary : bool
+            Whether to use the long run (stationary) distribution of the states
+            instead of the distribution over the turns of the match.
+        """
+        return mc.expected_cooperation(self._expected_distribution(stationary))
+
     def __len__(self):
         return self.turns
 
 
-def sample_length(prob_end):
+def sample_length(prob_end, x=None):
     """
     Sample length of a game.
 
@@ -244,10 +460,13 @@ def sample_length(prob_end):
 
     Note that this corresponds to sampling at the end of every turn whether
     or not the Match ends.
+
+    The random sample x is drawn from the random module unless it is given.
     """
     if prob_end == 0:
         return float("inf")
     if prob_end == 1:
         return 1
-    x = random.random()
+    if x is None:
+        x = random.random()
     return int(ceil(log(1 - x) / log(1 - prob_end)))
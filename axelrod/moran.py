@@ -2,27 +2,34 @@
 
 import random
 from collections import Counter
-from typing import Callable, List, Optional, Set, Tuple
+from typing import Callable, List, Optional, Sequence, Set, Tuple, Union
 
 import matplotlib.pyplot as plt
 import numpy as np
 from axelrod import EvolvablePlayer, DEFAULT_TURNS, Game, Player
 
+from . import markov_chain as mc
 from .deterministic_cache import DeterministicCache
 from .graph import Graph, complete_graph
-from .match import Match
+from .match import Match, is_stochastic
 from .random_ import randrange
 
 
 def fitness_proportionate_selection(
-    scores: List, fitness_transformation: Callable = None
+    scores: Union[Sequence, np.ndarray],
+    fitness_transformation: Callable = None,
+    exclude: int = None,
 ) -> int:
     """Randomly selects an individual proportionally to score.
 
+    The index is found by a binary search of the cumulative sums of the
+    fitnesses, so that individuals of fitness zero are never selected.
+
     Parameters
     ----------
     scores: Any sequence of real numbers
     fitness_transformation: A function mapping a score to a (non-negative) float
+    exclude: An index which must not be selected
 
     Returns
     -------
@@ -30,15 +37,21 @@ def fitness_proportionate_selection(
     element divided by the total.
     """
     if fitness_transformation is None:
-        csums = np.cumsum(scores)
+        fitnesses = np.array(scores, dtype=float)
     else:
-        csums = np.cumsum([fitness_transformation(s) for s in scores])
+        fitnesses = np.array([fitness_transformation(s) for s in scores], dtype=float)
+    if exclude is not None:
+        fitnesses[exclude] = 0
+    csums = np.cumsum(fitnesses)
     total = csums[-1]
     r = random.random() * total
-
-    for i, x in enumerate(csums):
-        if x >= r:
-            break
+    i = int(np.searchsorted(csums, r, side="right"))
+    if i == len(csums):
+        # Either r was rounded up to the total or all the fitnesses are zero.
+        if total > 0:
+            i = int(np.flatnonzero(fitnesses)[-1])
+        else:
+            i = 1 if exclude == 0 else 0
     return i
 
 
@@ -57,7 +70,8 @@ class MoranProcess(object):
         reproduction_graph: Graph = None,
         fitness_transformation: Callable = None,
         mutation_method="transition",
-        stop_on_fixation=True
+        stop_on_fixation=True,
+        incremental_scores: bool = False,
     ) -> None:
         """
         An agent based Moran process class. In each round, each player plays a
@@ -84,6 +98,14 @@ class MoranProcess(object):
         fitness, possibly mutated, and is cloned. The clone replaces a randomly
         chosen neighboring player according to the reproduction graph.
 
+        With incremental_scores, the scores of each pair of players are kept
+        in a table and only the matches of the player replaced in a round are
+        played again. The scores of a pair of deterministic players are
+        computed once for each pair of types (when there is no noise and the
+        matches have a fixed length). Note that with noise or stochastic
+        players this differs from playing every match again in every round:
+        the scores of the pairs that did not change are not sampled again.
+
         Parameters
         ----------
         players
@@ -115,12 +137,17 @@ class MoranProcess(object):
             or based on the player's mutation method, if present ("atomic").
         stop_on_fixation:
             A bool indicating if the process should stop on fixation
+        incremental_scores:
+            A bool indicating if only the matches of the replaced player
+            should be played in each round
         """
         self.turns = turns
         self.prob_end = prob_end
         self.game = game
         self.noise = noise
         self.initial_players = players  # save initial population
+        self.incremental_scores = incremental_scores
+        self._type_pair_scores = dict()  # type: dict
         self.players = []  # type: List
         self.populations = []  # type: List
         self.set_players()
@@ -172,6 +199,12 @@ class MoranProcess(object):
         # Map players to graph vertices
         self.locations = sorted(interaction_graph.vertices)
         self.index = dict(zip(sorted(interaction_graph.vertices), range(len(players))))
+        self._partners = self._interaction_partners()
+        # The vertices which may be replaced by the offspring of each vertex
+        self._reproduction_targets = {
+            vertex: sorted(reproduction_graph.out_vertices(vertex))
+            for vertex in self.locations
+        }
         self.fixated = self.fixation_check()
 
     def set_players(self) -> None:
@@ -181,6 +214,7 @@ class MoranProcess(object):
             player.reset()
             self.players.append(player)
         self.populations = [self.population_distribution()]
+        self._score_table = None  # type: Optional[np.ndarray]
 
     def mutate(self, index: int) -> Player:
         """Mutate the player at index.
@@ -230,7 +264,7 @@ class MoranProcess(object):
             # Select locally
             # index is not None in this case
             vertex = random.choice(
-                sorted(self.reproduction_graph.out_vertices(self.locations[index]))
+                self._reproduction_targets[self.locations[index]]
             )
             i = self.index[vertex]
         return i
@@ -245,21 +279,11 @@ class MoranProcess(object):
         """
         # Compute necessary fitnesses.
         scores = self.score_all()
-        if index is not None:
-            # Death has already occurred, so remove the dead player from the
-            # possible choices
-            scores.pop(index)
-            # Make sure to get the correct index post-pop
-            j = fitness_proportionate_selection(
-                scores, fitness_transformation=self.fitness_transformation
-            )
-            if j >= index:
-                j += 1
-        else:
-            j = fitness_proportionate_selection(
-                scores, fitness_transformation=self.fitness_transformation
-            )
-        return j
+        # If death has already occurred, the dead player is excluded from the
+        # possible choices.
+        return fitness_proportionate_selection(
+            scores, fitness_transformation=self.fitness_transformation, exclude=index
+        )
 
     def fixation_check(self) -> bool:
         """
@@ -304,9 +328,13 @@ class MoranProcess(object):
             # Death then birth
             i = self.death()
             self.players[i] = None
+            if self._score_table is not None:
+                self._update_score_table(i)
             j = self.birth(i)
         # Mutate and/or replace player i with clone of player j
         self.players[i] = self.mutate(j)
+        if self._score_table is not None:
+            self._update_score_table(i)
         # Record population.
         self.populations.append(self.population_distribution())
         return self
@@ -342,6 +370,103 @@ class MoranProcess(object):
                 indices.add((i, j))
         return indices
 
+    def _interaction_partners(self) -> List[List[int]]:
+        """
+        Returns the indices of the players each player plays against: its
+        neighbours in either direction on the interaction graph.
+        """
+        partners = [set() for _ in self.locations]  # type: List[Set[int]]
+        for source in self.locations:
+            i = self.index[source]
+            for target in self.interaction_graph.out_vertices(source):
+                j = self.index[target]
+                partners[i].add(j)
+                partners[j].add(i)
+        return [sorted(indices) for indices in partners]
+
+    def _pair_scores(self, i: int, j: int) -> Tuple[float, float]:
+        """
+        Returns the scores per turn of a match between the players at indices
+        i and j.
+        """
+        return self._match_scores(self.players[i], self.players[j])
+
+    def _match_scores(self, player1: Player, player2: Player) -> Tuple[float, float]:
+        """
+        Returns the scores per turn of a match between two players, reused for
+        each pair of types of deterministic players.
+        """
+        reusable = not self.prob_end and not is_stochastic(
+            (player1, player2), self.noise
+        )
+        key = (str(player1), str(player2))
+        if reusable and key in self._type_pair_scores:
+            return self._type_pair_scores[key]
+        match = Match(
+            (player1, player2),
+            turns=self.turns,
+            prob_end=self.prob_end,
+            noise=self.noise,
+            game=self.game,
+            deterministic_cache=self.deterministic_cache,
+        )
+        match.play()
+        match_scores = match.final_score_per_turn()
+        if reusable:
+            self._type_pair_scores[key] = match_scores
+        return match_scores
+
+    def _set_pair_scores(self, table: np.ndarray, i: int, j: int) -> None:
+        """Plays the match between players i and j into the score table."""
+        score1, score2 = self._pair_scores(i, j)
+        if i == j:
+            table[i, i] = score1 + score2
+        else:
+            table[i, j] = score1
+            table[j, i] = score2
+
+    def _fill_type_pair_scores(self) -> None:
+        """
+        Plays the matches between all the pairs of initial types of
+        deterministic players, so that their scores are reused by incremental
+        scoring.
+        """
+        representatives = dict()  # type: dict
+        for player in self.initial_players:
+            representatives.setdefault(str(player), player)
+        for player1 in representatives.values():
+            for player2 in representatives.values():
+                self._match_scores(player1.clone(), player2.clone())
+
+    def _build_score_table(self) -> np.ndarray:
+        """Fills in and returns the score table with the matches of all the
+        players."""
+        N = len(self.players)
+        table = np.zeros((N, N))
+        for i, partners in enumerate(self._partners):
+            if self.players[i] is None:
+                continue
+            for j in partners:
+                if j >= i and self.players[j] is not None:
+                    self._set_pair_scores(table, i, j)
+        self._score_table = table
+        return table
+
+    def _update_score_table(self, index: int) -> None:
+        """
+        Replaces the row and the column of the player at index in the score
+        table by its matches (or by zeros if the player is dead).
+        """
+        table = self._score_table
+        assert table is not None
+        table[index, :] = 0
+        table[:, index] = 0
+        if self.players[index] is None:
+            return
+        for j in self._partners[index]:
+            if self.players[j] is not None:
+                self._set_pair_scores(table, index, j)
+
     def score_all(self) -> List:
         """Plays the next round of the process. Every player is paired up
         against every other player and the total scores are recorded.
@@ -351,6 +476,13 @@ class MoranProcess(object):
         scores:
             List of scores for each player
         """
+        if self.incremental_scores:
+            table = self._score_table
+            if table is None:
+                table = self._build_score_table()
+            scores = table.sum(axis=1).tolist()
+            self.score_history.append(scores)
+            return scores
         N = len(self.players)
         scores = [0] * N
         for i, j in self._matchup_indices():
@@ -420,6 +552,20 @@ class MoranProcess(object):
                 break
         return self.populations
 
+    def fixate(self) -> Tuple[str, int]:
+        """
+        Plays the process out to completion.
+
+        Returns
+        -------
+        A tuple of the name of the type which fixated and the number of rounds
+        until fixation.
+        """
+        self.play()
+        winner = self.winning_strategy_name
+        assert winner is not None
+        return winner, len(self) - 1
+
     def __len__(self) -> int:
         """
         Returns
@@ -539,3 +685,339 @@ class ApproximateMoranProcess(MoranProcess):
         except KeyError:  # If players are stored in opposite order
             match_scores = self.cached_outcomes[player_names[::-1]].sample()
             return match_scores[::-1]
+
+
+def type_payoff_matrix(
+    players: List[Player],
+    turns: int = DEFAULT_TURNS,
+    prob_end: float = None,
+    noise: float = 0,
+    game: Game = None,
+    repetitions: int = 1,
+) -> np.ndarray:
+    """
+    Returns the mean score per turn of each type of player against each type.
+
+    Matches between deterministic players (without noise or a probabilistic
+    end) are played once. The expected scores of matches between memory one
+    players are computed exactly (see Match.expected_final_score_per_turn).
+    The other matches are played `repetitions` times.
+
+    Parameters
+    ----------
+    players:
+        One player of each type
+    turns:
+        The number of turns in each pairwise interaction
+    prob_end :
+        The probability of a given turn ending a match
+    noise:
+        The background noise, if any. Randomly flips plays with probability
+        `noise`.
+    game: axelrod.Game
+        The game object used to score matches.
+    repetitions:
+        The number of times the matches between stochastic players are played
+
+    Returns
+    -------
+    payoffs:
+        An array whose [a, b] entry is the mean score per turn of a player of
+        type a against a player of type b
+    """
+    size = len(players)
+    payoffs = np.zeros((size, size))
+    for a in range(size):
+        for b in range(a, size):
+            pair = (players[a].clone(), players[b].clone())
+            match = Match(pair, turns=turns, prob_end=prob_end, noise=noise, game=game)
+            if not prob_end and not is_stochastic(pair, noise):
+                match.play()
+                scores = np.array(match.final_score_per_turn())
+            elif all(mc.is_memory_one_player(player) for player in pair):
+                scores = np.array(match.expected_final_score_per_turn())
+            else:
+                scores = np.zeros(2)
+                for _ in range(repetitions):
+                    match.play()
+                    scores += match.final_score_per_turn()
+                scores /= repetitions
+            if a == b:
+                payoffs[a, a] = scores.mean()
+            else:
+                payoffs[a, b], payoffs[b, a] = scores
+    return payoffs
+
+
+class CountMoranProcess(object):
+    def __init__(
+        self,
+        payoffs: np.ndarray,
+        counts: Sequence[int],
+        names: List[str] = None,
+        mutation_rate: float = 0.0,
+        mode: str = "bd",
+        fitness_transformation: Callable = None,
+        stop_on_fixation: bool = True,
+    ) -> None:
+        """
+        A Moran process on a complete graph (without loops), in which the
+        population is described by the number of players of each type.
+
+        The fitness of a player is its total score per turn against all the
+        other players, computed from the mean scores of each type against each
+        type (see type_payoff_matrix and from_players) instead of playing
+        matches. The process is the same as a MoranProcess whose matches
+        always have these scores, but a round only costs a few operations on
+        arrays of one entry per type, so that large populations and many
+        fixations can be simulated.
+
+        When a player mutates it becomes a player of another type chosen at
+        random.
+
+        Parameters
+        ----------
+        payoffs:
+            The mean score per turn of a player of each type (row) against
+            a player of each type (column)
+        counts:
+            The initial number of players of each type
+        names:
+            The names of the types (by default their indices)
+        mutation_rate:
+            The rate of mutation. Replicating players are mutated with
+            probability `mutation_rate`
+        mode:
+            Birth-Death (bd) or Death-Birth (db)
+        fitness_transformation:
+            A function mapping a score to a (non-negative) float
+        stop_on_fixation:
+            A bool indicating if the process should stop on fixation
+        """
+        payoffs = np.array(payoffs, dtype=float)
+        initial_counts = np.array(counts, dtype=int)
+        size = len(initial_counts)
+        if initial_counts.ndim != 1 or payoffs.shape != (size, size):
+            raise ValueError(
+                "The payoffs must be a square array with one row per type."
+            )
+        if (initial_counts < 0).any() or initial_counts.sum() < 2:
+            raise ValueError("The population must have at least two players.")
+        if not 0 <= mutation_rate <= 1:
+            raise ValueError("The mutation rate must be between 0 and 1.")
+        mode = mode.lower()
+        if mode not in ["bd", "db"]:
+            raise ValueError("Invalid mode {}".format(mode))
+        if names is None:
+            names = [str(i) for i in range(size)]
+        self.payoffs = payoffs
+        self.initial_counts = initial_counts
+        self.names = list(names)
+        self.mutation_rate = mutation_rate
+        self.mode = mode
+        self.fitness_transformation = fitness_transformation
+        self.stop_on_fixation = stop_on_fixation
+        self.population_size = int(initial_counts.sum())
+        self.reset()
+
+    @classmethod
+    def from_players(
+        cls,
+        players: List[Player],
+        turns: int = DEFAULT_TURNS,
+        prob_end: float = None,
+        noise: float = 0,
+        game: Game = None,
+        repetitions: int = 1,
+        **kwargs
+    ):
+        """
+        Creates the process of a population of players, the payoffs being
+        computed by playing matches between their types (see
+        type_payoff_matrix).
+
+        The other keyword arguments are passed to CountMoranProcess.
+        """
+        representatives = dict()  # type: dict
+        for player in players:
+            representatives.setdefault(str(player), player)
+        names = sorted(representatives)
+        payoffs = type_payoff_matrix(
+            [representatives[name] for name in names],
+            turns=turns,
+            prob_end=prob_end,
+            noise=noise,
+            game=game,
+            repetitions=repetitions,
+        )
+        population = Counter(str(player) for player in players)
+        counts = [population[name] for name in names]
+        return cls(payoffs, counts, names=names, **kwargs)
+
+    def reset(self) -> None:
+        """Reset the process to its initial population."""
+        self.counts = self.initial_counts.copy()
+        self.populations = [self.population_distribution()]
+        self.winning_strategy_name = None  # type: Optional[str]
+        self.fixated = self.fixation_check()
+
+    def population_distribution(self) -> Counter:
+        """Returns the number of players of each type present."""
+        return Counter(
+            {name: int(count) for name, count in zip(self.names, self.counts) if count}
+        )
+
+    def fixation_check(self) -> bool:
+        """
+        Checks if the population is all of a single type
+
+        Returns
+        -------
+        Boolean:
+            True if fixation has occurred (population all of a single type)
+        """
+        self.fixated = np.count_nonzero(self.counts) == 1
+        if self.fixated:
+            self.winning_strategy_name = self.names[int(np.argmax(self.counts))]
+        return self.fixated
+
+    def fitness(self, counts: np.ndarray = None) -> np.ndarray:
+        """
+        Returns the fitness of a player of each type: its (transformed) total
+        score against all the other players of a population.
+
+        Parameters
+        ----------
+        counts:
+            The number of players of each type (by default the current
+            population)
+        """
+        if counts is None:
+            counts = self.counts
+        scores = self.payoffs.dot(counts) - np.diag(self.payoffs)
+        if self.fitness_transformation is not None:
+            scores = np.array([self.fitness_transformation(s) for s in scores])
+        return scores
+
+    def _birth_weights(self, counts: np.ndarray) -> np.ndarray:
+        """
+        Returns the weight of each type in the choice of the player which
+        reproduces among a population: the number of players of the type
+        times their fitness, or only the number of players of the type if the
+        fitness of all the players is zero.
+        """
+        weights = counts * self.fitness(counts)
+        if weights.sum() == 0:
+            return counts.astype(float)
+        return weights
+
+    def _offspring(self, parent: int) -> int:
+        """Returns the type of the offspring of a player of type parent."""
+        if self.mutation_rate > 0 and random.random() < self.mutation_rate:
+            other = randrange(0, len(self.counts) - 1)
+            return other if other < parent else other + 1
+        return parent
+
+    def __next__(self) -> object:
+        """
+        Iterate the population: choose a player proportionally to fitness to
+        reproduce and a player to be replaced, as in MoranProcess.
+
+        Returns
+        -------
+        CountMoranProcess:
+            Returns itself with a new population
+        """
+        if self.stop_on_fixation and self.fixation_check():
+            raise StopIteration
+        counts = self.counts
+        if self.mode == "bd":
+            parent = fitness_proportionate_selection(self._birth_weights(counts))
+            dead = fitness_proportionate_selection(counts)
+        else:
+            dead = fitness_proportionate_selection(counts)
+            survivors = counts.copy()
+            survivors[dead] -= 1
+            parent = fitness_proportionate_selection(self._birth_weights(survivors))
+        counts[dead] -= 1
+        counts[self._offspring(parent)] += 1
+        self.populations.append(self.population_distribution())
+        return self
+
+    def __iter__(self) -> object:
+        return self
+
+    def __len__(self) -> int:
+        """The number of populations."""
+        return len(self.populations)
+
+    def play(self) -> List[Counter]:
+        """
+        Play the process out to completion. If played with mutation this will
+        not terminate.
+
+        Returns
+        -------
+         populations:
+            Returns a list of all the populations
+        """
+        if not self.stop_on_fixation or self.mutation_rate != 0:
+            raise ValueError(
+                "CountMoranProcess.play() will never exit if mutation_rate is "
+                "nonzero or stop_on_fixation is False. Use iteration instead."
+            )
+        while True:
+            try:
+                self.__next__()
+            except StopIteration:
+                break
+        return self.populations
+
+    def _change_probabilities(self) -> np.ndarray:
+        """
+        Returns the probability that in the next round a player of each type
+        (column) is replaced by the offspring of a player of each other type
+        (row), without mutation.
+        """
+        counts = self.counts
+        death = counts / self.population_size
+        if self.mode == "bd":
+            weights = self._birth_weights(counts)
+            changes = np.outer(weights / weights.sum(), death)
+        else:
+            changes = np.zeros(self.payoffs.shape)
+            for dead in np.flatnonzero(counts):
+                survivors = counts.copy()
+                survivors[dead] -= 1
+                weights = self._birth_weights(survivors)
+                changes[:, dead] = death[dead] * weights / weights.sum()
+        np.fill_diagonal(changes, 0)
+        return changes
+
+    def fixate(self) -> Tuple[str, int]:
+        """
+        Plays the process from the current population until fixation, without
+        recording the populations.
+
+        The rounds in which a player is replaced by a player of the same type
+        are not played: their number is sampled at once before each change of
+        the population, which is much faster for large populations.
+
+        Returns
+        -------
+        A tuple of the name of the type which fixated and the number of rounds
+        until fixation (including the rounds in which nothing changed).
+        """
+        if self.mutation_rate != 0:
+            raise ValueError("A process with mutation never fixates.")
+        size = len(self.counts)
+        rounds = 0
+        while not self.fixation_check():
+            changes = self._change_probabilities()
+            rounds += int(np.random.geometric(changes.sum()))
+            parent, dead = divmod(fitness_proportionate_selection(changes.ravel()), size)
+            self.counts[dead] -= 1
+            self.counts[parent] += 1
+        winner = self.winning_strategy_name
+        assert winner is not None
+        return winner, rounds
@@ -48,10 +48,22 @@ def obey_axelrod(s):
     )
 
 
-def simultaneous_play(player, coplayer, noise=0):
-    """This pits two players against each other."""
+def simultaneous_play(player, coplayer, noise=0, flips=None):
+    """
+    This pits two players against each other.
+
+    If flips (a pair of booleans) is given, the actions of the players are
+    flipped as it says instead of being flipped at random with probability
+    noise.
+    """
     s1, s2 = player.strategy(coplayer), coplayer.strategy(player)
-    if noise:
+    if flips is not None:
+        flip, coflip = flips
+        if flip:
+            s1 = s1.flip()
+        if coflip:
+            s2 = s2.flip()
+    elif noise:
         s1 = random_flip(s1, noise)
         s2 = random_flip(s2, noise)
     player.update_history(s1, s2)
@@ -63,9 +75,14 @@ class Player(object):
     """A class for a player in the tournament.
 
     This is an abstract base class, not intended to be used directly.
+
+    The history of a player is an instance of its history_class attribute
+    (axelrod.History by default): setting it on an instance, for example to
+    axelrod.ArrayHistory, changes the history used from the next reset.
     """
 
     name = "Player"
+    history_class = History
     classifier = {}  # type: Dict[str, Any]
     default_classifier = {
         "stochastic": False,
@@ -104,7 +121,7 @@ class Player(object):
 
     def __init__(self):
         """Initiates an empty history."""
-        self._history = History()
+        self._history = self.history_class()
         self.classifier = copy.deepcopy(self.classifier)
         for dimension in self.default_classifier:
             if dimension not in self.classifier:
@@ -193,9 +210,9 @@ class Player(object):
         """This is a placeholder strategy."""
         raise NotImplementedError()
 
-    def play(self, opponent, noise=0):
+    def play(self, opponent, noise=0, flips=None):
         """This pits two players against each other."""
-        return simultaneous_play(self, opponent, noise)
+        return simultaneous_play(self, opponent, noise, flips)
 
     def clone(self):
         """Clones the player without history, reapplying configuration
@@ -208,6 +225,9 @@ class Player(object):
         cls = self.__class__
         new_player = cls(**self.init_kwargs)
         new_player.match_attributes = copy.copy(self.match_attributes)
+        if "history_class" in self.__dict__:
+            new_player.history_class = self.history_class
+            new_player._history = new_player.history_class()
         return new_player
 
     def reset(self):
@@ -1,4 +1,7 @@
 import random
+from itertools import chain
+from types import ModuleType
+from typing import Iterator, List, Tuple, Union
 
 import numpy as np
 from numpy.random import choice
@@ -8,10 +11,101 @@ from axelrod.action import Action
 C, D = Action.C, Action.D
 
 
+class RandomBuffer(object):
+    """
+    A source of uniform random numbers drawn in blocks from a numpy Generator.
+
+    The numbers of a block are handed out one at a time by a C level iterator
+    (random), which costs about as much as a call to random.random, or drawn
+    as whole arrays (random_array), for example the noise of all the turns of
+    a match, which is much faster than drawing them one by one.
+
+    Parameters
+    ----------
+    seed_ : int
+        The seed of the generator
+    block_size : int
+        The number of uniform random numbers drawn at once
+    """
+
+    def __init__(self, seed_: int = None, block_size: int = 2 ** 12) -> None:
+        self.block_size = block_size
+        self.seed(seed_)
+
+    def seed(self, seed_: int = None) -> None:
+        """Seeds the generator and discards the numbers already drawn."""
+        self.generator = np.random.default_rng(seed_)
+        self.random = chain.from_iterable(self._blocks()).__next__
+
+    def _blocks(self) -> Iterator[List[float]]:
+        while True:
+            yield self.generator.random(self.block_size).tolist()
+
+    def random_array(self, size: Union[int, Tuple[int, ...]]) -> np.ndarray:
+        """Returns an array of uniform random numbers in [0, 1)."""
+        return self.generator.random(size)
+
+
+# The source of the uniform random numbers of random_choice, random_flip and
+# random_mask: the random module or a RandomBuffer (see use_random_buffer).
+_source = random  # type: Union[RandomBuffer, ModuleType]
+
+
+def use_random_buffer(
+    seed_: int = None, block_size: int = 2 ** 12
+) -> Union[RandomBuffer, None]:
+    """
+    Makes random_choice, random_flip and random_mask draw their random numbers
+    from a RandomBuffer (and seed seed it). The numbers drawn for a given seed
+    differ from those drawn from the random module.
+
+    Parameters
+    ----------
+    seed_ : int
+        The seed of the buffer
+    block_size : int
+        The number of uniform random numbers drawn at once. If 0, the random
+        module is used again.
+
+    Returns
+    -------
+    The RandomBuffer used, or None.
+    """
+    global _source
+    if not block_size:
+        _source = random
+        return None
+    _source = RandomBuffer(seed_, block_size=block_size)
+    return _source
+
+
 def seed(seed_):
     """Sets a seed"""
     random.seed(seed_)
     np.random.seed(seed_)
+    if isinstance(_source, RandomBuffer):
+        _source.seed(seed_)
+
+
+def derive_seed(seed_: int, *keys: int) -> int:
+    """
+    Returns a seed derived from a root seed and a sequence of keys.
+
+    Distinct keys (for example the index pair and the repetition of a match)
+    give seeds of independent streams of random numbers.
+
+    Parameters
+    ----------
+    seed_ : int
+        The root seed
+    keys : int
+        Non negative integers
+
+    Returns
+    -------
+    int
+    """
+    return int(np.random.SeedSequence([seed_, *keys]).generate_state(1)[0])
 
 
 def random_choice(p: float = 0.5) -> Action:
@@ -35,7 +129,7 @@ def random_choice(p: float = 0.5) -> Action:
     if p == 1:
         return C
 
-    r = random.random()
+    r = _source.random()
     if r < p:
         return C
     return D
@@ -58,11 +152,42 @@ def random_flip(action: Action, threshold: float) -> Action:
     -------
     axelrod.Action
     """
-    if random_choice(threshold) == C:
+    if threshold == 0:
+        return action
+    if threshold == 1 or _source.random() < threshold:
         return action.flip()
     return action
 
 
+def random_mask(p: float, size: Union[int, Tuple[int, ...]]) -> np.ndarray:
+    """
+    Returns an array of booleans each True with probability `p`, drawn at
+    once: for example the flips of the actions of a match with noise.
+
+    No random sample is carried out if p is 0 or 1.
+
+    Parameters
+    ----------
+    p : float
+        The probability of each entry being True
+    size : int or tuple
+        The shape of the array
+
+    Returns
+    -------
+    numpy.ndarray
+    """
+    if p == 0:
+        return np.zeros(size, dtype=bool)
+    if p == 1:
+        return np.ones(size, dtype=bool)
+    if isinstance(_source, RandomBuffer):
+        uniforms = _source.random_array(size)
+    else:
+        uniforms = np.random.random(size)
+    return uniforms < p
+
+
 def randrange(a: int, b: int) -> int:
     """Python 2 / 3 compatible randrange. Returns a random integer uniformly
     between a and b (inclusive)"""
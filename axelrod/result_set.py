@@ -1,9 +1,11 @@
 from collections import Counter, namedtuple
 import csv
 import itertools
+import threading
 from multiprocessing import cpu_count
 
 import numpy as np
+import pandas as pd
 import tqdm
 from axelrod.action import Action
 
@@ -11,6 +13,15 @@ import dask as da
 import dask.dataframe as dd
 
 from . import eigen
+from .interaction_log import (
+    INDEX_COLUMNS,
+    RESULT_COLUMNS,
+    RESULT_POSITIONS,
+    STATE_COLUMNS,
+    STATE_TO_ACTION_COLUMNS,
+    is_interaction_log,
+    read_interaction_log,
+)
 
 C, D = Action.C, Action.D
 
@@ -34,18 +45,28 @@ def update_progress_bar(method):
 
 class ResultSet:
     """
-    A class to hold the results of a tournament. Reads in a CSV file produced
-    by the tournament class.
+    A class to hold the results of a tournament. Reads in a CSV file (or a
+    binary log of interactions) produced by the tournament class, or the
+    summaries of the interactions collected in memory by a ResultAccumulator,
+    or the running sums of a ResultAggregator.
     """
 
     def __init__(
-        self, filename, players, repetitions, processes=None, progress_bar=True
+        self,
+        filename,
+        players,
+        repetitions,
+        processes=None,
+        progress_bar=True,
+        dataframe=None,
+        aggregates=None,
     ):
         """
         Parameters
         ----------
             filename : string
-                the file from which to read the interactions
+                the file from which to read the interactions: either a CSV
+                file or a binary log (see axelrod.interaction_log)
             players : list
                 A list of the names of players. If not known will be efficiently
                 read from file.
@@ -56,6 +77,14 @@ class ResultSet:
                 The number of processes to be used for parallel processing
             progress_bar: boolean
                 If a progress bar will be shown.
+            dataframe : pandas.DataFrame
+                The summaries of the interactions (with the columns of the CSV
+                file, see ResultAccumulator.dataframe) to use instead of
+                reading them from filename.
+            aggregates : tuple
+                The sums and means of the interactions (in the form returned by
+                ResultSet._compute_tasks, see ResultAggregator.aggregates) to
+                use instead of reading the interactions from filename.
         """
         self.filename = filename
         self.players, self.repetitions = players, repetitions
@@ -64,13 +93,23 @@ class ResultSet:
         if progress_bar:
             self.progress_bar = tqdm.tqdm(total=25, desc="Analysing")
 
-        df = dd.read_csv(filename)
-        dask_tasks = self._build_tasks(df)
+        if aggregates is not None:
+            out = aggregates
+        else:
+            if dataframe is not None:
+                df = dd.from_pandas(dataframe, chunksize=10 ** 6)
+            elif is_interaction_log(filename):
+                df = dd.from_pandas(
+                    read_interaction_log(filename, actions=False), chunksize=10 ** 6
+                )
+            else:
+                df = dd.read_csv(filename, float_precision="round_trip")
+            dask_tasks = self._build_tasks(df)
 
-        if processes == 0:
-            processes = cpu_count()
+            if processes == 0:
+                processes = cpu_count()
 
-        out = self._compute_tasks(tasks=dask_tasks, processes=processes)
+            out = self._compute_tasks(tasks=dask_tasks, processes=processes)
 
         self._reshape_out(*out)
 
@@ -577,9 +616,7 @@ class ResultSet:
         columns = ["Win", "Score"]
         sum_per_player_repetition_task = adf.groupby(groups)[columns].sum()
 
-        groups = ["Player index", "Repetition"]
-        column = "Score per turn"
-        normalised_scores_task = adf.groupby(groups)[column].mean()
+        normalised_scores_task = _normalised_scores(mean_per_reps_player_opponent_task)
 
         groups = ["Player index"]
         column = "Initial cooperation"
@@ -741,6 +778,235 @@ class ResultSet:
                 writer.writerow(player)
 
 
+class ResultAccumulator(object):
+    """
+    Collects the summaries of the interactions of a tournament in memory, so
+    that a ResultSet can be built without writing the interactions to a file
+    and reading them back.
+
+    It takes the rows of the CSV file (see Tournament._write_interactions_to_file)
+    and keeps the columns used to build a ResultSet: the indices and the
+    results, but not the names of the players or their actions.
+    """
+
+    def __init__(self):
+        self.columns = [
+            (position, name) for position, (name, _) in enumerate(INDEX_COLUMNS)
+        ] + [(RESULT_POSITIONS[name], name) for name in RESULT_COLUMNS]
+        self._values = {name: [] for _, name in self.columns}
+
+    def writerow(self, row):
+        """Adds a row of interactions with their results."""
+        for position, name in self.columns:
+            self._values[name].append(row[position])
+
+    def __len__(self):
+        return len(self._values["Interaction index"])
+
+    def dataframe(self):
+        """
+        Returns the summaries of the interactions as a pandas.DataFrame with
+        the same columns (other than the names and actions) as the CSV file.
+        """
+        return pd.DataFrame(self._values, columns=[name for _, name in self.columns])
+
+
+class ResultAggregator(object):
+    """
+    Keeps running sums of the results of a tournament as the interactions are
+    played, so that a (partial) ResultSet can be obtained at any time with
+    snapshot, for example to follow the ranking of the players during a long
+    tournament and stop it early (see the stop parameter).
+
+    It takes the rows of the CSV file (see Tournament._write_interactions_to_file)
+    and only holds sums for each player, opponent and repetition: its memory
+    use does not depend on the number of turns. It can be passed to
+    Tournament.play, and a snapshot can be taken from another thread while the
+    tournament is played.
+    """
+
+    per_repetition_columns = ["Turns", "Score per turn", "Score difference per turn"]
+    per_pair_columns = (
+        ["Cooperation count"]
+        + STATE_COLUMNS
+        + STATE_TO_ACTION_COLUMNS
+        + ["Good partner"]
+    )
+
+    def __init__(self, players, repetitions, stop=None):
+        """
+        Parameters
+        ----------
+            players : list
+                A list of the names of players.
+            repetitions : int
+                The number of repetitions of each match.
+            stop : callable
+                A function of the aggregator called by the tournament after
+                the interactions of each chunk of matches are added. Once it
+                returns True, the tournament stops without playing the
+                remaining matches.
+        """
+        self.players = players
+        self.repetitions = repetitions
+        self.stop = stop
+        self.num_rows = 0
+        self._lock = threading.Lock()
+        # Maps (repetition, player, opponent) to the number of rows and the sums
+        # of the per_repetition_columns.
+        self._per_repetition = {}  # type: dict
+        # Maps (player, opponent) to the sums of the per_pair_columns.
+        self._per_pair = {}  # type: dict
+        # Maps (player, repetition) to the sums of the wins and scores, without
+        # self interactions.
+        self._per_player_repetition = {}  # type: dict
+        # Maps player to the number of initial cooperations and of
+        # interactions, without self interactions.
+        self._per_player = {}  # type: dict
+
+    @staticmethod
+    def _add(sums, key, values):
+        """
+        Adds values to the sums of a given key. As in pandas, floats are added
+        with compensated (Kahan) summation, so that the results are the same as
+        those of a ResultSet read from the interactions.
+        """
+        if key not in sums:
+            sums[key] = ([0] * len(values), [0.0] * len(values))
+        totals, compensations = sums[key]
+        for index, value in enumerate(values):
+            if isinstance(value, float):
+                y = value - compensations[index]
+                total = totals[index] + y
+                compensations[index] = total - totals[index] - y
+                totals[index] = total
+            else:
+                totals[index] += value
+
+    def writerow(self, row):
+        """Adds a row of interactions with their results."""
+        player, opponent, repetition = row[1], row[2], row[3]
+        with self._lock:
+            self.num_rows += 1
+            self._add(
+                self._per_repetition,
+                (repetition, player, opponent),
+                [1] + [row[RESULT_POSITIONS[c]] for c in self.per_repetition_columns],
+            )
+            self._add(
+                self._per_pair,
+                (player, opponent),
+                [int(row[RESULT_POSITIONS[c]]) for c in self.per_pair_columns],
+            )
+            if player != opponent:
+                self._add(
+                    self._per_player_repetition,
+                    (player, repetition),
+                    [row[RESULT_POSITIONS["Win"]], row[RESULT_POSITIONS["Score"]]],
+                )
+                self._add(
+                    self._per_player,
+                    player,
+                    [int(row[RESULT_POSITIONS["Initial cooperation"]]), 1],
+                )
+
+    def should_stop(self):
+        """Returns whether the tournament should stop (see stop)."""
+        return self.stop is not None and bool(self.stop(self))
+
+    def aggregates(self):
+        """
+        Returns the sums and means of the interactions added so far, in the
+        form used to build a ResultSet (see ResultSet._build_tasks).
+        """
+        with self._lock:
+            per_repetition, per_pair, per_player_repetition, per_player = (
+                {key: list(totals) for key, (totals, _) in sums.items()}
+                for sums in (
+                    self._per_repetition,
+                    self._per_pair,
+                    self._per_player_repetition,
+                    self._per_player,
+                )
+            )
+
+        def frame(sums, names, columns, values):
+            index = pd.MultiIndex.from_tuples(list(sums), names=names)
+            return pd.DataFrame(
+                [values(total) for total in sums.values()], index=index, columns=columns
+            )
+
+        mean_per_reps_player_opponent_df = frame(
+            per_repetition,
+            ["Repetition", "Player index", "Opponent index"],
+            self.per_repetition_columns,
+            lambda total: [value / total[0] for value in total[1:]],
+        ).sort_index()
+        sum_per_player_opponent_df = frame(
+            per_pair,
+            ["Player index", "Opponent index"],
+            self.per_pair_columns,
+            lambda total: total,
+        )
+        sum_per_player_repetition_df = frame(
+            per_player_repetition,
+            ["Player index", "Repetition"],
+            ["Win", "Score"],
+            lambda total: total,
+        )
+        players = pd.Index(list(per_player), name="Player index")
+        initial_cooperation_count_series = pd.Series(
+            [total[0] for total in per_player.values()], index=players, dtype=np.int64
+        )
+        interactions_count_series = pd.Series(
+            [total[1] for total in per_player.values()], index=players, dtype=np.int64
+        )
+        return (
+            mean_per_reps_player_opponent_df,
+            sum_per_player_opponent_df,
+            sum_per_player_repetition_df,
+            _normalised_scores(mean_per_reps_player_opponent_df),
+            initial_cooperation_count_series,
+            interactions_count_series,
+        )
+
+    def snapshot(self, progress_bar=False):
+        """
+        Returns the ResultSet of the interactions added so far. The entries of
+        the matches that have not been played yet are missing (or 0).
+
+        Parameters
+        ----------
+            progress_bar: boolean
+                If a progress bar will be shown.
+        """
+        return ResultSet(
+            None,
+            self.players,
+            self.repetitions,
+            progress_bar=progress_bar,
+            aggregates=self.aggregates(),
+        )
+
+
+def _normalised_scores(mean_per_reps_player_opponent):
+    """
+    Returns the mean score per turn of each player in each repetition, from
+    the means per repetition, player and opponent (sorted by their index), so
+    that it does not depend on the order in which the interactions were
+    written.
+
+    Parameters
+    ----------
+        mean_per_reps_player_opponent : pandas or dask DataFrame
+            The means of the score per turn indexed by repetition, player and
+            opponent.
+    """
+    means = mean_per_reps_player_opponent["Score per turn"].reset_index()
+    means = means[means["Player index"] != means["Opponent index"]]
+    return means.groupby(["Player index", "Repetition"])["Score per turn"].mean()
+
+
 def create_counter_dict(df, player_index, opponent_index, key_map):
     """
     Create a Counter object mapping states (corresponding to columns of df) for
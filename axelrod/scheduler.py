@@ -0,0 +1,294 @@
+"""
+Scheduling of the matches of a tournament across parallel workers.
+
+The matches of each pair of players (all their repetitions) make up a chunk of
+work (see MatchGenerator.build_match_chunks). Chunks can take very different
+times: a match between two long run time strategies can take orders of
+magnitude longer than one between Cooperator and Defector, leaving workers
+idle at the end of a tournament. The functions of this module estimate the
+cost of each chunk and turn the chunks into batches of roughly equal cost:
+
+    - expensive chunks are split across their repetitions,
+    - cheap chunks are grouped together to reduce the overhead of passing
+      them between processes,
+    - the batches are ordered from the most to the least expensive, so that
+      the workers taking them from a shared queue finish at about the same
+      time.
+
+The cost of a strategy can also be measured with profile_strategies, which
+times the strategy method of each strategy against a few reference opponents.
+The resulting profile (seconds per turn for each strategy) can be written to
+and read from a CSV file and used to estimate the run time of a tournament.
+"""
+import csv
+import statistics
+import time
+from math import ceil
+from typing import Dict, List, Tuple
+
+from axelrod import DEFAULT_TURNS
+from axelrod.player import Player, simultaneous_play
+from axelrod.strategies import Cooperator, Defector, Random, TitForTat
+
+# The cost of a turn of a long run time strategy relative to that of any other
+# strategy.
+LONG_RUN_TIME_COST = 100
+
+# The opponents against which strategies are profiled.
+REFERENCE_OPPONENTS = [Cooperator, Defector, Random, TitForTat]
+
+# The key of a profile giving the time of a turn spent outside of the strategy
+# methods of the players (updating the histories, etc.).
+TURN_OVERHEAD = "Turn overhead"
+
+Chunk = Tuple[Tuple[int, int], dict, int]
+
+
+def player_cost(player: Player, profile: Dict = None) -> float:
+    """
+    Returns the estimated cost of a turn of a player.
+
+    Without a profile this is a relative cost. With a profile (see
+    profile_strategies) it is the time in seconds of a turn of the strategy,
+    and strategies missing from the profile are estimated from the median time
+    of the profiled ones.
+    """
+    relative_cost = 1
+    if player.classifier.get("long_run_time", False):
+        relative_cost = LONG_RUN_TIME_COST
+    if not profile:
+        return relative_cost
+    if player.name in profile:
+        return profile[player.name]
+    times = [seconds for name, seconds in profile.items() if name != TURN_OVERHEAD]
+    if not times:
+        return 0
+    return statistics.median(times) * relative_cost
+
+
+def expected_length(match_params: dict) -> float:
+    """Returns the expected number of turns of a match."""
+    lengths = []
+    turns = match_params.get("turns")
+    if turns is not None and turns != float("inf"):
+        lengths.append(turns)
+    prob_end = match_params.get("prob_end")
+    if prob_end:
+        lengths.append(1 / prob_end)
+    if not lengths:
+        return DEFAULT_TURNS
+    return min(lengths)
+
+
+def estimate_costs(
+    chunks: List[Chunk],
+    players: List[Player],
+    timings: Dict = None,
+    profile: Dict = None,
+) -> List[float]:
+    """
+    Returns the estimated cost of a repetition of the match of each chunk.
+
+    Without timings, the cost is the expected length of the match times the
+    sum of the costs of the players (and, with a profile, of the overhead of a
+    turn). Pairs of players for which a time is known are given that time and
+    the other estimates are scaled to seconds from the ratio of the known
+    times to their estimates.
+
+    Parameters
+    ----------
+    chunks : list
+        Tuples of the form (index pair, match parameters, repetitions)
+    players : list
+        The players of the tournament
+    timings : dict
+        Maps index pairs to the observed time (in seconds) of a repetition of
+        their match
+    profile : dict
+        Maps strategy names to the time (in seconds) of a turn of the strategy
+    """
+    if timings is None:
+        timings = {}
+    overhead = profile.get(TURN_OVERHEAD, 0) if profile else 0
+    estimates = [
+        expected_length(match_params)
+        * (overhead + sum(player_cost(players[index], profile) for index in index_pair))
+        for index_pair, match_params, _ in chunks
+    ]
+    observed = [
+        (timings[index_pair], estimate)
+        for (index_pair, _, _), estimate in zip(chunks, estimates)
+        if index_pair in timings
+    ]
+    if not observed:
+        return estimates
+    scale = sum(seconds for seconds, _ in observed) / sum(
+        estimate for _, estimate in observed
+    )
+    return [
+        timings.get(index_pair, estimate * scale)
+        for (index_pair, _, _), estimate in zip(chunks, estimates)
+    ]
+
+
+def schedule_chunks(
+    chunks: List[Chunk],
+    players: List[Player],
+    workers: int,
+    timings: Dict = None,
+    batches_per_worker: int = 8,
+    profile: Dict = None,
+) -> List[List[Chunk]]:
+    """
+    Splits and groups chunks into batches of roughly equal estimated cost,
+    ordered from the most to the least expensive.
+
+    Parameters
+    ----------
+    chunks : list
+        Tuples of the form (index pair, match parameters, repetitions)
+    players : list
+        The players of the tournament
+    workers : int
+        The number of workers playing the batches
+    timings : dict
+        Maps index pairs to the observed time (in seconds) of a repetition of
+        their match
+    batches_per_worker : int
+        The number of batches aimed for per worker: more batches balance the
+        work better but cost more to pass between processes
+    profile : dict
+        Maps strategy names to the time (in seconds) of a turn of the strategy
+
+    Returns
+    -------
+    A list of batches, each a list of chunks. A chunk of many repetitions may
+    be split into several chunks of the same pair of players and fewer
+    repetitions. The match parameters of each of them give the number of
+    its first repetition under the key "first_repetition".
+    """
+    chunks = list(chunks)
+    costs = estimate_costs(chunks, players, timings, profile)
+    total = sum(cost * repetitions for cost, (_, _, repetitions) in zip(costs, chunks))
+    target = total / max(1, workers * batches_per_worker)
+
+    pieces = []
+    for cost, (index_pair, match_params, repetitions) in zip(costs, chunks):
+        if target > 0 and cost * repetitions > target and repetitions > 1:
+            splits = min(repetitions, int(ceil(cost * repetitions / target)))
+        else:
+            splits = 1
+        first_repetition = match_params.get("first_repetition", 0)
+        for split in range(splits):
+            piece_repetitions = repetitions // splits + (split < repetitions % splits)
+            piece_params = dict(match_params)
+            piece_params["first_repetition"] = first_repetition
+            first_repetition += piece_repetitions
+            piece = (index_pair, piece_params, piece_repetitions)
+            pieces.append((cost * piece_repetitions, piece))
+    pieces.sort(key=lambda piece: piece[0], reverse=True)
+
+    batches = []
+    batch = []  # type: List[Chunk]
+    batch_cost = 0
+    for cost, piece in pieces:
+        batch.append(piece)
+        batch_cost += cost
+        if batch_cost >= target:
+            batches.append((batch_cost, batch))
+            batch, batch_cost = [], 0
+    if batch:
+        batches.append((batch_cost, batch))
+    batches.sort(key=lambda batch: batch[0], reverse=True)
+    return [batch for _, batch in batches]
+
+
+def _timed_strategy(player: Player, elapsed: List[float]):
+    """
+    Replaces the strategy method of a player by one adding the time it takes
+    to elapsed[0].
+    """
+    strategy = player.strategy
+
+    def timed_strategy(opponent):
+        start = time.perf_counter()
+        action = strategy(opponent)
+        elapsed[0] += time.perf_counter() - start
+        return action
+
+    player.strategy = timed_strategy
+
+
+def profile_strategies(
+    strategies: List, turns: int = 100, repetitions: int = 1, opponents: List = None
+) -> Dict[str, float]:
+    """
+    Measures the time of a turn of each strategy.
+
+    Each strategy plays matches against each of the opponents and the time
+    spent in its strategy method is averaged over all the turns played. The
+    matches are played turn by turn (without the shortcuts that Match can
+    take for some players) so that the strategy method is called every turn.
+
+    Parameters
+    ----------
+    strategies : list
+        The strategy classes to profile
+    turns : int
+        The number of turns of each match
+    repetitions : int
+        The number of matches against each opponent
+    opponents : list
+        The classes of the opponents (by default REFERENCE_OPPONENTS)
+
+    Returns
+    -------
+    A dictionary mapping the name of each strategy to the time (in seconds) of
+    a turn of the strategy, along with the time of a turn spent outside of the
+    strategy methods of the players under the key TURN_OVERHEAD.
+    """
+    if opponents is None:
+        opponents = REFERENCE_OPPONENTS
+    profile = {}
+    overhead = 0.0
+    matches = 0
+    for strategy in strategies:
+        elapsed = [0.0]
+        for opponent_class in opponents:
+            for _ in range(repetitions):
+                player, opponent = strategy(), opponent_class()
+                for p in (player, opponent):
+                    p.set_match_attributes(length=turns)
+                opponent_elapsed = [0.0]
+                _timed_strategy(player, elapsed)
+                _timed_strategy(opponent, opponent_elapsed)
+                before = elapsed[0]
+                start = time.perf_counter()
+                for _ in range(turns):
+                    simultaneous_play(player, opponent)
+                total = time.perf_counter() - start
+                overhead += total - (elapsed[0] - before) - opponent_elapsed[0]
+                matches += 1
+        profile[strategy.name] = elapsed[0] / (turns * repetitions * len(opponents))
+    if matches:
+        profile[TURN_OVERHEAD] = max(0.0, overhead / (turns * matches))
+    return profile
+
+
+def write_profile(profile: Dict[str, float], filename: str) -> None:
+    """Writes a profile (see profile_strategies) to a CSV file."""
+    with open(filename, "w", newline="") as file_obj:
+        writer = csv.writer(file_obj)
+        writer.writerow(["Name", "Seconds per turn"])
+        for name, seconds in sorted(profile.items()):
+            writer.writerow([name, repr(seconds)])
+
+
+def read_profile(filename: str) -> Dict[str, float]:
+    """Reads a profile (see profile_strategies) from a CSV file."""
+    with open(filename, newline="") as file_obj:
+        reader = csv.reader(file_obj)
+        header = next(reader, None)
+        if header != ["Name", "Seconds per turn"]:
+            raise ValueError("{} is not a strategy profile.".format(filename))
+        return {name: float(seconds) for name, seconds in reader}
@@ -213,7 +213,7 @@ from .titfortat import (
     SneakyTitForTat,
     SpitefulTitForTat,
     SuspiciousTitForTat,
-    TitFor3Tats,
+    TitFor2Tats,
     TitForTat,
     TwoTitsForTat,
 )
@@ -428,7 +428,7 @@ all_strategies = [
     Thumper,
     FirstByTidemanAndChieruzzi,
     TitForTat,
-    TitFor3Tats,
+    TitFor2Tats,
     SecondByTranquilizer,
     TrickyCooperator,
     TrickyDefector,
@@ -105,9 +105,9 @@ class APavlov2011(Player):
             # Classify opponent
             if opponent.history[-6:] == [C] * 6:
                 self.opponent_class = "Cooperative"
-            if opponent.history[-6:].count(D) >= 4:
+            if opponent.history.count(D, -6) >= 4:
                 self.opponent_class = "ALLD"
-            if opponent.history[-6:].count(D) == 3:
+            if opponent.history.count(D, -6) == 3:
                 self.opponent_class = "STFT"
             if not self.opponent_class:
                 self.opponent_class = "Random"
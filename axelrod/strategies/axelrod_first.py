@@ -758,7 +758,7 @@ class FirstByTullock(Player):
         if len(self.history) < self._rounds_to_cooperate:
             return C
         rounds = self._rounds_to_cooperate - 1
-        cooperate_count = opponent.history[-rounds:].count(C)
+        cooperate_count = opponent.history.count(C, -rounds)
         prop_cooperate = cooperate_count / rounds
         prob_cooperate = max(0, prop_cooperate - 0.10)
         return random_choice(prob_cooperate)
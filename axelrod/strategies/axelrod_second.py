@@ -470,7 +470,7 @@ class SecondByGrofman(Player):
             # Note: the Fortran code behavior ignores the opponent behavior
             #   in the last round and instead looks at the first 7 of the last
             #   8 rounds.
-            opponent_defections_last_8_rounds = opponent.history[-8:-1].count(D)
+            opponent_defections_last_8_rounds = opponent.history.count(D, -8, -1)
             if self.history[-1] == C and opponent_defections_last_8_rounds <= 2:
                 return C
             if self.history[-1] == D and opponent_defections_last_8_rounds <= 1:
@@ -1,6 +1,7 @@
 import itertools
 from random import randrange
 from typing import Any, List, Sequence, Tuple, Union
+import numpy as np
 import numpy.random as random
 from numpy.random import choice
 from axelrod.action import Action
@@ -91,6 +92,32 @@ class SimpleFSM(object):
         """Return the number of states of the machine."""
         return len(set(state for state, action in self._state_transitions))
 
+    def transition_table(self) -> Tuple[list, np.ndarray, np.ndarray]:
+        """Returns the transitions of the machine as integer arrays.
+
+        States are relabelled by their index in the sorted list of states and
+        actions by their value (C = 0, D = 1).
+
+        Returns
+        -------
+        states : list
+            The sorted states of the machine.
+        next_states : numpy.ndarray
+            An array of shape (number of states, 2): the entry [i, a] is the
+            index of the next state from state i when the opponent played a.
+        next_actions : numpy.ndarray
+            An array of shape (number of states, 2): the entry [i, a] is the
+            value of the action played from state i when the opponent played a.
+        """
+        states = sorted(set(state for state, action in self._state_transitions))
+        index = {state: i for i, state in enumerate(states)}
+        next_states = np.zeros((len(states), 2), dtype=int)
+        next_actions = np.zeros((len(states), 2), dtype=int)
+        for (state, action), (next_state, next_action) in self._state_transitions.items():
+            next_states[index[state], action.value] = index[next_state]
+            next_actions[index[state], action.value] = next_action.value
+        return states, next_states, next_actions
+
 
 class FSMPlayer(Player):
     """Abstract base class for finite state machine players."""
@@ -125,6 +152,86 @@ class FSMPlayer(Player):
             return self.fsm.move(opponent.history[-1])
 
 
+def is_deterministic_fsm_player(player: Player) -> bool:
+    """Returns True if the play of a player is fully described by its finite
+    state machine and its initial action.
+
+    Subclasses of FSMPlayer that override the strategy method (for example
+    after a strategy transformer has been applied) are excluded."""
+    return (
+        isinstance(player, FSMPlayer)
+        and type(player).strategy is FSMPlayer.strategy
+        and not player.classifier["stochastic"]
+    )
+
+
+def play_fsm_match(player: FSMPlayer, opponent: FSMPlayer, turns: int) -> List[Tuple[Action, Action]]:
+    """Plays a match between two deterministic FSM players that have not played
+    yet, using the integer transition tables of their machines.
+
+    The pair of states of the machines and the last actions of both players
+    determine the rest of the match: once such a joint state repeats, the
+    match has entered a cycle and the remaining turns are filled in without
+    any further stepping.
+
+    The histories and the states of the machines of both players are updated
+    as if the match had been played turn by turn.
+
+    Parameters
+    ----------
+    player, opponent : FSMPlayer
+        Two players for which is_deterministic_fsm_player is True and with
+        an empty history.
+    turns : int
+        The number of turns of the match.
+
+    Returns
+    -------
+    list
+        The interactions of the match: a list of pairs of actions.
+    """
+    states1, next_states1, next_actions1 = player.fsm.transition_table()
+    states2, next_states2, next_actions2 = opponent.fsm.transition_table()
+    next_states1, next_actions1 = next_states1.tolist(), next_actions1.tolist()
+    next_states2, next_actions2 = next_states2.tolist(), next_actions2.tolist()
+
+    # The machines do not move on the first turn.
+    state1 = states1.index(player.fsm.state)
+    state2 = states2.index(opponent.fsm.state)
+    action1, action2 = player.initial_action.value, opponent.initial_action.value
+
+    joint_states = []  # type: List[Tuple[int, int, int, int]]
+    seen = {}
+    while len(joint_states) < turns:
+        joint_state = (state1, state2, action1, action2)
+        if joint_state in seen:
+            break
+        seen[joint_state] = len(joint_states)
+        joint_states.append(joint_state)
+        state1, action1, state2, action2 = (
+            next_states1[state1][action2],
+            next_actions1[state1][action2],
+            next_states2[state2][action1],
+            next_actions2[state2][action1],
+        )
+
+    if len(joint_states) < turns:
+        start = seen[joint_state]
+        cycle = joint_states[start:]
+        repeats, remainder = divmod(turns - len(joint_states), len(cycle))
+        joint_states.extend(cycle * repeats + cycle[:remainder])
+
+    plays = [actions[joint_state[2]] for joint_state in joint_states]
+    coplays = [actions[joint_state[3]] for joint_state in joint_states]
+    if joint_states:
+        final_state1, final_state2 = joint_states[-1][:2]
+        player.fsm.state = states1[final_state1]
+        opponent.fsm.state = states2[final_state2]
+    player.history.extend(plays, coplays)
+    opponent.history.extend(coplays, plays)
+    return list(zip(plays, coplays))
+
+
 class EvolvableFSMPlayer(FSMPlayer, EvolvablePlayer):
     """Abstract base class for evolvable finite state machine players."""
 
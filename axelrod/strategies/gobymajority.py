@@ -78,9 +78,8 @@ class GoByMajority(Player):
         defections than cooperations in memory the player defects.
         """
 
-        history = opponent.history[-self.memory :]
-        defections = sum([s == D for s in history])
-        cooperations = sum([s == C for s in history])
+        defections = opponent.history.count(D, -self.memory)
+        cooperations = opponent.history.count(C, -self.memory)
         if defections > cooperations:
             return D
         if defections == cooperations:
@@ -189,15 +189,15 @@ class MathConstantHunter(Player):
             start1, end1 = 0, n // 2
             start2, end2 = n // 4, 3 * n // 4
             start3, end3 = n // 2, n
-            count1 = opponent.history[start1:end1].count(C) + self.history[
-                start1:end1
-            ].count(C)
-            count2 = opponent.history[start2:end2].count(C) + self.history[
-                start2:end2
-            ].count(C)
-            count3 = opponent.history[start3:end3].count(C) + self.history[
-                start3:end3
-            ].count(C)
+            count1 = opponent.history.count(C, start1, end1) + self.history.count(
+                C, start1, end1
+            )
+            count2 = opponent.history.count(C, start2, end2) + self.history.count(
+                C, start2, end2
+            )
+            count3 = opponent.history.count(C, start3, end3) + self.history.count(
+                C, start3, end3
+            )
             ratio1 = 0.5 * count1 / (end1 - start1)
             ratio2 = 0.5 * count2 / (end2 - start2)
             ratio3 = 0.5 * count3 / (end3 - start3)
@@ -67,6 +67,10 @@ class LookupTable(object):
          Plays(self_plays=(), op_plays=(D), op_openings=(D)): C,}
 
     and then returns a LookupTable with that dictionary.
+
+    The values are also held in a flat list, in the order of the keys given by
+    create_lookup_table_keys, so that they can be looked up by the index of
+    their key (see LookupTable.key_index and LookupTable.get_by_index).
     """
 
     def __init__(self, lookup_dict: dict) -> None:
@@ -80,6 +84,10 @@ class LookupTable(object):
             self._plays_depth, self._op_plays_depth, self._op_openings_depth
         )
         self._raise_error_for_bad_lookup_dict()
+        keys = create_lookup_table_keys(
+            self._plays_depth, self._op_plays_depth, self._op_openings_depth
+        )
+        self._flat_table = [self._dict[key] for key in keys]
 
     def _raise_error_for_bad_lookup_dict(self):
         if any(
@@ -121,6 +129,21 @@ class LookupTable(object):
             Plays(self_plays=plays, op_plays=op_plays, op_openings=op_openings)
         ]
 
+    def key_index(self, plays: tuple, op_plays: tuple, op_openings: tuple) -> int:
+        """
+        Returns the index of a key in the keys given by
+        create_lookup_table_keys: the binary number (C = 0, D = 1) obtained by
+        concatenating plays, op_plays and op_openings.
+        """
+        index = 0
+        for action in plays + op_plays + op_openings:
+            index = 2 * index + action.value
+        return index
+
+    def get_by_index(self, index: int) -> Any:
+        """Returns the value for the key of a given index (see key_index)."""
+        return self._flat_table[index]
+
     @property
     def player_depth(self) -> int:
         return self._plays_depth
@@ -329,6 +352,12 @@ class LookerUp(Player):
         self._set_memory_depth()
         self.initial_actions = self._get_initial_actions(initial_actions)
         self._initial_actions_pool = list(self.initial_actions)
+        # Integer indices (C = 0, D = 1) of the recent plays and of the opening
+        # plays of the opponent, updated in _update_plays_indices.
+        self._indexed_turns = 0
+        self._plays_index = 0
+        self._op_plays_index = 0
+        self._op_openings_index = 0
 
     @classmethod
     def _get_lookup_table(
@@ -361,24 +390,53 @@ class LookerUp(Player):
             return initial_actions + tuple([C] * initial_actions_shortfall)
         return initial_actions[:table_depth]
 
+    def _update_plays_indices(self, opponent: Player) -> None:
+        """
+        Updates the indices of the last plays of both players and of the
+        opening plays of the opponent.
+
+        When a single turn has been played since the last update, this only
+        shifts the last plays into the indices. Otherwise (for example if the
+        history was altered, or is a LimitedHistory that no longer grows) the
+        indices are recomputed from the histories.
+        """
+        turns = len(self.history)
+        player_depth = self._lookup.player_depth
+        op_depth = self._lookup.op_depth
+        op_openings_depth = self._lookup.op_openings_depth
+        if turns == self._indexed_turns + 1 and len(opponent.history) == turns:
+            play, op_play = self.history[-1].value, opponent.history[-1].value
+            self._plays_index = ((self._plays_index << 1) | play) & (
+                (1 << player_depth) - 1
+            )
+            self._op_plays_index = ((self._op_plays_index << 1) | op_play) & (
+                (1 << op_depth) - 1
+            )
+            if turns <= op_openings_depth:
+                self._op_openings_index = (self._op_openings_index << 1) | op_play
+        else:
+            self._plays_index = self._lookup.key_index(
+                get_last_n_plays(player=self, depth=player_depth), (), ()
+            )
+            self._op_plays_index = self._lookup.key_index(
+                get_last_n_plays(player=opponent, depth=op_depth), (), ()
+            )
+            self._op_openings_index = self._lookup.key_index(
+                tuple(opponent.history[:op_openings_depth]), (), ()
+            )
+        self._indexed_turns = turns
+
     def strategy(self, opponent: Player) -> Reaction:
+        self._update_plays_indices(opponent)
         turn_index = len(opponent.history)
         while turn_index < len(self._initial_actions_pool):
             return self._initial_actions_pool[turn_index]
 
-        player_last_n_plays = get_last_n_plays(
-            player=self, depth=self._lookup.player_depth
-        )
-        opponent_last_n_plays = get_last_n_plays(
-            player=opponent, depth=self._lookup.op_depth
-        )
-        opponent_initial_plays = tuple(
-            opponent.history[: self._lookup.op_openings_depth]
-        )
-
-        return self._lookup.get(
-            player_last_n_plays, opponent_last_n_plays, opponent_initial_plays
-        )
+        op_depth = self._lookup.op_depth
+        op_openings_depth = self._lookup.op_openings_depth
+        index = (self._plays_index << op_depth) | self._op_plays_index
+        index = (index << op_openings_depth) | self._op_openings_index
+        return self._lookup.get_by_index(index)
 
     @property
     def lookup_dict(self):
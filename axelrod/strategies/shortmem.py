@@ -36,9 +36,8 @@ class ShortMem(Player):
         if len(opponent.history) <= 10:
             return C
 
-        array = opponent.history[-10:]
-        C_counts = array.count(C)
-        D_counts = array.count(D)
+        C_counts = opponent.history.count(C, -10)
+        D_counts = opponent.history.count(D, -10)
 
         if C_counts - D_counts >= 3:
             return C
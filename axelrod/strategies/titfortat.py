@@ -47,7 +47,7 @@ class TitForTat(Player):
         return C
 
 
-class TitFor3Tats(Player):
+class TitFor2Tats(Player):
     """A player starts by cooperating and then defects only after two defects by
     opponent.
 
@@ -744,7 +744,7 @@ class NTitsForMTats(Player):
 
     def strategy(self, opponent: Player) -> Action:
         # if opponent defected consecutively M times, start the retaliation
-        if not self.M or opponent.history[-self.M :].count(D) == self.M:
+        if not self.M or opponent.history.count(D, -self.M) == self.M:
             self.retaliate_count = self.N
         if self.retaliate_count:
             self.retaliate_count -= 1
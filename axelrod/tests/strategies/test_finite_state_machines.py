@@ -5,7 +5,13 @@ import unittest
 import axelrod
 from axelrod.compute_finite_state_machine_memory import get_memory_from_transitions
 from axelrod.evolvable_player import InsufficientParametersError
-from axelrod.strategies.finite_state_machines import EvolvableFSMPlayer, FSMPlayer, SimpleFSM
+from axelrod.strategies.finite_state_machines import (
+    EvolvableFSMPlayer,
+    FSMPlayer,
+    SimpleFSM,
+    is_deterministic_fsm_player,
+    play_fsm_match,
+)
 
 from .test_player import TestPlayer
 from .test_evolvable_player import PartialClass, TestEvolvablePlayer
@@ -89,6 +95,69 @@ class TestSimpleFSM(unittest.TestCase):
         error_msg = cm.exception.args[0]
         self.assertEqual(error_msg, "state: 5 does not have values for both C and D")
 
+    def test_transition_table(self):
+        states, next_states, next_actions = self.two_state.transition_table()
+        self.assertEqual(states, [0, 1])
+        self.assertEqual(next_states.tolist(), [[1, 1], [0, 0]])
+        self.assertEqual(next_actions.tolist(), [[1, 0], [0, 1]])
+
+    def test_transition_table_agrees_with_move(self):
+        fsm = axelrod.EvolvedFSM16().fsm
+        states, next_states, next_actions = fsm.transition_table()
+        for state in states:
+            for action in (C, D):
+                fsm.state = state
+                next_action = fsm.move(action)
+                i = states.index(state)
+                self.assertEqual(states[next_states[i, action.value]], fsm.state)
+                self.assertEqual(next_actions[i, action.value], next_action.value)
+
+
+class TestPlayFSMMatch(unittest.TestCase):
+    def play_turn_by_turn(self, player, opponent, turns):
+        return [player.play(opponent) for _ in range(turns)]
+
+    def test_is_deterministic_fsm_player(self):
+        self.assertTrue(is_deterministic_fsm_player(axelrod.TF1()))
+        self.assertTrue(is_deterministic_fsm_player(axelrod.EvolvableFSMPlayer(num_states=4)))
+        self.assertFalse(is_deterministic_fsm_player(axelrod.TitForTat()))
+        self.assertFalse(is_deterministic_fsm_player(axelrod.SecondByMikkelson()))
+        flipped = axelrod.strategy_transformers.FlipTransformer()(axelrod.TF1)()
+        self.assertFalse(is_deterministic_fsm_player(flipped))
+
+    def test_agrees_with_turn_by_turn_play(self):
+        strategies = [
+            axelrod.EvolvedFSM16,
+            axelrod.TF1,
+            axelrod.Fortress4,
+            axelrod.Predator,
+            axelrod.Thumper,
+            axelrod.SecondByColbert,
+        ]
+        for turns in [0, 1, 2, 7, 200]:
+            for s1 in strategies:
+                for s2 in strategies:
+                    player, opponent = s1(), s2()
+                    expected = self.play_turn_by_turn(player, opponent, turns)
+                    fast_player, fast_opponent = s1(), s2()
+                    result = play_fsm_match(fast_player, fast_opponent, turns)
+                    self.assertEqual(result, expected)
+                    self.assertEqual(fast_player.history, player.history)
+                    self.assertEqual(fast_opponent.history, opponent.history)
+                    self.assertEqual(fast_player.fsm.state, player.fsm.state)
+                    self.assertEqual(fast_opponent.fsm.state, opponent.fsm.state)
+
+    def test_cycle_is_repeated(self):
+        # Alternator, as a machine, against a Tit For Tat machine
+        alternator = FSMPlayer(((1, C, 2, D), (1, D, 2, D), (2, C, 1, C), (2, D, 1, C)))
+        tit_for_tat = FSMPlayer()
+        result = play_fsm_match(alternator, tit_for_tat, 1001)
+        self.assertEqual(result[:3], [(C, C), (D, C), (C, D)])
+        self.assertEqual(result[-2:], [(D, C), (C, D)])
+        self.assertEqual(alternator.history.cooperations, 501)
+        self.assertEqual(tit_for_tat.history.cooperations, 501)
+        self.assertEqual(alternator.fsm.state, 1)
+
 
 class TestSampleFSMPlayer(TestPlayer):
     """Test a few sample tables to make sure that the finite state machines are
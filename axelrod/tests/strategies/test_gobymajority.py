@@ -104,6 +104,17 @@ class TestGoByMajority(TestHardGoByMajority):
         actions = [(C, C)] * 4 + [(C, D)] * 3 + [(D, D)] + [(D, C)] * 2 + [(C, C)] * 2
         self.versus_test(opponent, expected_actions=actions, init_kwargs=init_kwargs)
 
+    def test_strategy_with_array_history(self):
+        for memory_depth in (0, 5):
+            player = self.player(memory_depth=memory_depth)
+            opponent = axelrod.Cooperator()
+            opponent.history_class = axelrod.ArrayHistory
+            opponent.reset()
+            opponent.history.extend([D] * 20 + [C] * 3, [C] * 23)
+            self.assertEqual(player.strategy(opponent), C if memory_depth else D)
+            # The window is counted without building the list of plays
+            self.assertIsNone(opponent.history._play_list)
+
     def test_name(self):
         player = self.player(soft=True)
         self.assertEqual(player.name, "Soft Go By Majority")
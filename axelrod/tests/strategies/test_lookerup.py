@@ -147,6 +147,13 @@ class TestLookupTable(unittest.TestCase):
         self.assertFalse(table_a.__ne__(table_b))
         self.assertTrue(table_a.__ne__(not_equal))
 
+    def test_get_by_index(self):
+        table = LookupTable.from_pattern("CDDCDCCD" * 4, 2, 2, 1)
+        keys = create_lookup_table_keys(2, 2, 1)
+        for index, key in enumerate(keys):
+            self.assertEqual(table.key_index(*key), index)
+            self.assertEqual(table.get_by_index(index), table.get(*key))
+
 
 class TestLookupTableHelperFunctions(unittest.TestCase):
     def test_plays_equals_tuple(self):
@@ -377,6 +384,20 @@ class TestLookerUp(TestPlayer):
             init_kwargs={"lookup_dict": first_move_table},
         )
 
+    def test_plays_indices_after_altered_history(self):
+        player = axelrod.EvolvedLookerUp2_2_2()
+        opponent = axelrod.Alternator()
+        for _ in range(5):
+            player.play(opponent)
+        expected = player.strategy(opponent)
+
+        other_player = axelrod.EvolvedLookerUp2_2_2()
+        for _ in range(3):
+            other_player.play(axelrod.Defector())
+        other_player._history = player.history.copy()
+        self.assertEqual(other_player.strategy(opponent), expected)
+        self.assertEqual(other_player._indexed_turns, 5)
+
     def test_lookup_table_display(self):
         player = axelrod.LookerUp(
             pattern="CCCC", parameters=Plays(self_plays=2, op_plays=0, op_openings=0)
@@ -109,6 +109,16 @@ class TestPlayerClass(unittest.TestCase):
         self.assertEqual(player1.history[0], D)
         self.assertEqual(player2.history[0], D)
 
+    def test_play_with_flips(self):
+        player1, player2 = self.player(), self.player()
+        player1.strategy = cooperate
+        player2.strategy = defect
+        self.assertEqual(player1.play(player2, flips=(True, False)), (D, D))
+        self.assertEqual(player1.play(player2, flips=(False, True)), (C, C))
+        self.assertEqual(player1.play(player2, 1, flips=(False, False)), (C, D))
+        self.assertEqual(player1.history, [D, C, C])
+        self.assertEqual(player2.history, [D, C, D])
+
     def test_update_history(self):
         player = Player()
         self.assertEqual(player.history, [])
@@ -128,6 +138,22 @@ class TestPlayerClass(unittest.TestCase):
         with self.assertRaises(AttributeError):
             player.history = []
 
+    def test_history_class(self):
+        player = axelrod.TitForTat()
+        self.assertIsInstance(player.history, axelrod.History)
+        self.assertNotIsInstance(player.history, axelrod.ArrayHistory)
+
+        player.history_class = axelrod.ArrayHistory
+        player.reset()
+        player.set_match_attributes(length=10)
+        self.assertIsInstance(player.history, axelrod.ArrayHistory)
+
+        clone = player.clone()
+        self.assertIsInstance(clone.history, axelrod.ArrayHistory)
+        self.assertEqual(clone.match_attributes["length"], 10)
+        self.assertIsInstance(axelrod.TitForTat().history, axelrod.History)
+        self.assertNotIsInstance(axelrod.TitForTat().history, axelrod.ArrayHistory)
+
     def test_strategy(self):
         self.assertRaises(NotImplementedError, self.player().strategy, self.player())
 
@@ -0,0 +1,157 @@
+import unittest
+
+import axelrod
+import numpy as np
+from axelrod import Action
+from axelrod.batch_match import BatchMatch, play_memory_one_actions
+
+from hypothesis import given, settings
+from hypothesis.strategies import floats, integers
+
+C, D = Action.C, Action.D
+
+
+class TestPlayMemoryOneActions(unittest.TestCase):
+    def test_shape_and_deterministic_play(self):
+        four_vectors = (np.array([1, 0, 1, 0]), np.array([0, 0, 1, 1]))
+        plays = play_memory_one_actions(four_vectors, (C.value, C.value), 4, 3)
+        self.assertEqual(plays.shape, (3, 4, 2))
+        # Tit For Tat against Alternator
+        expected = [[0, 0], [0, 1], [1, 0], [0, 1]]
+        for row in plays:
+            self.assertEqual(row.tolist(), expected)
+
+    def test_noise_of_one_flips_every_action(self):
+        four_vectors = (np.array([1, 1, 1, 1]), np.array([1, 1, 1, 1]))
+        plays = play_memory_one_actions(four_vectors, (C.value, C.value), 5, 2, noise=1)
+        self.assertTrue(np.all(plays == D.value))
+
+
+class TestBatchMatch(unittest.TestCase):
+    def test_init(self):
+        players = (axelrod.WinStayLoseShift(), axelrod.GTFT())
+        match = BatchMatch(players, repetitions=3, turns=5)
+        self.assertEqual(match.players, list(players))
+        self.assertEqual(match.repetitions, 3)
+        self.assertEqual(match.turns, 5)
+        self.assertEqual(match.prob_end, 0)
+        self.assertEqual(match.noise, 0)
+        self.assertEqual(match.result, [])
+        self.assertEqual(len(match), 5)
+        self.assertEqual(match.game.RPST(), (3, 1, 0, 5))
+
+    def test_init_with_prob_end(self):
+        players = (axelrod.WinStayLoseShift(), axelrod.GTFT())
+        match = BatchMatch(players, prob_end=0.5)
+        self.assertEqual(match.turns, float("inf"))
+        self.assertEqual(match.prob_end, 0.5)
+        self.assertEqual(match.match_attributes["length"], float("inf"))
+
+    def test_init_with_invalid_player(self):
+        players = (axelrod.WinStayLoseShift(), axelrod.TitForTat())
+        with self.assertRaises(ValueError):
+            BatchMatch(players, repetitions=3, turns=5)
+
+    @given(
+        turns=integers(min_value=0, max_value=20),
+        repetitions=integers(min_value=1, max_value=5),
+        noise=floats(min_value=0, max_value=1),
+    )
+    @settings(max_examples=10)
+    def test_play_matches_match_for_deterministic_players(
+        self, turns, repetitions, noise
+    ):
+        # Noise of 0 or 1 is deterministic
+        noise = round(noise)
+        players = [
+            axelrod.WinStayLoseShift(),
+            axelrod.WinShiftLoseStay(),
+            axelrod.MemoryOnePlayer((1, 0, 1, 0)),
+        ]
+        for player1 in players:
+            for player2 in players:
+                match = axelrod.Match(
+                    (player1.clone(), player2.clone()), turns=turns, noise=noise
+                )
+                expected = match.play()
+                batch_match = BatchMatch(
+                    (player1.clone(), player2.clone()),
+                    repetitions=repetitions,
+                    turns=turns,
+                    noise=noise,
+                )
+                result = batch_match.play()
+                self.assertEqual(result, [expected] * repetitions)
+                self.assertEqual(batch_match.result, result)
+
+    def test_play_stochastic(self):
+        axelrod.seed(0)
+        players = (axelrod.GTFT(p=0.5), axelrod.StochasticWSLS(0.2))
+        match = BatchMatch(players, repetitions=200, turns=10, noise=0.1)
+        result = match.play()
+        self.assertEqual(len(result), 200)
+        self.assertTrue(all(len(interaction) == 10 for interaction in result))
+        # The first move is only affected by noise
+        first_moves = [interaction[0] for interaction in result]
+        self.assertGreater(first_moves.count((C, C)), 100)
+        self.assertGreater(len(set(map(tuple, result))), 100)
+
+    def test_play_is_seeded(self):
+        players = (axelrod.GTFT(p=0.5), axelrod.StochasticWSLS(0.2))
+        axelrod.seed(1)
+        match = BatchMatch(players, repetitions=10, turns=10, noise=0.1)
+        expected = match.play()
+        axelrod.seed(1)
+        self.assertEqual(match.play(), expected)
+
+    def test_play_with_seeds(self):
+        players = (axelrod.GTFT(p=0.5), axelrod.StochasticWSLS(0.2))
+        match = BatchMatch(players, repetitions=6, prob_end=0.1, noise=0.1)
+        expected = match.play(seeds=list(range(6)))
+        self.assertEqual(match.play(seeds=list(range(6))), expected)
+        # A repetition does not depend on the others played with it
+        match = BatchMatch(players, repetitions=2, prob_end=0.1, noise=0.1)
+        self.assertEqual(match.play(seeds=[4, 5]), expected[4:])
+        match = BatchMatch(players, repetitions=1, prob_end=0.1, noise=0.1)
+        self.assertEqual(match.play(seeds=[0]), expected[:1])
+        with self.assertRaises(ValueError):
+            match.play(seeds=[0, 1])
+
+    def test_play_with_prob_end(self):
+        axelrod.seed(0)
+        players = (axelrod.WinStayLoseShift(), axelrod.WinStayLoseShift())
+        match = BatchMatch(players, repetitions=20, prob_end=0.3)
+        result = match.play()
+        lengths = [len(interaction) for interaction in result]
+        self.assertEqual(lengths, match.lengths.tolist())
+        self.assertGreater(len(set(lengths)), 1)
+        for interaction in result:
+            self.assertEqual(interaction, [(C, C)] * len(interaction))
+
+    def test_scores(self):
+        axelrod.seed(0)
+        players = (axelrod.GTFT(p=0.5), axelrod.StochasticWSLS(0.2))
+        game = axelrod.Game(r=4, s=0, t=6, p=1)
+        match = BatchMatch(
+            players, repetitions=10, turns=5, prob_end=0.2, noise=0.1, game=game
+        )
+        result = match.play()
+        final_scores = match.final_scores()
+        final_scores_per_turn = match.final_scores_per_turn()
+        cooperations = match.cooperations()
+        self.assertEqual(match.scores().shape, (10, max(match.lengths), 2))
+        for index, interaction in enumerate(result):
+            self.assertEqual(
+                tuple(final_scores[index]),
+                axelrod.interaction_utils.compute_final_score(interaction, game),
+            )
+            self.assertEqual(
+                tuple(final_scores_per_turn[index]),
+                axelrod.interaction_utils.compute_final_score_per_turn(
+                    interaction, game
+                ),
+            )
+            self.assertEqual(
+                tuple(cooperations[index]),
+                axelrod.interaction_utils.compute_cooperations(interaction),
+            )
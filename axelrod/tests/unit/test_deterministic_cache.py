@@ -1,12 +1,74 @@
 import os
 import pickle
 import unittest
+from multiprocessing import Process
+from unittest import mock
 
-from axelrod import Action, Defector, DeterministicCache, Random, TitForTat
+from axelrod import (
+    Action,
+    BackStabber,
+    Cycler,
+    Defector,
+    DeterministicCache,
+    Game,
+    Match,
+    PersistentDeterministicCache,
+    Player,
+    Random,
+    SharedDeterministicCache,
+    TitForTat,
+)
+from axelrod.deterministic_cache import PackedInteractions, _hash_key
 
 C, D = Action.C, Action.D
 
 
+class TestPackedInteractions(unittest.TestCase):
+    def setUp(self):
+        self.interactions = [(C, C), (C, D), (D, C), (D, D), (D, D), (C, D)]
+        self.packed = PackedInteractions(self.interactions)
+
+    def test_size(self):
+        self.assertEqual(len(self.packed), 6)
+        self.assertEqual(len(self.packed.data), 2)
+        self.assertEqual(len(PackedInteractions()), 0)
+        self.assertEqual(list(PackedInteractions()), [])
+
+    def test_getitem(self):
+        for index in range(-6, 6):
+            self.assertEqual(self.packed[index], self.interactions[index])
+        with self.assertRaises(IndexError):
+            self.packed[6]
+        with self.assertRaises(IndexError):
+            self.packed[-7]
+
+    def test_slices(self):
+        for start in range(-7, 8):
+            for stop in range(-7, 8):
+                for step in (None, 1, 2, -1):
+                    key = slice(start, stop, step)
+                    self.assertEqual(self.packed[key], self.interactions[key])
+        self.assertIsInstance(self.packed[:3], list)
+
+    def test_equality(self):
+        self.assertEqual(self.packed, self.interactions)
+        self.assertEqual(self.packed, PackedInteractions(self.interactions))
+        self.assertNotEqual(self.packed, self.interactions[:-1])
+        self.assertNotEqual(self.packed, PackedInteractions(self.interactions[:-1]))
+        self.assertNotEqual(self.packed, "CCDD")
+
+    def test_list_and_repr(self):
+        self.assertEqual(list(self.packed), self.interactions)
+        self.assertEqual(repr(self.packed), repr(self.interactions))
+
+    def test_from_bytes(self):
+        packed = PackedInteractions.from_bytes(self.packed.data, 5)
+        self.assertEqual(packed, self.interactions[:5])
+
+    def test_pickle(self):
+        self.assertEqual(pickle.loads(pickle.dumps(self.packed)), self.packed)
+
+
 class TestDeterministicCache(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
@@ -85,11 +147,18 @@ class TestDeterministicCache(unittest.TestCase):
         self.cache.save(self.test_save_file)
         with open(self.test_save_file, "rb") as f:
             text = f.read()
-        self.assertEqual(text, self.test_pickle)
+        expected = {("Tit For Tat", "Defector"): PackedInteractions(self.test_value)}
+        self.assertEqual(text, pickle.dumps(expected))
 
     def test_load(self):
         self.cache.load(self.test_load_file)
         self.assertEqual(self.cache[self.test_key], self.test_value)
+        self.assertIsInstance(self.cache[self.test_key], PackedInteractions)
+
+    def test_setitem_packs_interactions(self):
+        self.cache[self.test_key] = self.test_value
+        self.assertIsInstance(self.cache[self.test_key], PackedInteractions)
+        self.assertEqual(self.cache[self.test_key][:2], self.test_value[:2])
 
     def test_load_error_for_inccorect_format(self):
         filename = "test_outputs/test.cache"
@@ -104,3 +173,210 @@ class TestDeterministicCache(unittest.TestCase):
         self.assertTrue(self.test_key in self.cache)
         del self.cache[self.test_key]
         self.assertFalse(self.test_key in self.cache)
+
+
+class TestPersistentDeterministicCache(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.test_key = (TitForTat(), Defector())
+        cls.test_value = [(C, D), (D, D), (D, D)]
+        cls.test_file = "test_outputs/test_persistent_cache.db"
+        cls.test_save_file = "test_outputs/test_persistent_cache_save.db"
+
+    def tearDown(self):
+        for file_name in (self.test_file, self.test_save_file):
+            for suffix in ("", "-wal", "-shm"):
+                if os.path.exists(file_name + suffix):
+                    os.remove(file_name + suffix)
+
+    def setUp(self):
+        self.tearDown()
+        self.cache = PersistentDeterministicCache(self.test_file)
+
+    def test_basic_init(self):
+        cache = PersistentDeterministicCache()
+        self.assertTrue(cache.mutable)
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.file_name, ":memory:")
+
+    def test_setitem(self):
+        self.cache[self.test_key] = self.test_value
+        self.assertEqual(self.cache[self.test_key], self.test_value)
+        self.assertEqual(len(self.cache), 1)
+        self.assertEqual(list(self.cache), [_hash_key(self.test_key)])
+
+    def test_getitem_missing_key(self):
+        with self.assertRaises(KeyError):
+            self.cache[self.test_key]
+        self.assertFalse(self.test_key in self.cache)
+        self.assertFalse("test" in self.cache)
+
+    def test_setitem_invalid(self):
+        with self.assertRaises(ValueError):
+            self.cache["test"] = self.test_value
+        with self.assertRaises(ValueError):
+            self.cache[(Random(), TitForTat())] = self.test_value
+        with self.assertRaises(ValueError):
+            self.cache[self.test_key] = 5
+        self.cache.mutable = False
+        with self.assertRaises(ValueError):
+            self.cache[self.test_key] = self.test_value
+
+    def test_setitem_keeps_longest_value(self):
+        self.cache[self.test_key] = self.test_value
+        self.cache[self.test_key] = self.test_value[:2]
+        self.assertEqual(self.cache[self.test_key], self.test_value)
+        self.cache[self.test_key] = self.test_value + [(D, D)]
+        self.assertEqual(len(self.cache[self.test_key]), 4)
+
+    def test_del_item(self):
+        self.cache[self.test_key] = self.test_value
+        del self.cache[self.test_key]
+        self.assertFalse(self.test_key in self.cache)
+        with self.assertRaises(KeyError):
+            del self.cache[self.test_key]
+
+    def test_keys_include_parameters(self):
+        self.cache[(Cycler("CCD"), TitForTat())] = self.test_value
+        self.assertTrue((Cycler("CCD"), TitForTat()) in self.cache)
+        self.assertFalse((Cycler("CD"), TitForTat()) in self.cache)
+
+    def test_keys_include_match_attributes(self):
+        self.cache[self.test_key] = self.test_value
+        player, opponent = TitForTat(), Defector()
+        player.set_match_attributes(game=Game(r=4, s=0, t=5, p=1))
+        self.assertFalse((player, opponent) in self.cache)
+
+        player, opponent = TitForTat(), Defector()
+        player.set_match_attributes(length=200)
+        self.assertTrue((player, opponent) in self.cache)
+
+        player, opponent = TitForTat(), BackStabber()
+        self.cache[(player, opponent)] = self.test_value
+        opponent.set_match_attributes(length=200)
+        self.assertFalse((player, opponent) in self.cache)
+
+    def test_hash_key_is_stable(self):
+        self.assertEqual(
+            _hash_key(self.test_key),
+            "a2788956be40dac7f3c95e4f4a71f6f607e797874ebf0d07cb164fb194e8e32e",
+        )
+
+    def test_cache_is_shared(self):
+        other_cache = PersistentDeterministicCache(self.test_file)
+        self.assertFalse(self.test_key in other_cache)
+        self.cache[self.test_key] = self.test_value
+        self.assertEqual(other_cache[self.test_key], self.test_value)
+
+    def test_pickle(self):
+        self.cache[self.test_key] = self.test_value
+        cache = pickle.loads(pickle.dumps(self.cache))
+        self.assertEqual(cache[self.test_key], self.test_value)
+
+    def test_save(self):
+        self.cache[self.test_key] = self.test_value
+        self.assertTrue(self.cache.save(self.test_save_file))
+        cache = PersistentDeterministicCache(self.test_save_file)
+        self.assertEqual(cache[self.test_key], self.test_value)
+
+    def test_load_error_for_incorrect_format(self):
+        filename = "test_outputs/test.cache"
+        with open(filename, "wb") as io:
+            pickle.dump(range(5), io)
+
+        with self.assertRaises(ValueError):
+            self.cache.load(filename)
+
+    def test_match(self):
+        players = (Cycler("CCD"), TitForTat())
+        match = Match(players, turns=10, deterministic_cache=self.cache)
+        expected = match.play()
+        self.assertEqual(self.cache[players], expected)
+
+        match = Match(players, turns=5, deterministic_cache=self.cache)
+        with mock.patch.object(Player, "play") as play:
+            self.assertEqual(match.play(), expected[:5])
+        play.assert_not_called()
+
+
+class TestSharedDeterministicCache(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.test_key = (TitForTat(), Defector())
+        cls.test_value = [(C, D), (D, D), (D, D)]
+        cls.test_save_file = "test_outputs/test_shared_cache_save.txt"
+
+    @classmethod
+    def tearDownClass(cls):
+        if os.path.exists(cls.test_save_file):
+            os.remove(cls.test_save_file)
+
+    def setUp(self):
+        self.cache = SharedDeterministicCache()
+
+    def test_basic_init(self):
+        self.assertTrue(self.cache.mutable)
+        self.assertEqual(len(self.cache), 0)
+
+    def test_setitem(self):
+        self.cache[self.test_key] = self.test_value
+        self.assertEqual(self.cache[self.test_key], self.test_value)
+        self.assertEqual(list(self.cache), [_hash_key(self.test_key)])
+
+    def test_getitem_missing_key(self):
+        with self.assertRaises(KeyError):
+            self.cache[self.test_key]
+        self.assertFalse(self.test_key in self.cache)
+        self.assertFalse("test" in self.cache)
+
+    def test_setitem_invalid(self):
+        with self.assertRaises(ValueError):
+            self.cache["test"] = self.test_value
+        with self.assertRaises(ValueError):
+            self.cache[(Random(), TitForTat())] = self.test_value
+        with self.assertRaises(ValueError):
+            self.cache[self.test_key] = 5
+        self.cache.mutable = False
+        with self.assertRaises(ValueError):
+            self.cache[self.test_key] = self.test_value
+
+    def test_setitem_keeps_longest_value(self):
+        self.cache[self.test_key] = self.test_value
+        self.cache[self.test_key] = self.test_value[:2]
+        self.assertEqual(self.cache[self.test_key], self.test_value)
+
+    def test_del_item(self):
+        self.cache[self.test_key] = self.test_value
+        del self.cache[self.test_key]
+        self.assertFalse(self.test_key in self.cache)
+        with self.assertRaises(KeyError):
+            del self.cache[self.test_key]
+
+    def test_entries_set_in_another_process(self):
+        process = Process(
+            target=self.cache.__setitem__, args=(self.test_key, self.test_value)
+        )
+        process.start()
+        process.join()
+        self.assertEqual(self.cache[self.test_key], self.test_value)
+
+    def test_pickle(self):
+        self.cache[self.test_key] = self.test_value
+        cache = pickle.loads(pickle.dumps(self.cache))
+        self.assertEqual(cache[self.test_key], self.test_value)
+        cache[(TitForTat(), TitForTat())] = [(C, C)]
+        self.assertEqual(len(self.cache), 2)
+
+    def test_save_and_load(self):
+        self.cache[self.test_key] = self.test_value
+        self.assertTrue(self.cache.save(self.test_save_file))
+        cache = SharedDeterministicCache(self.test_save_file)
+        self.assertEqual(cache[self.test_key], self.test_value)
+
+    def test_load_error_for_incorrect_format(self):
+        filename = "test_outputs/test.cache"
+        with open(filename, "wb") as io:
+            pickle.dump({"key": [(C, D)]}, io)
+
+        with self.assertRaises(ValueError):
+            self.cache.load(filename)
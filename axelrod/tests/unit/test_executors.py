@@ -0,0 +1,153 @@
+"""Tests for the executors playing the chunks of a tournament."""
+import pickle
+import unittest
+from collections import Counter
+from multiprocessing import Process
+from multiprocessing.connection import Client
+
+import axelrod
+from axelrod.executors import BrokerExecutor, Executor, WorkerError, run_worker
+
+test_strategies = [
+    axelrod.Cooperator,
+    axelrod.TitForTat,
+    axelrod.Defector,
+    axelrod.Grudger,
+    axelrod.GoByMajority,
+]
+
+
+def lost_worker(address, authkey):
+    """
+    A worker which disconnects after receiving its first chunk and then
+    connects again to play the others.
+    """
+    connection = Client(address, authkey=authkey)
+    connection.recv()
+    connection.recv()
+    connection.close()
+    run_worker(address, authkey)
+
+
+class FailingPlayer(axelrod.Cooperator):
+    name = "Failing Player"
+
+    def strategy(self, opponent):
+        raise RuntimeError("This player always fails")
+
+
+class SerialExecutor(Executor):
+    """An executor playing the chunks in the current process."""
+
+    def run(self, tournament, chunks, build_results=True):
+        for chunk in chunks:
+            yield tournament._play_chunk(chunk, build_results)
+
+
+class TestBrokerExecutor(unittest.TestCase):
+    def setUp(self):
+        self.players = [s() for s in test_strategies]
+        self.tournament = axelrod.Tournament(self.players, turns=10, repetitions=3)
+        self.expected = self.tournament.play(progress_bar=False)
+
+    def assertSameResults(self, results):
+        self.assertEqual(results.scores, self.expected.scores)
+        self.assertEqual(results.wins, self.expected.wins)
+        self.assertEqual(results.match_lengths, self.expected.match_lengths)
+
+    def test_executor_interface(self):
+        self.assertEqual(Executor.workers, 1)
+        with self.assertRaises(NotImplementedError):
+            next(Executor().run(self.tournament, []))
+
+    def test_play_with_executor(self):
+        results = self.tournament.play(progress_bar=False, executor=SerialExecutor())
+        self.assertSameResults(results)
+
+    def test_init(self):
+        with BrokerExecutor(local_workers=3) as executor:
+            self.assertEqual(executor.workers, 3)
+            self.assertEqual(executor.address[0], "127.0.0.1")
+            self.assertGreater(executor.address[1], 0)
+            self.assertEqual(len(executor.authkey), 32)
+            self.assertIsNone(executor.timeout)
+        with BrokerExecutor(authkey=b"key", workers=8) as executor:
+            self.assertEqual(executor.workers, 8)
+            self.assertEqual(executor.authkey, b"key")
+
+    def test_play_with_local_workers(self):
+        with BrokerExecutor(local_workers=2) as executor:
+            results = self.tournament.play(progress_bar=False, executor=executor)
+            self.assertEqual(executor.requeued, 0)
+        self.assertSameResults(results)
+
+    def test_play_with_adaptive_chunking(self):
+        with BrokerExecutor(local_workers=2) as executor:
+            results = self.tournament.play(
+                progress_bar=False, executor=executor, adaptive_chunking=True
+            )
+        self.assertSameResults(results)
+        self.assertEqual(len(self.tournament.timings), 15)
+
+    def test_play_twice_with_the_same_broker(self):
+        with BrokerExecutor(local_workers=1) as executor:
+            for _ in range(2):
+                results = self.tournament.play(progress_bar=False, executor=executor)
+                self.assertSameResults(results)
+
+    def test_worker_started_separately(self):
+        with BrokerExecutor() as executor:
+            worker = Process(
+                target=run_worker, args=(executor.address, executor.authkey)
+            )
+            worker.start()
+            results = self.tournament.play(progress_bar=False, executor=executor)
+            worker.join()
+        self.assertSameResults(results)
+        self.assertEqual(worker.exitcode, 0)
+
+    def test_lost_worker_chunk_is_requeued(self):
+        with BrokerExecutor() as executor:
+            lost = Process(
+                target=lost_worker, args=(executor.address, executor.authkey)
+            )
+            lost.start()
+            results = self.tournament.play(progress_bar=False, executor=executor)
+            lost.join()
+            self.assertEqual(executor.requeued, 1)
+        self.assertSameResults(results)
+
+    def test_interactions_written_once(self):
+        with BrokerExecutor() as executor:
+            lost = Process(
+                target=lost_worker, args=(executor.address, executor.authkey)
+            )
+            lost.start()
+            self.tournament.play(
+                progress_bar=False,
+                executor=executor,
+                build_results=False,
+                filename="test_outputs/test_executors.csv",
+            )
+            lost.join()
+        with open("test_outputs/test_executors.csv") as f:
+            rows = f.readlines()[1:]
+        self.assertEqual(len(rows), 2 * 15 * 3)
+        repetitions = Counter(tuple(row.split(",")[1:3]) for row in rows)
+        self.assertEqual(set(repetitions.values()), {3, 6})
+
+    def test_worker_error(self):
+        players = [axelrod.Cooperator(), FailingPlayer()]
+        tournament = axelrod.Tournament(players, turns=5, repetitions=1)
+        with BrokerExecutor(local_workers=1) as executor:
+            with self.assertRaises(WorkerError):
+                tournament.play(progress_bar=False, executor=executor)
+
+    def test_tournament_pickles_without_result_collectors(self):
+        self.tournament.aggregator = axelrod.ResultAggregator(
+            players=[str(p) for p in self.players], repetitions=3
+        )
+        tournament = pickle.loads(pickle.dumps(self.tournament))
+        self.assertIsNone(tournament.aggregator)
+        self.assertEqual(len(tournament.players), len(self.players))
+        self.assertIsNotNone(self.tournament.aggregator)
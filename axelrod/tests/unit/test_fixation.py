@@ -0,0 +1,257 @@
+"""Tests for the estimation of fixation probabilities."""
+import unittest
+
+import axelrod
+import numpy as np
+from axelrod import (
+    CountMoranProcess,
+    MoranProcess,
+    estimate_fixation,
+    exact_fixation,
+    two_type_fixation,
+    type_payoff_matrix,
+)
+from axelrod.fixation import wilson_interval
+
+
+class TestWilsonInterval(unittest.TestCase):
+    def test_wilson_interval(self):
+        low, high = wilson_interval(5, 10)
+        self.assertAlmostEqual(low, 0.2366, places=4)
+        self.assertAlmostEqual(high, 0.7634, places=4)
+
+        low, high = wilson_interval(0, 10)
+        self.assertEqual(low, 0)
+        self.assertAlmostEqual(high, 0.2775, places=4)
+
+        low, high = wilson_interval(10, 10)
+        self.assertAlmostEqual(low, 0.7225, places=4)
+        self.assertAlmostEqual(high, 1)
+
+    def test_confidence(self):
+        low, high = wilson_interval(30, 100, confidence=0.99)
+        wide_low, wide_high = wilson_interval(30, 100, confidence=0.999)
+        self.assertLess(wide_low, low)
+        self.assertGreater(wide_high, high)
+
+
+class TestEstimateFixation(unittest.TestCase):
+    def setUp(self):
+        players = [axelrod.TitForTat()] * 2 + [axelrod.Defector()] * 4
+        self.process = CountMoranProcess.from_players(players, turns=10)
+
+    def test_estimate_fixation(self):
+        estimate = estimate_fixation(self.process, replicates=300, seed_=0)
+        self.assertEqual(estimate.replicates, 300)
+        self.assertEqual(sum(estimate.fixations.values()), 300)
+        self.assertEqual(set(estimate.probabilities), {"Defector", "Tit For Tat"})
+        self.assertAlmostEqual(sum(estimate.probabilities.values()), 1)
+        for name, probability in estimate.probabilities.items():
+            self.assertEqual(probability, estimate.fixations[name] / 300)
+            low, high = estimate.confidence_intervals[name]
+            self.assertLess(low, probability)
+            self.assertGreater(high, probability)
+            self.assertGreater(estimate.mean_fixation_times[name], 1)
+
+    def test_estimate_is_reproducible(self):
+        estimate = estimate_fixation(self.process, replicates=200, seed_=1)
+        self.assertEqual(
+            estimate_fixation(self.process, replicates=200, seed_=1), estimate
+        )
+        self.assertNotEqual(
+            estimate_fixation(self.process, replicates=200, seed_=2), estimate
+        )
+        axelrod.seed(0)
+        estimate = estimate_fixation(self.process, replicates=200)
+        axelrod.seed(0)
+        self.assertEqual(estimate_fixation(self.process, replicates=200), estimate)
+
+    def test_estimate_does_not_depend_on_processes_and_batches(self):
+        estimate = estimate_fixation(self.process, replicates=200, seed_=0)
+        for processes, batch_size in [(2, 100), (2, 7), (None, 30)]:
+            self.assertEqual(
+                estimate_fixation(
+                    self.process,
+                    replicates=200,
+                    seed_=0,
+                    processes=processes,
+                    batch_size=batch_size,
+                ),
+                estimate,
+            )
+
+    def test_early_stopping(self):
+        for processes in [None, 2]:
+            estimate = estimate_fixation(
+                self.process,
+                replicates=100000,
+                seed_=0,
+                processes=processes,
+                batch_size=50,
+                tolerance=0.05,
+            )
+            self.assertLess(estimate.replicates, 1000)
+            self.assertEqual(estimate.replicates % 50, 0)
+            for low, high in estimate.confidence_intervals.values():
+                self.assertLessEqual((high - low) / 2, 0.05)
+            self.assertEqual(
+                estimate,
+                estimate_fixation(
+                    self.process, replicates=estimate.replicates, seed_=0
+                ),
+            )
+
+    def test_type_which_never_fixates(self):
+        process = CountMoranProcess([[3, 0], [5, 1]], [1, 5], names=["C", "D"])
+        estimate = estimate_fixation(process, replicates=20, seed_=0)
+        self.assertEqual(estimate.probabilities, {"C": 0, "D": 1})
+        self.assertTrue(np.isnan(estimate.mean_fixation_times["C"]))
+
+    def test_moran_process(self):
+        players = [axelrod.TitForTat() for _ in range(2)] + [
+            axelrod.Defector() for _ in range(2)
+        ]
+        process = MoranProcess(players, turns=10, incremental_scores=True)
+        estimate = estimate_fixation(process, replicates=40, seed_=0)
+        self.assertEqual(len(process._type_pair_scores), 4)
+        self.assertEqual(estimate.replicates, 40)
+        self.assertEqual(
+            estimate_fixation(process, replicates=40, seed_=0, processes=2),
+            estimate,
+        )
+
+        process = MoranProcess(players, turns=10)
+        self.assertEqual(estimate_fixation(process, replicates=40, seed_=0), estimate)
+
+    def test_invalid_arguments(self):
+        process = CountMoranProcess([[3, 0], [5, 1]], [1, 5], mutation_rate=0.1)
+        with self.assertRaises(ValueError):
+            estimate_fixation(process)
+        with self.assertRaises(ValueError):
+            estimate_fixation(self.process, replicates=0)
+        with self.assertRaises(ValueError):
+            estimate_fixation(self.process, batch_size=0)
+
+
+class TestExactFixation(unittest.TestCase):
+    def test_constant_fitness(self):
+        """The fixation probability of a mutant of relative fitness r."""
+        for population_size, r in [(2, 2), (10, 1.5), (50, 0.9)]:
+            process = CountMoranProcess([[r, r], [1, 1]], [1, population_size - 1])
+            exact = exact_fixation(process)
+            self.assertEqual(len(exact.probabilities), population_size + 1)
+            self.assertAlmostEqual(
+                exact.probabilities[1], (1 - 1 / r) / (1 - r ** -population_size)
+            )
+            self.assertEqual(exact.probabilities[0], 0)
+            self.assertEqual(exact.probabilities[-1], 1)
+            self.assertTrue((np.diff(exact.probabilities) > 0).all())
+
+    def test_neutral_mutants(self):
+        for mode in ["bd", "db"]:
+            process = CountMoranProcess(np.ones((2, 2)), [3, 7], mode=mode)
+            exact = exact_fixation(process)
+            self.assertTrue(np.allclose(exact.probabilities, np.arange(11) / 10))
+            self.assertEqual(exact.absorption_times[0], 0)
+            self.assertEqual(exact.absorption_times[-1], 0)
+            self.assertTrue(
+                np.allclose(exact.absorption_times, exact.absorption_times[::-1])
+            )
+            self.assertEqual(list(process.counts), [3, 7])
+
+    def test_zero_fitness(self):
+        """Players of fitness zero are as likely to reproduce as any other."""
+        for mode in ["bd", "db"]:
+            process = CountMoranProcess(np.zeros((2, 2)), [1, 9], mode=mode)
+            exact = exact_fixation(process)
+            neutral = exact_fixation(
+                CountMoranProcess(np.ones((2, 2)), [1, 9], mode=mode)
+            )
+            self.assertTrue(np.allclose(exact.probabilities, np.arange(11) / 10))
+            self.assertTrue(
+                np.allclose(exact.absorption_times, neutral.absorption_times)
+            )
+        process = CountMoranProcess([[0, 0], [1, 1]], [1, 9])
+        exact = exact_fixation(process)
+        self.assertTrue(np.allclose(exact.probabilities, [0] * 10 + [1]))
+        self.assertTrue(np.isfinite(exact.absorption_times).all())
+
+    def test_agrees_with_simulation(self):
+        players = [axelrod.TitForTat()] * 2 + [axelrod.Defector()] * 4
+        for mode in ["bd", "db"]:
+            process = CountMoranProcess.from_players(players, turns=10, mode=mode)
+            exact = exact_fixation(process)
+            estimate = estimate_fixation(process, replicates=2000, seed_=0)
+            # The first type is Defector, of which there are 4 players.
+            low, high = estimate.confidence_intervals["Defector"]
+            self.assertLess(low, exact.probabilities[4])
+            self.assertGreater(high, exact.probabilities[4])
+            mean_time = sum(
+                estimate.probabilities[name] * estimate.mean_fixation_times[name]
+                for name in process.names
+            )
+            self.assertAlmostEqual(
+                mean_time / exact.absorption_times[4], 1, places=1
+            )
+
+    def test_invalid_processes(self):
+        with self.assertRaises(ValueError):
+            exact_fixation(CountMoranProcess(np.ones((3, 3)), [1, 1, 1]))
+        with self.assertRaises(ValueError):
+            exact_fixation(
+                CountMoranProcess(np.ones((2, 2)), [1, 1], mutation_rate=0.1)
+            )
+
+
+class TestTwoTypeFixation(unittest.TestCase):
+    def test_two_type_fixation(self):
+        exact = two_type_fixation(
+            axelrod.TitForTat(), axelrod.Defector(), 6, turns=10, mode="db"
+        )
+        players = [axelrod.TitForTat()] + [axelrod.Defector()] * 5
+        process = CountMoranProcess.from_players(players, turns=10, mode="db")
+        expected = exact_fixation(process)
+        # The types of the process are sorted by name.
+        self.assertTrue(
+            np.allclose(exact.probabilities, 1 - expected.probabilities[::-1])
+        )
+        self.assertTrue(
+            np.allclose(exact.absorption_times, expected.absorption_times[::-1])
+        )
+
+    def test_game_and_fitness_transformation(self):
+        game = axelrod.Game(r=4, s=0, t=6, p=1)
+        exact = two_type_fixation(
+            axelrod.Cooperator(),
+            axelrod.Defector(),
+            5,
+            turns=5,
+            game=game,
+            fitness_transformation=lambda score: 1 + score,
+        )
+        # The fitness of a cooperator is 1 + 4 (i - 1) and that of a
+        # defector 1 + 6 i + (4 - i).
+        population_size = 5
+        up = []
+        down = []
+        for i in range(1, population_size):
+            cooperators = i * (1 + 4 * (i - 1))
+            defectors = (population_size - i) * (1 + 6 * i + population_size - i - 1)
+            total = cooperators + defectors
+            up.append(cooperators / total * (population_size - i) / population_size)
+            down.append(defectors / total * i / population_size)
+        ratios = np.cumprod(np.array(down) / np.array(up))
+        self.assertAlmostEqual(exact.probabilities[1], 1 / (1 + ratios.sum()))
+
+    def test_memory_one_players_with_noise(self):
+        player1, player2 = axelrod.GTFT(), axelrod.WinStayLoseShift()
+        exact = two_type_fixation(player1, player2, 10, turns=20, noise=0.05)
+        payoffs = type_payoff_matrix([player1, player2], turns=20, noise=0.05)
+        match = axelrod.Match((player1, player2), turns=20, noise=0.05)
+        self.assertTrue(
+            np.allclose(payoffs[0, 1], match.expected_final_score_per_turn()[0])
+        )
+        process = CountMoranProcess(payoffs, [1, 9])
+        self.assertTrue(
+            np.allclose(exact.probabilities, exact_fixation(process).probabilities)
+        )
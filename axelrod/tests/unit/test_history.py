@@ -1,22 +1,26 @@
 from collections import Counter
 import unittest
 
+import numpy as np
+
 import axelrod
 from axelrod import Action
-from axelrod.history import History, LimitedHistory
+from axelrod.history import ArrayHistory, History, LimitedHistory
 
 C, D = Action.C, Action.D
 
 
 class TestHistory(unittest.TestCase):
+    history_class = History
+
     def test_init(self):
-        h1 = History([C, C, D], [C, C, C])
+        h1 = self.history_class([C, C, D], [C, C, C])
         self.assertEqual(list(h1), [C, C, D])
         h1.extend([C, C], [D, D])
         self.assertEqual(list(h1), [C, C, D, C, C])
 
     def test_str_list_repr(self):
-        h = History()
+        h = self.history_class()
         h.append(C, D)
         h.append(D, C)
         h.append(C, D)
@@ -27,7 +31,7 @@ class TestHistory(unittest.TestCase):
         self.assertEqual(str(h2), "DCD")
 
     def test_reset(self):
-        h = History()
+        h = self.history_class()
         h.append(C, D)
         self.assertEqual(len(h), 1)
         self.assertEqual(h.cooperations, 1)
@@ -36,32 +40,32 @@ class TestHistory(unittest.TestCase):
         self.assertEqual(h.cooperations, 0)
 
     def test_compare(self):
-        h = History([C, D, C], [C, C, C])
+        h = self.history_class([C, D, C], [C, C, C])
         self.assertEqual(h, [C, D, C])
-        h2 = History([C, D, C], [C, C, C])
+        h2 = self.history_class([C, D, C], [C, C, C])
         self.assertEqual(h, h2)
         h2.reset()
         self.assertNotEqual(h, h2)
 
     def test_copy(self):
-        h = History([C, D, C], [C, C, C])
+        h = self.history_class([C, D, C], [C, C, C])
         h2 = h.copy()
         self.assertEqual(h, h2)
 
     def test_eq(self):
-        h = History([C, D, C], [C, C, C])
+        h = self.history_class([C, D, C], [C, C, C])
         with self.assertRaises(TypeError):
             h == 2
 
     def test_counts(self):
-        h1 = History([C, C], [C, C])
+        h1 = self.history_class([C, C], [C, C])
         self.assertEqual(h1.cooperations, 2)
         self.assertEqual(h1.defections, 0)
-        h2 = History([D, D], [C, C])
+        h2 = self.history_class([D, D], [C, C])
         self.assertEqual(h2.cooperations, 0)
         self.assertEqual(h2.defections, 2)
         self.assertNotEqual(h1, h2)
-        h3 = History([C, C, D, D], [C, C, C, C])
+        h3 = self.history_class([C, C, D, D], [C, C, C, C])
         self.assertEqual(h3.cooperations, 2)
         self.assertEqual(h3.defections, 2)
 
@@ -94,6 +98,104 @@ class TestHistory(unittest.TestCase):
         self.assertEqual(flipped_flipped_history.defections, 2)
 
 
+class TestWindows(unittest.TestCase):
+    def setUp(self):
+        self.plays = [C, D, D, C, D, C, C, D]
+        self.coplays = [D, D, C, C, C, D, C, C]
+        self.h = History(self.plays, self.coplays)
+
+    def test_count(self):
+        for start in range(-10, 10):
+            for stop in range(-10, 10):
+                for action in (C, D):
+                    self.assertEqual(
+                        self.h.count(action, start, stop),
+                        self.plays[start:stop].count(action),
+                    )
+                    self.assertEqual(
+                        self.h.count_coplays(action, start, stop),
+                        self.coplays[start:stop].count(action),
+                    )
+        self.assertEqual(self.h.count(D), 4)
+        self.assertEqual(self.h.count(D, -3), 1)
+
+    def test_values(self):
+        self.assertEqual(self.h.play_values().tolist(), [0, 1, 1, 0, 1, 0, 0, 1])
+        self.assertEqual(self.h.play_values(-3).tolist(), [0, 0, 1])
+        self.assertEqual(self.h.coplay_values(1, 3).tolist(), [1, 0])
+
+
+class TestArrayHistory(TestHistory):
+    history_class = ArrayHistory
+
+
+class TestArrayHistoryWindows(TestWindows):
+    def setUp(self):
+        super().setUp()
+        self.h = ArrayHistory(self.plays, self.coplays)
+
+    def test_agrees_with_history(self):
+        history, array_history = History(), ArrayHistory(capacity=2)
+        for play, coplay in zip(self.plays * 20, self.coplays[::-1] * 20):
+            history.append(play, coplay)
+            array_history.append(play, coplay)
+            self.assertEqual(array_history, history)
+            self.assertEqual(array_history.cooperations, history.cooperations)
+            self.assertEqual(array_history.defections, history.defections)
+            self.assertEqual(array_history.coplays, history.coplays)
+            self.assertEqual(
+                array_history.state_distribution, history.state_distribution
+            )
+        self.assertEqual(array_history[-5:], history[-5:])
+        self.assertEqual(array_history[::3], history[::3])
+        self.assertEqual(array_history[-1], history[-1])
+        self.assertEqual(str(array_history), str(history))
+        self.assertEqual(list(array_history), history[:])
+        self.assertEqual(array_history.flip_plays(), history.flip_plays())
+
+    def test_extend(self):
+        history = ArrayHistory(capacity=1)
+        history.append(C, D)
+        _ = history.coplays
+        history.extend(self.plays, self.coplays)
+        self.assertEqual(history, History([C] + self.plays, [D] + self.coplays))
+        self.assertEqual(history.coplays, [D] + self.coplays)
+        self.assertEqual(history.count(C, 0, 5), 3)
+        self.assertEqual(
+            history.state_distribution,
+            History([C] + self.plays, [D] + self.coplays).state_distribution,
+        )
+
+    def test_getitem_out_of_range(self):
+        with self.assertRaises(IndexError):
+            self.h[8]
+        with self.assertRaises(IndexError):
+            self.h[-9]
+
+    def test_values_are_read_only_views(self):
+        values = self.h.play_values(-3)
+        self.assertTrue(np.shares_memory(values, self.h._values))
+        with self.assertRaises(ValueError):
+            values[0] = 1
+
+    def test_copy(self):
+        history = self.h.copy()
+        history.append(C, C)
+        self.assertEqual(len(self.h), 8)
+        self.assertEqual(history[:-1], self.plays)
+
+    def test_reset(self):
+        _ = self.h.coplays
+        self.h.reset()
+        self.assertEqual(len(self.h), 0)
+        self.assertEqual(self.h.coplays, [])
+        self.assertEqual(self.h.count(D), 0)
+        self.assertEqual(self.h.state_distribution, Counter())
+        self.h.append(D, C)
+        self.assertEqual(self.h.cooperations, 0)
+        self.assertEqual(self.h.coplays, [C])
+
+
 class TestLimitedHistory(unittest.TestCase):
 
     def test_memory_depth(self):
@@ -0,0 +1,114 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+from axelrod.interaction_log import (
+    InteractionLogWriter,
+    is_interaction_log,
+    read_interaction_log,
+)
+
+
+class TestInteractionLog(unittest.TestCase):
+    def setUp(self):
+        tmp_file = tempfile.NamedTemporaryFile(delete=False)
+        tmp_file.close()
+        self.filename = tmp_file.name
+        self.names = ["Alternator", "Bully", "Cooperator"]
+        # Rows as written by the Tournament class (without the results).
+        self.rows = [
+            [0, 0, 1, 0, "Alternator", "Bully", "CDCDCDCDC"],
+            [0, 1, 0, 0, "Bully", "Alternator", "DDCDCDCDC"],
+            [1, 2, 2, 0, "Cooperator", "Cooperator", ""],
+            [1, 2, 2, 0, "Cooperator", "Cooperator", ""],
+            [2, 0, 2, 0, "Alternator", "Cooperator", "CDCDCDCD"],
+            [2, 2, 0, 0, "Cooperator", "Alternator", "CCCCCCCC"],
+        ]
+        self.columns = [
+            "Interaction index",
+            "Player index",
+            "Opponent index",
+            "Repetition",
+            "Player name",
+            "Opponent name",
+            "Actions",
+        ]
+
+    def tearDown(self):
+        os.remove(self.filename)
+
+    def write(self, rows, **kwargs):
+        writer = InteractionLogWriter(self.filename, self.names, **kwargs)
+        for row in rows:
+            writer.writerow(row)
+        writer.close()
+
+    def test_is_interaction_log(self):
+        self.write(self.rows, build_results=False)
+        self.assertTrue(is_interaction_log(self.filename))
+
+        with open(self.filename, "w") as file_obj:
+            file_obj.write("Interaction index,Player index\n")
+        self.assertFalse(is_interaction_log(self.filename))
+
+        with self.assertRaises(ValueError):
+            read_interaction_log(self.filename)
+
+    def test_read_interaction_log(self):
+        for rows_per_block in [1, 4, 100]:
+            self.write(self.rows, build_results=False, rows_per_block=rows_per_block)
+            df = read_interaction_log(self.filename)
+            expected_df = pd.DataFrame(self.rows, columns=self.columns)
+            self.assertTrue(df.equals(expected_df))
+
+    def test_read_interaction_log_without_actions(self):
+        self.write(self.rows, build_results=False)
+        df = read_interaction_log(self.filename, actions=False)
+        expected_df = pd.DataFrame(self.rows, columns=self.columns)
+        self.assertTrue(df.equals(expected_df.drop(columns="Actions")))
+
+    def test_empty_log(self):
+        self.write([], build_results=True)
+        df = read_interaction_log(self.filename)
+        self.assertEqual(len(df), 0)
+        self.assertEqual(list(df.columns[:7]), self.columns)
+
+    def test_scores_which_are_not_integers(self):
+        results = [1.5, -0.5, 3, 0.5, -1 / 6, 0, True, 2] + [1] * 12 + [1]
+        self.write([self.rows[0] + results, self.rows[1] + results])
+        df = read_interaction_log(self.filename)
+        self.assertEqual(df["Score"].dtype, np.float64)
+        self.assertEqual(list(df["Score"]), [1.5, 1.5])
+        self.assertEqual(list(df["Turns"]), [9, 9])
+        self.assertEqual(list(df["Score per turn"]), [1.5 / 9, 1.5 / 9])
+        self.assertEqual(list(df["Score difference per turn"]), [-0.5 / 9, -0.5 / 9])
+
+    def test_truncated_log(self):
+        self.write(self.rows, build_results=False)
+        with open(self.filename, "rb") as file_obj:
+            data = file_obj.read()
+        with open(self.filename, "wb") as file_obj:
+            file_obj.write(data[:-1])
+        with self.assertRaises(ValueError):
+            read_interaction_log(self.filename)
+
+    def test_append_from_offset(self):
+        writer = InteractionLogWriter(self.filename, self.names, build_results=False)
+        for row in self.rows[:2]:
+            writer.writerow(row)
+        offset = writer.tell()
+        # Rows written after the offset are discarded when appending.
+        writer.writerow(self.rows[2])
+        writer.close()
+
+        writer = InteractionLogWriter(
+            self.filename, self.names, build_results=False, offset=offset
+        )
+        for row in self.rows[2:]:
+            writer.writerow(row)
+        writer.close()
+        df = read_interaction_log(self.filename)
+        expected_df = pd.DataFrame(self.rows, columns=self.columns)
+        self.assertTrue(df.equals(expected_df))
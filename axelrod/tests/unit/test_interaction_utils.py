@@ -53,6 +53,17 @@ class TestMatch(unittest.TestCase):
         for inter, final_score in zip(self.interactions, self.final_scores):
             self.assertEqual(final_score, iu.compute_final_score(inter))
 
+    def test_compute_final_score_of_cycle(self):
+        cycle = [(C, D), (D, C), (D, D)]
+        for start in range(3):
+            for turns in range(start + 3, start + 12):
+                interactions = [(C, C)] * start
+                interactions += (cycle * turns)[: turns - start]
+                self.assertEqual(
+                    iu.compute_final_score_of_cycle(interactions, start, 3),
+                    iu.compute_final_score(interactions),
+                )
+
     def test_compute_final_score_per_turn(self):
         for inter, final_score_per_round in zip(
             self.interactions, self.final_score_per_turn
@@ -124,6 +135,41 @@ class TestMatch(unittest.TestCase):
             expected_dist, iu.compute_normalised_state_to_action_distribution(inter)
         )
 
+    def test_compute_match_statistics(self):
+        for i, inter in enumerate(self.interactions):
+            statistics = iu.compute_match_statistics(inter)
+            if not inter:
+                self.assertIsNone(statistics)
+                continue
+            self.assertEqual(statistics.scores, self.final_scores[i])
+            self.assertEqual(statistics.turns, len(inter))
+            self.assertEqual(statistics.scores_per_turn, self.final_score_per_turn[i])
+            self.assertEqual(statistics.winner_index, self.winners[i])
+            self.assertEqual(
+                statistics.initial_cooperations, (inter[0][0] == C, inter[0][1] == C)
+            )
+            self.assertEqual(statistics.cooperations, self.cooperations[i])
+            self.assertEqual(statistics.state_distribution, self.state_distribution[i])
+            self.assertEqual(
+                statistics.state_to_action_distributions,
+                self.state_to_action_distribution[i],
+            )
+
+    def test_compute_match_statistics_with_iterator(self):
+        statistics = iu.compute_match_statistics(zip([C, D, D], [D, D, D]))
+        self.assertEqual(statistics.scores, (2, 7))
+        self.assertEqual(statistics.winner_index, 1)
+
+    def test_compute_match_statistics_score_types(self):
+        inter = [(C, D), (D, D), (D, D)]
+        statistics = iu.compute_match_statistics(inter, axelrod.Game(r=3.5))
+        self.assertEqual(statistics.scores, (2, 7))
+        self.assertIsInstance(statistics.scores[0], int)
+
+        game = axelrod.Game(r=0.1, s=0.3, t=0.7, p=0.2)
+        statistics = iu.compute_match_statistics(inter, game)
+        self.assertEqual(statistics.scores, (0 + 0.3 + 0.2 + 0.2, 0 + 0.7 + 0.2 + 0.2))
+
     def test_compute_sparklines(self):
         for inter, spark in zip(self.interactions, self.sparklines):
             self.assertEqual(spark, iu.compute_sparklines(inter))
@@ -142,6 +188,22 @@ class TestMatch(unittest.TestCase):
         interactions = iu.read_interactions_from_file(tmp_file.name, progress_bar=False)
         self.assertEqual(expected_interactions, interactions)
 
+    def test_read_interactions_from_binary_log(self):
+        tmp_file = tempfile.NamedTemporaryFile(mode="w", delete=False)
+        players = [axelrod.Cooperator(), axelrod.Defector()]
+        tournament = axelrod.Tournament(players=players, turns=2, repetitions=3)
+        tournament.play(
+            filename=tmp_file.name, progress_bar=False, output_format="binary"
+        )
+        tmp_file.close()
+        expected_interactions = {
+            (0, 0): [[(C, C), (C, C)] for _ in range(3)],
+            (0, 1): [[(C, D), (C, D)] for _ in range(3)],
+            (1, 1): [[(D, D), (D, D)] for _ in range(3)],
+        }
+        interactions = iu.read_interactions_from_file(tmp_file.name, progress_bar=False)
+        self.assertEqual(expected_interactions, interactions)
+
     def test_string_to_interactions(self):
         string = "CDCDDD"
         interactions = [(C, D), (C, D), (D, D)]
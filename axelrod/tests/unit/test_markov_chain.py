@@ -0,0 +1,195 @@
+import unittest
+from collections import Counter
+
+import axelrod
+import axelrod.markov_chain as mc
+import numpy as np
+from axelrod import Action
+
+from hypothesis import given, settings
+from hypothesis.strategies import floats, integers, lists
+
+C, D = Action.C, Action.D
+
+four_vectors = lists(floats(min_value=0, max_value=1), min_size=4, max_size=4)
+
+
+class TestIsMemoryOnePlayer(unittest.TestCase):
+    def test_memory_one_players(self):
+        for player in [
+            axelrod.WinStayLoseShift(),
+            axelrod.GTFT(),
+            axelrod.FirmButFair(),
+            axelrod.StochasticWSLS(),
+            axelrod.ReactivePlayer((0.5, 0.2)),
+            axelrod.ZDExtort2(),
+            axelrod.FirstByJoss(),
+        ]:
+            self.assertTrue(mc.is_memory_one_player(player))
+
+    def test_other_players(self):
+        flipped = axelrod.strategy_transformers.FlipTransformer()
+        for player in [
+            axelrod.TitForTat(),
+            axelrod.Cooperator(),
+            axelrod.ALLCorALLD(),
+            flipped(axelrod.WinStayLoseShift)(),
+        ]:
+            self.assertFalse(mc.is_memory_one_player(player))
+
+
+class TestMemoryOneParameters(unittest.TestCase):
+    def test_parameters(self):
+        four_vector, initial = mc.memory_one_parameters(axelrod.WinShiftLoseStay())
+        self.assertTrue(np.array_equal(four_vector, [0, 1, 1, 0]))
+        self.assertEqual(initial, D.value)
+
+    def test_parameters_depend_on_game(self):
+        player = axelrod.ZDExtort2()
+        default_four_vector, initial = mc.memory_one_parameters(player)
+        player.set_match_attributes(game=axelrod.Game(r=4, s=0, t=5, p=1))
+        four_vector, initial = mc.memory_one_parameters(player)
+        self.assertFalse(np.array_equal(four_vector, default_four_vector))
+        expected = [player._four_vector[state] for state in mc.STATES]
+        self.assertTrue(np.array_equal(four_vector, expected))
+        self.assertEqual(initial, C.value)
+
+
+class TestTransitionMatrix(unittest.TestCase):
+    def test_deterministic_players(self):
+        # Tit For Tat against Alternator
+        matrix = mc.transition_matrix(([1, 0, 1, 0], [0, 0, 1, 1]))
+        expected = [[0, 1, 0, 0], [0, 0, 1, 0], [0, 1, 0, 0], [0, 0, 1, 0]]
+        self.assertTrue(np.array_equal(matrix, expected))
+
+    def test_noise(self):
+        matrix = mc.transition_matrix(([1, 1, 1, 1], [0, 0, 0, 0]), noise=0.1)
+        for row in matrix:
+            self.assertTrue(np.allclose(row, [0.09, 0.81, 0.01, 0.09]))
+
+    @given(p=four_vectors, q=four_vectors, noise=floats(min_value=0, max_value=1))
+    @settings(max_examples=20)
+    def test_rows_are_distributions(self, p, q, noise):
+        matrix = mc.transition_matrix((p, q), noise=noise)
+        self.assertEqual(matrix.shape, (4, 4))
+        self.assertTrue(np.all(matrix >= 0))
+        self.assertTrue(np.allclose(matrix.sum(axis=1), 1))
+
+
+class TestInitialDistribution(unittest.TestCase):
+    def test_initial_distribution(self):
+        distribution = mc.initial_distribution((C.value, D.value))
+        self.assertTrue(np.array_equal(distribution, [0, 1, 0, 0]))
+
+        distribution = mc.initial_distribution((C.value, D.value), noise=0.5)
+        self.assertTrue(np.array_equal(distribution, [0.25] * 4))
+
+
+class TestGeometricSum(unittest.TestCase):
+    @given(n=integers(min_value=0, max_value=50))
+    @settings(max_examples=20)
+    def test_geometric_sum(self, n):
+        matrix = np.array([[0.5, 0.25], [0.1, 0.3]])
+        expected = sum(
+            (np.linalg.matrix_power(matrix, k) for k in range(n)),
+            np.zeros((2, 2)),
+        )
+        self.assertTrue(np.allclose(mc._geometric_sum(matrix, n), expected))
+
+
+class TestExpectedStateCounts(unittest.TestCase):
+    @given(turns=integers(min_value=1, max_value=50))
+    @settings(max_examples=10)
+    def test_deterministic_match(self, turns):
+        players = (axelrod.WinStayLoseShift(), axelrod.MemoryOnePlayer((0, 0, 1, 1)))
+        match = axelrod.Match(players, turns=turns)
+        match.play()
+        expected = match.state_distribution()
+        four_vectors, initial_actions = zip(*map(mc.memory_one_parameters, players))
+
+        counts = mc.expected_state_counts(four_vectors, initial_actions, turns)
+        self.assertTrue(np.allclose(counts, [expected[state] for state in mc.STATES]))
+
+    def test_total_is_expected_length(self):
+        four_vectors = ([0.5, 0.2, 0.3, 0.9], [0.1, 0.2, 0.8, 0.5])
+        initial_actions = (C.value, C.value)
+        counts = mc.expected_state_counts(four_vectors, initial_actions, 10)
+        self.assertAlmostEqual(counts.sum(), 10)
+
+        counts = mc.expected_state_counts(
+            four_vectors, initial_actions, float("inf"), prob_end=0.1
+        )
+        self.assertAlmostEqual(counts.sum(), 10)
+
+        counts = mc.expected_state_counts(
+            four_vectors, initial_actions, 2, prob_end=0.5
+        )
+        self.assertAlmostEqual(counts.sum(), 1.5)
+
+        counts = mc.expected_state_counts(
+            four_vectors, initial_actions, float("inf"), prob_end=1
+        )
+        self.assertAlmostEqual(counts.sum(), 1)
+
+    def test_infinite_match(self):
+        four_vectors = ([0.5, 0.2, 0.3, 0.9], [0.1, 0.2, 0.8, 0.5])
+        with self.assertRaises(ValueError):
+            mc.expected_state_counts(four_vectors, (C.value, C.value), float("inf"))
+
+
+class TestExpectedStateDistribution(unittest.TestCase):
+    def test_distribution(self):
+        four_vectors = ([1, 1, 1, 1], [0, 0, 0, 0])
+        distribution = mc.expected_state_distribution(
+            four_vectors, (C.value, D.value), 10, noise=0.1
+        )
+        self.assertTrue(np.allclose(distribution, [0.09, 0.81, 0.01, 0.09]))
+
+    def test_converges_to_stationary_distribution(self):
+        four_vectors = ([0.9, 0.2, 0.3, 0.9], [0.1, 0.2, 0.8, 0.5])
+        distribution = mc.expected_state_distribution(
+            four_vectors, (C.value, C.value), 10**6, noise=0.01
+        )
+        stationary = mc.stationary_distribution(four_vectors, noise=0.01)
+        self.assertTrue(np.allclose(distribution, stationary, atol=1e-5))
+
+
+class TestStationaryDistribution(unittest.TestCase):
+    def test_stationary_distribution(self):
+        distribution = mc.stationary_distribution(
+            ([1, 1, 1, 1], [0, 0, 0, 0]), noise=0.1
+        )
+        self.assertTrue(np.allclose(distribution, [0.09, 0.81, 0.01, 0.09]))
+
+    def test_absorbing_state(self):
+        # Win Stay Lose Shift against itself always returns to mutual cooperation
+        distribution = mc.stationary_distribution(([1, 0, 0, 1], [1, 0, 0, 1]))
+        self.assertTrue(np.allclose(distribution, [1, 0, 0, 0]))
+
+    @given(p=four_vectors, q=four_vectors, noise=floats(min_value=0.01, max_value=0.5))
+    @settings(max_examples=20)
+    def test_is_stationary(self, p, q, noise):
+        distribution = mc.stationary_distribution((p, q), noise=noise)
+        matrix = mc.transition_matrix((p, q), noise=noise)
+        self.assertAlmostEqual(distribution.sum(), 1)
+        self.assertTrue(np.allclose(distribution @ matrix, distribution))
+
+    def test_no_unique_stationary_distribution(self):
+        # Tit For Tat against itself
+        with self.assertRaises(ValueError):
+            mc.stationary_distribution(([1, 0, 1, 0], [1, 0, 1, 0]))
+
+
+class TestSummaries(unittest.TestCase):
+    def test_distribution_to_counter(self):
+        counter = mc.distribution_to_counter(np.array([0.5, 0, 0.25, 0.25]))
+        self.assertEqual(counter, Counter({(C, C): 0.5, (D, C): 0.25, (D, D): 0.25}))
+
+    def test_expected_score_per_turn(self):
+        distribution = np.array([0.5, 0, 0.25, 0.25])
+        scores = mc.expected_score_per_turn(distribution, axelrod.Game())
+        self.assertEqual(scores, (3 * 0.5 + 5 * 0.25 + 0.25, 3 * 0.5 + 0.25))
+
+    def test_expected_cooperation(self):
+        cooperation = mc.expected_cooperation(np.array([0.5, 0.1, 0.25, 0.15]))
+        self.assertEqual(cooperation, (0.6, 0.75))
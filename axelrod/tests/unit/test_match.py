@@ -1,7 +1,9 @@
 import unittest
 from collections import Counter
+from unittest import mock
 
 import axelrod
+import axelrod.interaction_utils as iu
 from axelrod import Action
 from axelrod.deterministic_cache import DeterministicCache
 from axelrod.tests.property import games
@@ -349,6 +351,90 @@ class TestMatch(unittest.TestCase):
         expected = Counter({(C, D): 2 / turns, (D, D): 1 / turns})
         self.assertEqual(match.normalised_state_distribution(), expected)
 
+    def test_fsm_matches_are_played_on_transition_tables(self):
+        players = (axelrod.EvolvedFSM16(), axelrod.Fortress4())
+        match = axelrod.Match(players, turns=300)
+        self.assertTrue(match._fsm_fast_path_available(300))
+        result = match.play()
+
+        players = [axelrod.EvolvedFSM16(), axelrod.Fortress4()]
+        expected = [players[0].play(players[1]) for _ in range(300)]
+        self.assertEqual(result, expected)
+        self.assertEqual(match.players[0].history, players[0].history)
+        self.assertEqual(match.players[0].fsm.state, players[0].fsm.state)
+
+    def test_fsm_fast_path_is_not_used_with_noise_or_other_players(self):
+        match = axelrod.Match((axelrod.TF1(), axelrod.TF1()), turns=5, noise=0.1)
+        self.assertFalse(match._fsm_fast_path_available(5))
+        match = axelrod.Match((axelrod.TF1(), axelrod.TitForTat()), turns=5)
+        self.assertFalse(match._fsm_fast_path_available(5))
+        match = axelrod.Match((axelrod.TF1(), axelrod.TF1()), turns=5, reset=False)
+        match.play()
+        self.assertFalse(match._fsm_fast_path_available(5))
+
+    def test_cycle_detection(self):
+        strategies = [
+            s
+            for s in axelrod.strategies
+            if s.classifier["memory_depth"] <= 2
+            and not s.classifier["stochastic"]
+            and "length" not in s.classifier["makes_use_of"]
+        ]
+        strategies = [s for s in strategies if not issubclass(s, axelrod.FSMPlayer)]
+        for s1 in strategies[:12]:
+            for s2 in strategies[:12]:
+                match = axelrod.Match((s1(), s2()), turns=200, detect_cycles=True)
+                self.assertTrue(match._cycle_detection_available(200))
+                result = match.play()
+
+                players = (s1(), s2())
+                expected = axelrod.Match(players, turns=200).play()
+                self.assertEqual(result, expected)
+                self.assertEqual(match.players[0].history, players[0].history)
+                self.assertEqual(match.players[1].history, players[1].history)
+                self.assertEqual(match.final_score(), iu.compute_final_score(expected))
+                self.assertEqual(
+                    match.final_score_per_turn(),
+                    iu.compute_final_score_per_turn(expected),
+                )
+
+    def test_cycle_detection_short_circuits_the_match(self):
+        players = (axelrod.TitForTat(), axelrod.Alternator())
+        match = axelrod.Match(players, turns=10000, detect_cycles=True)
+        with mock.patch.object(
+            axelrod.Player, "play", autospec=True, side_effect=axelrod.Player.play
+        ) as play:
+            result = match.play()
+        self.assertLess(play.call_count, 10)
+        self.assertEqual(len(result), 10000)
+        self.assertEqual(match._cycle, (2, 2))
+        self.assertEqual(result[:3], [(C, C), (C, D), (D, C)])
+        self.assertEqual(result[-2:], [(D, C), (C, D)])
+        self.assertEqual(match.final_score(), (3 + 4999 * 5, 3 + 5000 * 5))
+        self.assertEqual(len(match.players[0].history), 10000)
+
+    def test_cycle_detection_is_opt_in(self):
+        match = axelrod.Match((axelrod.TitForTat(), axelrod.Alternator()), turns=10)
+        self.assertFalse(match._cycle_detection_available(10))
+        match.play()
+        self.assertIsNone(match._cycle)
+
+    def test_cycle_detection_not_available(self):
+        for players, noise in [
+            ((axelrod.TitForTat(), axelrod.Alternator()), 0.1),
+            ((axelrod.TitForTat(), axelrod.Random()), 0),
+            ((axelrod.TitForTat(), axelrod.Grudger()), 0),
+            ((axelrod.TitForTat(), axelrod.BackStabber()), 0),
+        ]:
+            match = axelrod.Match(players, turns=10, noise=noise, detect_cycles=True)
+            self.assertFalse(match._cycle_detection_available(10))
+        match = axelrod.Match(
+            (axelrod.TitForTat(), axelrod.Alternator()),
+            prob_end=0.1,
+            detect_cycles=True,
+        )
+        self.assertFalse(match._cycle_detection_available(float("inf")))
+
     def test_sparklines(self):
         players = (axelrod.Cooperator(), axelrod.Alternator())
         match = axelrod.Match(players, 4)
@@ -358,6 +444,134 @@ class TestMatch(unittest.TestCase):
         expected_sparklines = "XXXX\nXYXY"
         self.assertEqual(match.sparklines("X", "Y"), expected_sparklines)
 
+    def test_expected_normalised_state_distribution(self):
+        turns = 3
+        player1 = axelrod.MemoryOnePlayer((1, 1, 1, 1))
+        player2 = axelrod.MemoryOnePlayer((0, 0, 1, 1))
+
+        match = axelrod.Match((player1, player2), turns)
+        expected = match.expected_normalised_state_distribution()
+        self.assertEqual(match.result, [])
+        match.play()
+        distribution = match.normalised_state_distribution()
+        self.assertEqual(set(distribution), set(expected))
+        for state in expected:
+            self.assertAlmostEqual(distribution[state], expected[state])
+
+        player2 = axelrod.MemoryOnePlayer((0, 0, 0, 0))
+        match = axelrod.Match((player1, player2), turns, noise=0.1)
+        expected = Counter(
+            {(C, C): 0.09, (C, D): 0.81, (D, C): 0.01, (D, D): 0.09}
+        )
+        distribution = match.expected_normalised_state_distribution(stationary=True)
+        for state in expected:
+            self.assertAlmostEqual(distribution[state], expected[state])
+
+    def test_expected_final_score_per_turn(self):
+        turns = 3
+        player1 = axelrod.MemoryOnePlayer((1, 1, 1, 1))
+        player2 = axelrod.MemoryOnePlayer((0, 0, 1, 1))
+
+        game = axelrod.Game(r=4, s=0, t=6, p=1)
+        match = axelrod.Match((player1, player2), turns, game=game)
+        expected = match.expected_final_score_per_turn()
+        match.play()
+        for score, expected_score in zip(match.final_score_per_turn(), expected):
+            self.assertAlmostEqual(score, expected_score)
+
+    def test_expected_normalised_cooperation(self):
+        turns = 3
+        player1 = axelrod.MemoryOnePlayer((1, 1, 1, 1))
+        player2 = axelrod.MemoryOnePlayer((0, 0, 1, 1))
+
+        match = axelrod.Match((player1, player2), turns)
+        expected = match.expected_normalised_cooperation()
+        match.play()
+        for rate, expected_rate in zip(match.normalised_cooperation(), expected):
+            self.assertAlmostEqual(rate, expected_rate)
+
+        match = axelrod.Match((player1, player2), prob_end=0.5, noise=0.5)
+        for rate in match.expected_normalised_cooperation():
+            self.assertAlmostEqual(rate, 0.5)
+
+    def test_expected_outcomes_match_simulation(self):
+        axelrod.seed(0)
+        players = (axelrod.GTFT(p=0.5), axelrod.StochasticWSLS(0.2))
+        match = axelrod.Match(players, turns=20, noise=0.05)
+        expected = match.expected_final_score_per_turn()
+        scores = [match.play() and match.final_score_per_turn() for _ in range(500)]
+        for player_index in range(2):
+            mean = sum(score[player_index] for score in scores) / 500
+            self.assertAlmostEqual(mean, expected[player_index], places=1)
+
+    def test_expected_outcomes_require_memory_one_players(self):
+        match = axelrod.Match((axelrod.GTFT(), axelrod.TitForTat()), turns=5)
+        with self.assertRaises(ValueError):
+            match.expected_final_score_per_turn()
+
+    def test_expected_outcomes_of_infinite_match(self):
+        match = axelrod.Match((axelrod.GTFT(), axelrod.GTFT()), turns=float("inf"))
+        with self.assertRaises(ValueError):
+            match.expected_final_score_per_turn()
+        match.expected_final_score_per_turn(stationary=True)
+
+    def test_noise_masks(self):
+        axelrod.seed(0)
+        players = (axelrod.Cooperator(), axelrod.Defector())
+        match = axelrod.Match(players, turns=1000, noise=0.2)
+        self.assertIsNone(match.noise_masks)
+        interactions = match.play()
+        masks = match.noise_masks
+        self.assertEqual(masks.shape, (2, 1000))
+        self.assertAlmostEqual(masks.mean(), 0.2, places=1)
+        expected = [
+            (D if flip else C, C if coflip else D) for flip, coflip in zip(*masks)
+        ]
+        self.assertEqual(interactions, expected)
+
+        match = axelrod.Match(players, turns=5)
+        match.play()
+        self.assertIsNone(match.noise_masks)
+
+    def test_noise_masks_are_sampled_for_each_play(self):
+        axelrod.seed(0)
+        players = (axelrod.Cooperator(), axelrod.Defector())
+        match = axelrod.Match(players, turns=100, noise=0.5)
+        match.play()
+        masks = match.noise_masks
+        match.play()
+        self.assertFalse((masks == match.noise_masks).all())
+
+    def test_replay_noise_masks(self):
+        axelrod.seed(0)
+        players = (axelrod.GTFT(), axelrod.TitForTat())
+        match = axelrod.Match(players, turns=50, noise=0.1)
+        interactions = match.play()
+
+        axelrod.seed(0)
+        replay = axelrod.Match(
+            players, turns=50, noise=0.1, noise_masks=match.noise_masks
+        )
+        self.assertEqual(replay.play(), interactions)
+        self.assertTrue((replay.noise_masks == match.noise_masks).all())
+
+    def test_replay_noise_masks_without_noise(self):
+        players = (axelrod.TitForTat(), axelrod.TitForTat())
+        masks = [[False, True, False, False], [False, False, False, False]]
+        match = axelrod.Match(players, turns=3, noise_masks=masks)
+        self.assertTrue(match._stochastic)
+        self.assertFalse(match._cache_update_required)
+        self.assertEqual(match.play(), [(C, C), (D, C), (C, D)])
+        self.assertEqual(match.noise_masks.shape, (2, 3))
+
+    def test_replay_noise_masks_with_invalid_shape(self):
+        players = (axelrod.TitForTat(), axelrod.TitForTat())
+        with self.assertRaises(ValueError):
+            axelrod.Match(players, turns=3, noise_masks=[True, False, True])
+        match = axelrod.Match(players, turns=3, noise_masks=[[True], [False]])
+        with self.assertRaises(ValueError):
+            match.play()
+
 
 class TestSampleLength(unittest.TestCase):
     def test_sample_length(self):
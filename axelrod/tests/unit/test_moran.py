@@ -2,10 +2,18 @@ import itertools
 import random
 import unittest
 from collections import Counter
+from unittest import mock
 
 import axelrod
 import matplotlib.pyplot as plt
-from axelrod import ApproximateMoranProcess, MoranProcess, Pdf
+import numpy as np
+from axelrod import (
+    ApproximateMoranProcess,
+    CountMoranProcess,
+    MoranProcess,
+    Pdf,
+    type_payoff_matrix,
+)
 from axelrod.moran import fitness_proportionate_selection
 from axelrod.tests.property import strategy_lists
 
@@ -140,6 +148,35 @@ class TestMoranProcess(unittest.TestCase):
         self.assertEqual(fitness_proportionate_selection([1, 1, 1]), 0)
         self.assertEqual(fitness_proportionate_selection([1, 1, 1]), 2)
 
+    def test_fps_never_selects_zero_fitness(self):
+        axelrod.seed(0)
+        for _ in range(100):
+            self.assertIn(fitness_proportionate_selection([0, 2, 0, 1, 0]), [1, 3])
+        with mock.patch("random.random", return_value=0):
+            self.assertEqual(fitness_proportionate_selection([0, 0, 1]), 2)
+        with mock.patch("random.random", return_value=1):
+            self.assertEqual(fitness_proportionate_selection([0, 1, 1, 0]), 2)
+
+    def test_fps_with_exclude(self):
+        axelrod.seed(0)
+        for _ in range(100):
+            self.assertNotEqual(
+                fitness_proportionate_selection([1, 1, 1], exclude=1), 1
+            )
+        self.assertEqual(fitness_proportionate_selection([5, 0], exclude=0), 1)
+        self.assertEqual(fitness_proportionate_selection([0, 0], exclude=0), 1)
+        self.assertEqual(fitness_proportionate_selection([0, 0], exclude=1), 0)
+
+    def test_fps_with_fitness_transformation(self):
+        axelrod.seed(0)
+        selections = Counter(
+            fitness_proportionate_selection(
+                np.array([0, 1]), fitness_transformation=lambda score: 3 * score + 1
+            )
+            for _ in range(1000)
+        )
+        self.assertAlmostEqual(selections[1] / 1000, 0.8, places=1)
+
     def test_exit_condition(self):
         p1, p2 = axelrod.Cooperator(), axelrod.Cooperator()
         mp = MoranProcess((p1, p2))
@@ -419,6 +456,101 @@ class TestMoranProcess(unittest.TestCase):
             for _ in range(10):
                 next(mp)
 
+    def test_incremental_scores_give_the_same_process(self):
+        players = [
+            axelrod.Cooperator(),
+            axelrod.Defector(),
+            axelrod.TitForTat(),
+            axelrod.Grudger(),
+            axelrod.Alternator(),
+        ]
+        for seed, mutation_rate in [(0, 0), (1, 0.1)]:
+            processes = []
+            for incremental_scores in [False, True]:
+                axelrod.seed(seed)
+                mp = MoranProcess(
+                    players,
+                    turns=10,
+                    mutation_rate=mutation_rate,
+                    incremental_scores=incremental_scores,
+                )
+                for _ in itertools.islice(mp, 30):
+                    pass
+                processes.append(mp)
+            self.assertEqual(processes[0].populations, processes[1].populations)
+            for scores, expected_scores in zip(
+                processes[1].score_history, processes[0].score_history
+            ):
+                for score, expected in zip(scores, expected_scores):
+                    self.assertAlmostEqual(score, expected)
+
+    def test_incremental_scores_play_matches_of_replaced_player(self):
+        axelrod.seed(0)
+        players = [
+            axelrod.Cooperator(),
+            axelrod.Defector(),
+            axelrod.TitForTat(),
+            axelrod.Grudger(),
+            axelrod.Alternator(),
+        ]
+        mp = MoranProcess(players, turns=10, noise=0.1, incremental_scores=True)
+        self.assertTrue(mp.incremental_scores)
+        with mock.patch("axelrod.moran.Match", side_effect=axelrod.Match) as match:
+            next(mp)
+            self.assertEqual(match.call_count, 10 + 4)
+            next(mp)
+            self.assertEqual(match.call_count, 10 + 4 + 4)
+        self.assertEqual(mp._type_pair_scores, {})
+
+    def test_incremental_scores_reuse_deterministic_type_pairs(self):
+        axelrod.seed(0)
+        players = [axelrod.Cooperator() for _ in range(5)] + [
+            axelrod.Defector() for _ in range(5)
+        ]
+        mp = MoranProcess(players, turns=10, incremental_scores=True)
+        with mock.patch("axelrod.moran.Match", side_effect=axelrod.Match) as match:
+            mp.play()
+        self.assertLessEqual(match.call_count, 4)
+        self.assertEqual(
+            mp._type_pair_scores[("Cooperator", "Defector")], (0, 5)
+        )
+        scores = mp._score_table.copy()
+        mp._build_score_table()
+        self.assertTrue((scores == mp._score_table).all())
+
+    def test_fixate(self):
+        axelrod.seed(0)
+        players = [axelrod.Cooperator(), axelrod.Defector(), axelrod.TitForTat()]
+        mp = MoranProcess(players, turns=10)
+        name, rounds = mp.fixate()
+        self.assertEqual(name, mp.winning_strategy_name)
+        self.assertEqual(rounds, len(mp.populations) - 1)
+        self.assertEqual(mp.populations[-1], Counter({name: 3}))
+
+    def test_fill_type_pair_scores(self):
+        players = [axelrod.Cooperator(), axelrod.Defector(), axelrod.GTFT()]
+        mp = MoranProcess(players, turns=10, incremental_scores=True)
+        mp._fill_type_pair_scores()
+        self.assertEqual(
+            mp._type_pair_scores,
+            {
+                ("Cooperator", "Cooperator"): (3, 3),
+                ("Cooperator", "Defector"): (0, 5),
+                ("Defector", "Cooperator"): (5, 0),
+                ("Defector", "Defector"): (1, 1),
+            },
+        )
+
+    def test_incremental_scores_after_reset(self):
+        axelrod.seed(0)
+        players = [axelrod.Cooperator(), axelrod.Defector(), axelrod.TitForTat()]
+        mp = MoranProcess(players, turns=10, incremental_scores=True)
+        mp.play()
+        self.assertIsNotNone(mp._score_table)
+        mp.reset()
+        self.assertIsNone(mp._score_table)
+        self.assertEqual(mp.score_all(), [3.0, 6.4, 3.9])
+
 
 class GraphMoranProcess(unittest.TestCase):
     def test_complete(self):
@@ -513,6 +645,22 @@ class GraphMoranProcess(unittest.TestCase):
             winner2 = mp.winning_strategy_name
             self.assertEqual((winner == winner2), outcome)
 
+    def test_incremental_scores_on_graph(self):
+        """The score table is kept up to date on the matches of the
+        interaction graph."""
+        players = [axelrod.Cooperator(), axelrod.Defector()] * 3
+        graph = axelrod.graph.cycle(6, directed=True)
+        for mode in ["bd", "db"]:
+            axelrod.seed(2)
+            mp = MoranProcess(
+                players, interaction_graph=graph, mode=mode, incremental_scores=True
+            )
+            mp.play()
+            self.assertEqual(mp._partners[0], [1, 5])
+            scores = mp._score_table.copy()
+            mp._build_score_table()
+            self.assertTrue((scores == mp._score_table).all())
+
 
 class TestApproximateMoranProcess(unittest.TestCase):
     """A suite of tests for the ApproximateMoranProcess"""
@@ -560,3 +708,188 @@ class TestApproximateMoranProcess(unittest.TestCase):
         self.assertEqual(scores, (0, 5))
         scores = self.amp._get_scores_from_cache(("Defector", "Cooperator"))
         self.assertEqual(scores, (5, 0))
+
+
+class TestTypePayoffMatrix(unittest.TestCase):
+    def test_deterministic_players(self):
+        players = [axelrod.Cooperator(), axelrod.Defector(), axelrod.TitForTat()]
+        payoffs = type_payoff_matrix(players, turns=10)
+        expected = [[3, 0, 3], [5, 1, 1.4], [3, 0.9, 3]]
+        self.assertTrue(np.allclose(payoffs, expected))
+
+    def test_game(self):
+        game = axelrod.Game(r=4, s=0, t=6, p=1)
+        players = [axelrod.Cooperator(), axelrod.Defector()]
+        payoffs = type_payoff_matrix(players, turns=5, game=game)
+        self.assertTrue(np.allclose(payoffs, [[4, 0], [6, 1]]))
+
+    def test_stochastic_players_are_played_repeatedly(self):
+        players = [axelrod.Cooperator(), axelrod.Defector()]
+        axelrod.seed(0)
+        with mock.patch.object(
+            axelrod.Match, "play", autospec=True, side_effect=axelrod.Match.play
+        ) as play:
+            payoffs = type_payoff_matrix(players, turns=10, noise=0.1, repetitions=20)
+        self.assertEqual(play.call_count, 3 * 20)
+        self.assertAlmostEqual(payoffs[0, 1], 0.1 * 1 + 0.9 * 0.5, places=0)
+        self.assertGreater(payoffs[1, 0], payoffs[0, 1])
+
+
+class TestCountMoranProcess(unittest.TestCase):
+    def setUp(self):
+        self.payoffs = [[3, 0], [5, 1]]
+
+    def test_init(self):
+        mp = CountMoranProcess(self.payoffs, [2, 3])
+        self.assertEqual(mp.names, ["0", "1"])
+        self.assertEqual(list(mp.counts), [2, 3])
+        self.assertEqual(mp.population_size, 5)
+        self.assertEqual(mp.mutation_rate, 0)
+        self.assertEqual(mp.mode, "bd")
+        self.assertIsNone(mp.fitness_transformation)
+        self.assertTrue(mp.stop_on_fixation)
+        self.assertEqual(mp.populations, [Counter({"0": 2, "1": 3})])
+        self.assertFalse(mp.fixated)
+        self.assertIsNone(mp.winning_strategy_name)
+
+    def test_init_with_invalid_arguments(self):
+        for payoffs, counts, kwargs in [
+            ([[3, 0, 1], [5, 1, 1]], [2, 3], {}),
+            (self.payoffs, [2, -1], {}),
+            (self.payoffs, [1, 0], {}),
+            (self.payoffs, [2, 3], {"mutation_rate": 2}),
+            (self.payoffs, [2, 3], {"mode": "dd"}),
+        ]:
+            with self.assertRaises(ValueError):
+                CountMoranProcess(payoffs, counts, **kwargs)
+
+    def test_from_players(self):
+        players = [axelrod.TitForTat(), axelrod.Defector(), axelrod.TitForTat()]
+        mp = CountMoranProcess.from_players(players, turns=10, mode="db")
+        self.assertEqual(mp.names, ["Defector", "Tit For Tat"])
+        self.assertEqual(list(mp.counts), [1, 2])
+        self.assertTrue(np.allclose(mp.payoffs, [[1, 1.4], [0.9, 3]]))
+        self.assertEqual(mp.mode, "db")
+
+    def test_fitness_is_the_score_of_a_moran_process(self):
+        players = [axelrod.Cooperator(), axelrod.Defector(), axelrod.TitForTat()] * 2
+        players.append(axelrod.Grudger())
+        mp = MoranProcess(players, turns=10)
+        scores = mp.score_all()
+        count_mp = CountMoranProcess.from_players(players, turns=10)
+        fitness = dict(zip(count_mp.names, count_mp.fitness()))
+        for player, score in zip(players, scores):
+            self.assertAlmostEqual(fitness[str(player)], score)
+
+    def test_fitness_transformation(self):
+        mp = CountMoranProcess(
+            self.payoffs, [2, 3], fitness_transformation=lambda score: score + 1
+        )
+        self.assertEqual(list(mp.fitness()), [4, 13])
+        self.assertEqual(list(mp.fitness(np.array([1, 1]))), [1, 6])
+
+    def test_fixation_check(self):
+        mp = CountMoranProcess(self.payoffs, [0, 3], names=["C", "D"])
+        self.assertTrue(mp.fixated)
+        self.assertEqual(mp.winning_strategy_name, "D")
+        mp.counts[0] = 1
+        self.assertFalse(mp.fixation_check())
+
+    def test_play(self):
+        for mode in ["bd", "db"]:
+            axelrod.seed(0)
+            mp = CountMoranProcess(self.payoffs, [5, 5], names=["C", "D"], mode=mode)
+            populations = mp.play()
+            self.assertEqual(populations, mp.populations)
+            self.assertEqual(len(mp), len(populations))
+            self.assertEqual(populations[-1], Counter({"D": 10}))
+            self.assertEqual(mp.winning_strategy_name, "D")
+            for previous, population in zip(populations, populations[1:]):
+                self.assertEqual(sum(population.values()), 10)
+                self.assertLessEqual(abs(population["C"] - previous["C"]), 1)
+            with self.assertRaises(StopIteration):
+                next(mp)
+            mp.reset()
+            self.assertEqual(mp.populations, [Counter({"C": 5, "D": 5})])
+
+    def test_play_is_reproducible(self):
+        mp = CountMoranProcess(self.payoffs, [5, 5])
+        axelrod.seed(1)
+        populations = mp.play()
+        mp.reset()
+        axelrod.seed(1)
+        self.assertEqual(mp.play(), populations)
+
+    def test_mutation(self):
+        axelrod.seed(0)
+        mp = CountMoranProcess(
+            np.ones((3, 3)), [4, 0, 0], mutation_rate=0.5, stop_on_fixation=False
+        )
+        with self.assertRaises(ValueError):
+            mp.play()
+        with self.assertRaises(ValueError):
+            mp.fixate()
+        for _ in itertools.islice(mp, 50):
+            self.assertEqual(sum(mp.population_distribution().values()), 4)
+        self.assertEqual(len(mp), 51)
+        self.assertEqual(len(set().union(*mp.populations)), 3)
+
+    def test_no_stop_on_fixation(self):
+        mp = CountMoranProcess(self.payoffs, [0, 3], stop_on_fixation=False)
+        with self.assertRaises(ValueError):
+            mp.play()
+        next(mp)
+        self.assertEqual(mp.populations[-1], Counter({"1": 3}))
+
+    def test_change_probabilities(self):
+        payoffs = [[3, 1], [4, 2]]
+        mp = CountMoranProcess(payoffs, [1, 2])
+        changes = mp._change_probabilities()
+        # The fitness is 2 for the first type and 6 for the second one.
+        self.assertTrue(np.allclose(changes, [[0, 2 / 21], [2 / 7, 0]]))
+        mp = CountMoranProcess(payoffs, [1, 2], mode="db")
+        changes = mp._change_probabilities()
+        # Once a player of the first type is dead only the second type remains.
+        # Once a player of the second type is dead the fitness of the
+        # survivors is 1 and 4.
+        self.assertTrue(np.allclose(changes, [[0, 2 / 15], [1 / 3, 0]]))
+
+    def test_change_probabilities_when_all_fitnesses_are_zero(self):
+        # The player which reproduces is chosen uniformly.
+        mp = CountMoranProcess(np.zeros((2, 2)), [1, 3])
+        changes = mp._change_probabilities()
+        self.assertTrue(np.allclose(changes, [[0, 3 / 16], [3 / 16, 0]]))
+        mp = CountMoranProcess(np.zeros((2, 2)), [1, 3], mode="db")
+        changes = mp._change_probabilities()
+        self.assertTrue(np.allclose(changes, [[0, 1 / 4], [1 / 4, 0]]))
+
+    def test_fixate_when_all_fitnesses_are_zero(self):
+        axelrod.seed(0)
+        for mode in ["bd", "db"]:
+            mp = CountMoranProcess(np.zeros((2, 2)), [1, 1], mode=mode)
+            name, rounds = mp.fixate()
+            self.assertIn(name, ["0", "1"])
+            self.assertGreaterEqual(rounds, 1)
+            mp = CountMoranProcess(np.zeros((2, 2)), [2, 2], mode=mode)
+            populations = mp.play()
+            self.assertEqual(sum(populations[-1].values()), 4)
+            self.assertEqual(len(populations[-1]), 1)
+
+    def test_fixate(self):
+        axelrod.seed(0)
+        mp = CountMoranProcess(self.payoffs, [5, 5], names=["C", "D"])
+        name, rounds = mp.fixate()
+        self.assertEqual(name, "D")
+        self.assertGreaterEqual(rounds, 5)
+        self.assertTrue(mp.fixated)
+        self.assertEqual(len(mp.populations), 1)
+
+    def test_fixation_probability_of_neutral_mutant(self):
+        axelrod.seed(0)
+        for mode in ["bd", "db"]:
+            mp = CountMoranProcess(np.ones((2, 2)), [1, 4], mode=mode)
+            fixations = 0
+            for _ in range(2000):
+                mp.reset()
+                fixations += mp.fixate()[0] == "0"
+            self.assertAlmostEqual(fixations / 2000, 1 / 5, places=1)
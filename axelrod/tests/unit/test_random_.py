@@ -5,6 +5,12 @@ from collections import Counter
 
 import numpy
 from axelrod import Action, Pdf, random_choice, random_flip, seed
+from axelrod.random_ import (
+    RandomBuffer,
+    derive_seed,
+    random_mask,
+    use_random_buffer,
+)
 
 C, D = Action.C, Action.D
 
@@ -31,6 +37,19 @@ class TestRandom_(unittest.TestCase):
         self.assertEqual(numpy_random_numbers[0], numpy_random_numbers[1])
         self.assertEqual(stdlib_random_numbers[0], stdlib_random_numbers[1])
 
+    def test_derive_seed(self):
+        self.assertEqual(derive_seed(0, 1, 2, 3), derive_seed(0, 1, 2, 3))
+        seeds = {
+            derive_seed(root, *keys)
+            for root in range(3)
+            for keys in [(0, 1, 0), (1, 0, 0), (0, 1, 1), (0, 0)]
+        }
+        self.assertEqual(len(seeds), 12)
+        for derived_seed in seeds:
+            self.assertIsInstance(derived_seed, int)
+            self.assertTrue(0 <= derived_seed < 2**32)
+            seed(derived_seed)
+
     def test_seed_not_offset_by_deterministic_call(self):
         """Test that when called with p = 0 or 1, the random seed is not
         affected."""
@@ -49,6 +68,72 @@ class TestRandom_(unittest.TestCase):
         seed(1)
         self.assertEqual(C, random_flip(D, 0.2))
 
+    def test_random_mask(self):
+        self.assertFalse(random_mask(0, 10).any())
+        self.assertTrue(random_mask(1, (2, 5)).all())
+        seed(0)
+        mask = random_mask(0.2, 10000)
+        self.assertEqual(mask.dtype, bool)
+        self.assertAlmostEqual(mask.mean(), 0.2, places=1)
+        seed(0)
+        self.assertTrue((mask == random_mask(0.2, 10000)).all())
+
+
+class TestRandomBuffer(unittest.TestCase):
+    def tearDown(self):
+        use_random_buffer(block_size=0)
+
+    def test_init(self):
+        buffer = RandomBuffer(0, block_size=3)
+        self.assertEqual(buffer.block_size, 3)
+        numbers = [buffer.random() for _ in range(7)]
+        expected = numpy.random.default_rng(0).random(9)[:7]
+        self.assertEqual(numbers, list(expected))
+
+    def test_seed(self):
+        buffer = RandomBuffer(block_size=4)
+        buffer.seed(1)
+        numbers = [buffer.random() for _ in range(5)]
+        buffer.random()
+        buffer.seed(1)
+        self.assertEqual(numbers, [buffer.random() for _ in range(5)])
+
+    def test_random_array(self):
+        buffer = RandomBuffer(0)
+        array = buffer.random_array((2, 3))
+        self.assertEqual(array.shape, (2, 3))
+        self.assertTrue(((0 <= array) & (array < 1)).all())
+
+    def test_use_random_buffer(self):
+        buffer = use_random_buffer(0, block_size=8)
+        self.assertIsInstance(buffer, RandomBuffer)
+        actions = [random_choice(0.5) for _ in range(20)]
+        flips = [random_flip(C, 0.5) for _ in range(20)]
+        mask = random_mask(0.5, 20)
+
+        seed(0)
+        self.assertEqual(actions, [random_choice(0.5) for _ in range(20)])
+        self.assertEqual(flips, [random_flip(C, 0.5) for _ in range(20)])
+        self.assertTrue((mask == random_mask(0.5, 20)).all())
+
+        self.assertIsNone(use_random_buffer(block_size=0))
+        seed(0)
+        r = random.random()
+        seed(0)
+        random_choice(0.5)
+        self.assertNotEqual(r, random.random())
+
+    def test_deterministic_calls_do_not_draw(self):
+        use_random_buffer(0)
+        for p in [0, 1]:
+            seed(0)
+            r = random_choice(0.5)
+            seed(0)
+            random_choice(p)
+            random_flip(C, p)
+            random_mask(p, 5)
+            self.assertEqual(r, random_choice(0.5))
+
 
 class TestPdf(unittest.TestCase):
     """A suite of tests for the Pdf class"""
@@ -5,7 +5,11 @@ from collections import Counter
 import axelrod
 import axelrod.interaction_utils as iu
 import pandas as pd
-from axelrod.result_set import create_counter_dict
+from axelrod.result_set import (
+    ResultAccumulator,
+    ResultAggregator,
+    create_counter_dict,
+)
 from axelrod.tests.property import prob_end_tournaments, tournaments
 from numpy import mean, nanmedian, std
 
@@ -483,6 +487,84 @@ class TestResultSet(unittest.TestCase):
         results = tournament.play(progress_bar=False)
         self.assertNotEqual(results, rs_sets[0])
 
+    def test_init_from_result_accumulator(self):
+        rs = axelrod.ResultSet(
+            self.filename, self.players, self.repetitions, progress_bar=False
+        )
+        accumulator = ResultAccumulator()
+        for row in pd.read_csv(self.filename).itertuples(index=False):
+            accumulator.writerow(list(row))
+        self.assertEqual(len(accumulator), len(pd.read_csv(self.filename)))
+        in_memory_rs = axelrod.ResultSet(
+            None,
+            self.players,
+            self.repetitions,
+            progress_bar=False,
+            dataframe=accumulator.dataframe(),
+        )
+        self.assertIsNone(in_memory_rs.filename)
+        self.assertEqual(rs, in_memory_rs)
+        self.assertEqual(rs.state_distribution, in_memory_rs.state_distribution)
+        self.assertEqual(
+            rs.initial_cooperation_rate, in_memory_rs.initial_cooperation_rate
+        )
+
+    def test_init_from_result_aggregator(self):
+        rs = axelrod.ResultSet(
+            self.filename, self.players, self.repetitions, progress_bar=False
+        )
+        aggregator = ResultAggregator(self.players, self.repetitions)
+        for row in pd.read_csv(self.filename).itertuples(index=False):
+            aggregator.writerow(list(row))
+        self.assertEqual(aggregator.num_rows, len(pd.read_csv(self.filename)))
+        snapshot = aggregator.snapshot()
+        self.assertIsNone(snapshot.filename)
+        self.assertEqual(rs, snapshot)
+
+    def test_results_do_not_depend_on_the_order_of_the_interactions(self):
+        rs = axelrod.ResultSet(
+            self.filename, self.players, self.repetitions, progress_bar=False
+        )
+        df = pd.read_csv(self.filename)
+        shuffled_df = df.sample(frac=1, random_state=0)
+        shuffled_rs = axelrod.ResultSet(
+            None,
+            self.players,
+            self.repetitions,
+            progress_bar=False,
+            dataframe=shuffled_df,
+        )
+        self.assertEqual(rs, shuffled_rs)
+
+        aggregator = ResultAggregator(self.players, self.repetitions)
+        for row in shuffled_df.itertuples(index=False):
+            aggregator.writerow(list(row))
+        self.assertEqual(rs, aggregator.snapshot())
+
+    def test_result_aggregator_should_stop(self):
+        aggregator = ResultAggregator(self.players, self.repetitions)
+        self.assertFalse(aggregator.should_stop())
+        aggregator = ResultAggregator(
+            self.players,
+            self.repetitions,
+            stop=lambda aggregator: aggregator.num_rows >= 2,
+        )
+        rows = pd.read_csv(self.filename).itertuples(index=False)
+        aggregator.writerow(list(next(rows)))
+        self.assertFalse(aggregator.should_stop())
+        aggregator.writerow(list(next(rows)))
+        self.assertTrue(aggregator.should_stop())
+
+    def test_empty_result_aggregator(self):
+        aggregator = ResultAggregator(self.players, self.repetitions)
+        snapshot = aggregator.snapshot()
+        n = len(self.players)
+        self.assertEqual(
+            snapshot.match_lengths, [[[0] * n] * n] * self.repetitions
+        )
+        self.assertEqual(snapshot.wins, [[0] * self.repetitions] * n)
+        self.assertEqual(snapshot.payoffs, [[[]] * n] * n)
+
     def test_summarise(self):
         rs = axelrod.ResultSet(
             self.filename, self.players, self.repetitions, progress_bar=False
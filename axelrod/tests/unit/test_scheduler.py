@@ -0,0 +1,182 @@
+import os
+import tempfile
+import unittest
+
+import axelrod
+from axelrod.scheduler import (
+    LONG_RUN_TIME_COST,
+    TURN_OVERHEAD,
+    estimate_costs,
+    expected_length,
+    player_cost,
+    profile_strategies,
+    read_profile,
+    schedule_chunks,
+    write_profile,
+)
+
+
+class TestScheduler(unittest.TestCase):
+    def setUp(self):
+        self.players = [
+            axelrod.Cooperator(),
+            axelrod.Defector(),
+            axelrod.TitForTat(),
+            axelrod.DBS(),
+        ]
+        self.match_generator = axelrod.MatchGenerator(
+            players=self.players, repetitions=10, turns=20
+        )
+        self.chunks = list(self.match_generator.build_match_chunks())
+
+    def test_player_cost(self):
+        self.assertEqual(player_cost(axelrod.Cooperator()), 1)
+        self.assertEqual(player_cost(axelrod.DBS()), LONG_RUN_TIME_COST)
+
+    def test_expected_length(self):
+        self.assertEqual(expected_length({"turns": 20, "prob_end": None}), 20)
+        self.assertEqual(expected_length({"turns": float("inf"), "prob_end": 0.5}), 2)
+        self.assertEqual(expected_length({"turns": 20, "prob_end": 0.01}), 20)
+        self.assertEqual(
+            expected_length({"turns": None, "prob_end": None}), axelrod.DEFAULT_TURNS
+        )
+
+    def test_estimate_costs(self):
+        costs = estimate_costs(self.chunks, self.players)
+        expected = [
+            20 * sum(player_cost(self.players[i]) for i in index_pair)
+            for index_pair, _, _ in self.chunks
+        ]
+        self.assertEqual(costs, expected)
+
+    def test_estimate_costs_with_timings(self):
+        timings = {(0, 0): 0.5}
+        costs = estimate_costs(self.chunks, self.players, timings)
+        # (0, 0) is estimated at 40, so each unit of estimate is 1 / 80 seconds.
+        for (index_pair, _, _), cost, estimate in zip(
+            self.chunks, costs, estimate_costs(self.chunks, self.players)
+        ):
+            if index_pair == (0, 0):
+                self.assertEqual(cost, 0.5)
+            else:
+                self.assertAlmostEqual(cost, estimate / 80)
+
+    def test_schedule_chunks_keeps_all_repetitions(self):
+        for workers in [1, 2, 4, 16]:
+            batches = schedule_chunks(self.chunks, self.players, workers)
+            repetitions = {}
+            for batch in batches:
+                for index_pair, match_params, reps in batch:
+                    self.assertGreater(reps, 0)
+                    self.assertEqual(match_params["turns"], 20)
+                    repetitions[index_pair] = repetitions.get(index_pair, 0) + reps
+            self.assertEqual(
+                repetitions, {index_pair: 10 for index_pair, _, _ in self.chunks}
+            )
+
+    def test_schedule_chunks_splits_and_batches(self):
+        batches = schedule_chunks(self.chunks, self.players, workers=2)
+        costs = dict(
+            zip(
+                [index_pair for index_pair, _, _ in self.chunks],
+                estimate_costs(self.chunks, self.players),
+            )
+        )
+        batch_costs = [
+            sum(costs[index_pair] * reps for index_pair, _, reps in batch)
+            for batch in batches
+        ]
+        # The match of DBS against itself is split across repetitions.
+        self.assertGreater(
+            sum(1 for batch in batches for chunk in batch if chunk[0] == (3, 3)), 1
+        )
+        # The cheap pairs are batched together.
+        self.assertTrue(any(len(batch) > 1 for batch in batches))
+        self.assertEqual(batch_costs, sorted(batch_costs, reverse=True))
+
+    def test_schedule_chunks_numbers_the_repetitions(self):
+        batches = schedule_chunks(self.chunks, self.players, workers=4)
+        repetitions = {}
+        for batch in batches:
+            for index_pair, match_params, reps in batch:
+                first = match_params["first_repetition"]
+                repetitions.setdefault(index_pair, []).extend(
+                    range(first, first + reps)
+                )
+        for index_pair, numbers in repetitions.items():
+            self.assertEqual(sorted(numbers), list(range(10)))
+
+        chunks = [
+            (index_pair, {"turns": 20, "first_repetition": 6}, 4)
+            for index_pair, _, _ in self.chunks
+        ]
+        batches = schedule_chunks(chunks, self.players, workers=4)
+        firsts = [chunk[1]["first_repetition"] for batch in batches for chunk in batch]
+        self.assertEqual(min(firsts), 6)
+        self.assertTrue(all(first < 10 for first in firsts))
+
+    def test_schedule_chunks_does_not_share_match_parameters(self):
+        batches = schedule_chunks(self.chunks, self.players, workers=4)
+        parameters = [id(chunk[1]) for batch in batches for chunk in batch]
+        self.assertEqual(len(parameters), len(set(parameters)))
+
+
+class TestProfile(unittest.TestCase):
+    def setUp(self):
+        self.profile = {
+            "Cooperator": 1e-6,
+            "Defector": 2e-6,
+            "Tit For Tat": 4e-6,
+            TURN_OVERHEAD: 1e-5,
+        }
+
+    def test_profile_strategies(self):
+        strategies = [axelrod.Cooperator, axelrod.Alternator, axelrod.FirstByDavis]
+        profile = profile_strategies(strategies, turns=10, repetitions=2)
+        self.assertEqual(set(profile), {s.name for s in strategies} | {TURN_OVERHEAD})
+        for seconds in profile.values():
+            self.assertGreaterEqual(seconds, 0)
+
+    def test_profile_strategies_with_opponents(self):
+        profile = profile_strategies(
+            [axelrod.TitForTat], turns=5, opponents=[axelrod.Defector]
+        )
+        self.assertEqual(set(profile), {"Tit For Tat", TURN_OVERHEAD})
+
+    def test_profile_calls_the_strategy_every_turn(self):
+        # Finite state machines would otherwise be played on their transitions.
+        profile = profile_strategies([axelrod.Fortress3], turns=20)
+        self.assertGreater(profile["Fortress3"], 0)
+
+    def test_write_and_read_profile(self):
+        tmp_file = tempfile.NamedTemporaryFile(delete=False)
+        tmp_file.close()
+        write_profile(self.profile, tmp_file.name)
+        self.assertEqual(read_profile(tmp_file.name), self.profile)
+
+        with open(tmp_file.name, "w") as file_obj:
+            file_obj.write("Interaction index,Player index\n")
+        with self.assertRaises(ValueError):
+            read_profile(tmp_file.name)
+        os.remove(tmp_file.name)
+
+    def test_player_cost_with_profile(self):
+        self.assertEqual(player_cost(axelrod.Defector(), self.profile), 2e-6)
+        # Unknown strategies are given the median time of the known ones.
+        self.assertEqual(player_cost(axelrod.Alternator(), self.profile), 2e-6)
+        self.assertEqual(
+            player_cost(axelrod.DBS(), self.profile), 2e-6 * LONG_RUN_TIME_COST
+        )
+        self.assertEqual(player_cost(axelrod.DBS(), {TURN_OVERHEAD: 1}), 0)
+
+    def test_estimate_costs_with_profile(self):
+        players = [axelrod.Cooperator(), axelrod.TitForTat()]
+        chunks = list(
+            axelrod.MatchGenerator(
+                players=players, repetitions=3, turns=10
+            ).build_match_chunks()
+        )
+        costs = estimate_costs(chunks, players, profile=self.profile)
+        expected = [10 * (1e-5 + 2e-6), 10 * (1e-5 + 5e-6), 10 * (1e-5 + 8e-6)]
+        for cost, expected_cost in zip(costs, expected):
+            self.assertAlmostEqual(cost, expected_cost)
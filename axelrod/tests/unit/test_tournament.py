@@ -8,6 +8,7 @@ import os
 import pickle
 import unittest
 import warnings
+from collections import Counter
 from multiprocessing import Queue, cpu_count
 from unittest.mock import MagicMock, patch
 
@@ -687,6 +688,347 @@ class TestTournament(unittest.TestCase):
         # Check that matches no longer exist
         self.assertEqual((len(list(chunk_generator))), 0)
 
+    def test_play_changes_batch_memory_one(self):
+        self.assertFalse(self.test_tournament.batch_memory_one)
+
+        self.test_tournament.play(progress_bar=False, batch_memory_one=True)
+        self.assertTrue(self.test_tournament.batch_memory_one)
+
+        self.test_tournament.play(progress_bar=False)
+        self.assertFalse(self.test_tournament.batch_memory_one)
+
+    @patch("axelrod.tournament.BatchMatch", wraps=axelrod.BatchMatch)
+    def test_play_matches_with_batch_memory_one(self, batch_match):
+        players = [
+            axelrod.WinStayLoseShift(),
+            axelrod.WinShiftLoseStay(),
+            axelrod.TitForTat(),
+        ]
+        tournament = axelrod.Tournament(players, turns=10, repetitions=3)
+        expected = {}
+        for index_pair in [(0, 1), (0, 2)]:
+            chunk = (index_pair, {"turns": 10, "game": self.game}, 3)
+            expected.update(tournament._play_matches(chunk))
+        self.assertEqual(batch_match.call_count, 0)
+
+        tournament.batch_memory_one = True
+        for index_pair in [(0, 1), (0, 2)]:
+            chunk = (index_pair, {"turns": 10, "game": self.game}, 3)
+            self.assertEqual(
+                tournament._play_matches(chunk)[index_pair], expected[index_pair]
+            )
+        # Only the pair of memory one players is played in a batch
+        self.assertEqual(batch_match.call_count, 1)
+
+    def test_play_matches_with_batch_memory_one_and_seed(self):
+        players = [axelrod.GTFT(), axelrod.StochasticWSLS()]
+        tournament = axelrod.Tournament(
+            players, turns=20, repetitions=20, noise=0.05, seed=3
+        )
+        tournament.batch_memory_one = True
+        chunk = ((0, 1), {"turns": 20, "game": self.game, "noise": 0.05}, 20)
+        expected = tournament._play_matches(chunk)[(0, 1)]
+        self.assertEqual(tournament._play_matches(chunk)[(0, 1)], expected)
+        # Splitting the repetitions between chunks does not change them
+        interactions = []
+        for first in (0, 10):
+            params = {
+                "turns": 20,
+                "game": self.game,
+                "noise": 0.05,
+                "first_repetition": first,
+            }
+            interactions += tournament._play_matches(((0, 1), params, 10))[(0, 1)]
+        self.assertEqual(interactions, expected)
+
+    def test_batch_memory_one_play(self):
+        players = [
+            axelrod.GTFT(),
+            axelrod.StochasticWSLS(),
+            axelrod.ReactivePlayer((1, 0.3)),
+            axelrod.TitForTat(),
+        ]
+        tournament = axelrod.Tournament(players, turns=20, repetitions=4, noise=0.05)
+        results = tournament.play(progress_bar=False, batch_memory_one=True)
+        self.assertEqual(tournament.num_interactions, 40)
+        self.assertEqual(results.repetitions, 4)
+        self.assertEqual(results.match_lengths, [[[20] * 4] * 4] * 4)
+
+    def test_play_changes_array_history(self):
+        self.assertFalse(self.test_tournament.array_history)
+
+        self.test_tournament.play(progress_bar=False, array_history=True)
+        self.assertTrue(self.test_tournament.array_history)
+
+        self.test_tournament.play(progress_bar=False)
+        self.assertFalse(self.test_tournament.array_history)
+
+    def test_play_matches_with_array_history(self):
+        players = [axelrod.TitForTat(), axelrod.Random(), axelrod.GoByMajority()]
+        tournament = axelrod.Tournament(players, turns=20, repetitions=2)
+        chunk = ((0, 2), {"turns": 20, "game": self.game}, 2)
+        expected = tournament._play_matches(chunk)
+
+        tournament.array_history = True
+        with patch.object(
+            axelrod.ArrayHistory,
+            "append",
+            autospec=True,
+            side_effect=axelrod.ArrayHistory.append,
+        ) as append:
+            results = tournament._play_matches(chunk)
+        self.assertEqual(append.call_count, 2 * 20)
+        self.assertEqual(results, expected)
+
+    def test_play_changes_in_memory(self):
+        self.assertFalse(self.test_tournament.in_memory)
+
+        self.test_tournament.play(progress_bar=False, in_memory=True)
+        self.assertTrue(self.test_tournament.in_memory)
+        self.assertIsNone(self.test_tournament.filename)
+        self.assertIsNone(self.test_tournament._temp_file_descriptor)
+
+        self.test_tournament.play(progress_bar=False)
+        self.assertFalse(self.test_tournament.in_memory)
+        self.assertIsInstance(self.test_tournament._temp_file_descriptor, int)
+
+    def test_in_memory_play(self):
+        for processes in [None, 2]:
+            tournament = axelrod.Tournament(
+                players=self.players, game=self.game, turns=20, repetitions=3
+            )
+            results = tournament.play(progress_bar=False, processes=processes)
+            with patch("axelrod.tournament.mkstemp") as mkstemp:
+                in_memory_results = tournament.play(
+                    progress_bar=False, processes=processes, in_memory=True
+                )
+            self.assertFalse(mkstemp.called)
+            self.assertEqual(results, in_memory_results)
+
+    def test_in_memory_play_without_results(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            results = self.test_tournament.play(
+                progress_bar=False, in_memory=True, build_results=False
+            )
+        self.assertIsNone(results)
+        self.assertEqual(self.test_tournament.num_interactions, 15)
+
+    def test_in_memory_play_with_filename(self):
+        with self.assertRaises(ValueError):
+            self.test_tournament.play(
+                progress_bar=False, in_memory=True, filename=self.filename
+            )
+
+    def test_play_changes_aggregator(self):
+        self.assertIsNone(self.test_tournament.aggregator)
+        aggregator = axelrod.ResultAggregator(
+            [str(player) for player in self.players], 1
+        )
+        self.test_tournament.play(progress_bar=False, aggregator=aggregator)
+        self.assertIs(self.test_tournament.aggregator, aggregator)
+        self.assertEqual(aggregator.num_rows, 30)
+
+    def test_aggregator_play(self):
+        for processes in [None, 2]:
+            tournament = axelrod.Tournament(
+                players=self.players,
+                game=self.game,
+                turns=20,
+                repetitions=3,
+                noise=0.1,
+                seed=1,
+            )
+            expected = tournament.play(progress_bar=False, processes=processes)
+            for options in [{}, {"in_memory": True}, {"filename": self.filename}]:
+                aggregator = axelrod.ResultAggregator(
+                    [str(player) for player in self.players], 3
+                )
+                results = tournament.play(
+                    progress_bar=False,
+                    processes=processes,
+                    aggregator=aggregator,
+                    **options
+                )
+                self.assertEqual(results, expected)
+                self.assertEqual(results, aggregator.snapshot())
+
+    def test_aggregator_play_without_output(self):
+        aggregator = axelrod.ResultAggregator(
+            [str(player) for player in self.players], 1
+        )
+        with patch("axelrod.tournament.mkstemp") as mkstemp:
+            results = self.test_tournament.play(
+                progress_bar=False, aggregator=aggregator
+            )
+        self.assertFalse(mkstemp.called)
+        self.assertIsNone(self.test_tournament.filename)
+        self.assertEqual(aggregator.num_rows, 30)
+        self.assertIsNone(results.filename)
+        self.assertEqual(results, aggregator.snapshot())
+
+    def test_aggregator_stops_play(self):
+        with axelrod.BrokerExecutor(local_workers=1) as executor:
+            for options in [{}, {"processes": 2}, {"executor": executor}]:
+                tournament = axelrod.Tournament(
+                    players=self.players, game=self.game, turns=20, repetitions=3
+                )
+                aggregator = axelrod.ResultAggregator(
+                    [str(player) for player in self.players],
+                    3,
+                    stop=lambda aggregator: aggregator.num_rows > 0,
+                )
+                with warnings.catch_warnings():
+                    warnings.simplefilter("ignore", RuntimeWarning)
+                    results = tournament.play(
+                        progress_bar=False, aggregator=aggregator, **options
+                    )
+                    # Only the matches of the first chunk are played
+                    self.assertEqual(tournament.num_interactions, 3)
+                    self.assertEqual(results, aggregator.snapshot())
+
+    def test_aggregator_play_without_results(self):
+        aggregator = axelrod.ResultAggregator(
+            [str(player) for player in self.players], 1
+        )
+        with self.assertRaises(ValueError):
+            self.test_tournament.play(
+                progress_bar=False, build_results=False, aggregator=aggregator
+            )
+
+    def test_play_changes_adaptive_chunking(self):
+        self.assertFalse(self.test_tournament.adaptive_chunking)
+        self.assertEqual(self.test_tournament.timings, {})
+        self.test_tournament.play(progress_bar=False, adaptive_chunking=True)
+        self.assertTrue(self.test_tournament.adaptive_chunking)
+        self.assertEqual(len(self.test_tournament.timings), 15)
+        self.test_tournament.play(progress_bar=False)
+        self.assertFalse(self.test_tournament.adaptive_chunking)
+
+    def test_adaptive_chunking_play(self):
+        for processes in [None, 2]:
+            tournament = axelrod.Tournament(
+                players=self.players, game=self.game, turns=20, repetitions=5
+            )
+            results = tournament.play(progress_bar=False, processes=processes)
+            adaptive_results = tournament.play(
+                progress_bar=False, processes=processes, adaptive_chunking=True
+            )
+            self.assertEqual(results, adaptive_results)
+            # The timings of the first play are used to schedule the second.
+            adaptive_results = tournament.play(
+                progress_bar=False, processes=processes, adaptive_chunking=True
+            )
+            self.assertEqual(results, adaptive_results)
+
+    @patch("tqdm.tqdm", RecordedTQDM)
+    def test_adaptive_chunking_progress_bar(self):
+        tournament = axelrod.Tournament(
+            players=self.players, game=self.game, turns=2, repetitions=20
+        )
+        RecordedTQDM.reset_record()
+        tournament.play(processes=2, adaptive_chunking=True)
+        play_pbar = RecordedTQDM.record[0]
+        self.assert_play_pbar_correct_total_and_finished(play_pbar, total=15)
+
+    def test_estimate_runtime(self):
+        players = [axelrod.Cooperator(), axelrod.Defector()]
+        tournament = axelrod.Tournament(players, turns=10, repetitions=4)
+        profile = {"Cooperator": 1.0, "Defector": 2.0, "Turn overhead": 0.5}
+        # Pairs cost 2.5, 3.5 and 4.5 seconds per turn.
+        self.assertAlmostEqual(tournament.estimate_runtime(profile), 10 * 4 * 10.5)
+        with patch("axelrod.tournament.cpu_count", return_value=2):
+            self.assertAlmostEqual(
+                tournament.estimate_runtime(profile, processes=2), 10 * 4 * 10.5 / 2
+            )
+            tournament = axelrod.Tournament(players, turns=10, repetitions=1)
+            tournament.match_generator.edges = [(1, 1)]
+            self.assertAlmostEqual(
+                tournament.estimate_runtime(profile, processes=2), 45
+            )
+
+    def test_play_with_profile(self):
+        profile = {str(player): 1e-6 for player in self.players}
+        results = self.test_tournament.play(progress_bar=False)
+        profile_results = self.test_tournament.play(
+            progress_bar=False, adaptive_chunking=True, profile=profile
+        )
+        self.assertIs(self.test_tournament.profile, profile)
+        self.assertEqual(results, profile_results)
+
+    def test_worker_with_batch(self):
+        tournament = axelrod.Tournament(
+            players=self.players, game=self.game, turns=5, repetitions=4
+        )
+        chunks = list(tournament.match_generator.build_match_chunks())
+        batch = [
+            (chunks[0][0], dict(chunks[0][1]), 1),
+            (chunks[0][0], dict(chunks[0][1]), 3),
+            chunks[1],
+        ]
+        work_queue = Queue()
+        work_queue.put(batch)
+        work_queue.put("STOP")
+        done_queue = Queue()
+        tournament._worker(work_queue, done_queue)
+        interactions, timings = done_queue.get()
+        self.assertEqual([first for first, _ in interactions], [0, 0, 0])
+        self.assertEqual(
+            [
+                len(results[chunk[0]])
+                for (_, results), chunk in zip(interactions, batch)
+            ],
+            [1, 3, 4],
+        )
+        self.assertEqual(
+            [timing[:2] for timing in timings],
+            [(chunks[0][0], 1), (chunks[0][0], 3), (chunks[1][0], 4)],
+        )
+        self.assertEqual(done_queue.get(), "STOP")
+
+    def test_expected_outcomes(self):
+        players = [
+            axelrod.GTFT(),
+            axelrod.StochasticWSLS(),
+            axelrod.MemoryOnePlayer((0, 0, 1, 1)),
+        ]
+        tournament = axelrod.Tournament(players, turns=10, noise=0.1)
+        payoffs = tournament.expected_payoff_matrix()
+        cooperation = tournament.expected_normalised_cooperation()
+        distributions = tournament.expected_normalised_state_distribution()
+        for index_pair in [(0, 1), (0, 2), (1, 2)]:
+            player1, player2 = (players[index].clone() for index in index_pair)
+            match = axelrod.Match((player1, player2), turns=10, noise=0.1)
+            expected_payoffs = match.expected_final_score_per_turn()
+            expected_cooperation = match.expected_normalised_cooperation()
+            expected_distribution = match.expected_normalised_state_distribution()
+            for index, (row, column) in enumerate([index_pair, index_pair[::-1]]):
+                self.assertEqual(payoffs[row][column], expected_payoffs[index])
+                self.assertEqual(cooperation[row][column], expected_cooperation[index])
+            row, column = index_pair
+            self.assertEqual(distributions[row][column], expected_distribution)
+            for state, value in expected_distribution.items():
+                self.assertEqual(distributions[column][row][state[::-1]], value)
+
+        stationary_payoffs = tournament.expected_payoff_matrix(stationary=True)
+        self.assertNotEqual(payoffs, stationary_payoffs)
+
+    def test_expected_outcomes_with_edges(self):
+        players = [axelrod.GTFT(), axelrod.StochasticWSLS(), axelrod.FirmButFair()]
+        tournament = axelrod.Tournament(players, turns=10, edges=[(0, 1), (1, 2)])
+        payoffs = tournament.expected_payoff_matrix()
+        self.assertEqual(payoffs[0][2], 0)
+        self.assertEqual(payoffs[2][0], 0)
+        self.assertGreater(payoffs[0][1], 0)
+        distributions = tournament.expected_normalised_state_distribution()
+        self.assertEqual(distributions[0][2], Counter())
+
+    def test_expected_outcomes_require_memory_one_players(self):
+        players = [axelrod.GTFT(), axelrod.TitForTat()]
+        tournament = axelrod.Tournament(players, turns=10)
+        with self.assertRaises(ValueError):
+            tournament.expected_payoff_matrix()
+
     def test_match_cache_is_used(self):
         """
         Create two Random players that are classified as deterministic.
@@ -701,6 +1043,66 @@ class TestTournament(unittest.TestCase):
         for player_scores in results.scores:
             self.assertEqual(player_scores[0], player_scores[1])
 
+    def test_deterministic_cache_is_shared_between_tournaments(self):
+        cache = axelrod.PersistentDeterministicCache()
+        players = [axelrod.TitForTat(), axelrod.Alternator(), axelrod.Grudger()]
+        tournament = axelrod.Tournament(
+            players, turns=5, repetitions=2, deterministic_cache=cache
+        )
+        results = tournament.play(progress_bar=False)
+        self.assertEqual(len(cache), 6)
+
+        tournament = axelrod.Tournament(
+            players, turns=5, repetitions=2, deterministic_cache=cache
+        )
+        with patch.object(axelrod.Player, "play") as play:
+            cached_results = tournament.play(progress_bar=False)
+        play.assert_not_called()
+        self.assertEqual(results.scores, cached_results.scores)
+
+    def test_deterministic_cache_keyed_on_names_is_rejected(self):
+        with self.assertRaises(ValueError):
+            axelrod.Tournament(
+                self.players, deterministic_cache=axelrod.DeterministicCache()
+            )
+
+    def test_deterministic_cache_with_players_of_the_same_name(self):
+        players = [axelrod.Cycler("CD"), axelrod.Cycler("CCD"), axelrod.TitForTat()]
+        self.assertEqual(players[0].name, players[1].name)
+        tournament = axelrod.Tournament(players, turns=6, repetitions=1)
+        expected = tournament.play(progress_bar=False).payoff_matrix
+        for cache in (
+            axelrod.PersistentDeterministicCache(),
+            axelrod.SharedDeterministicCache(),
+        ):
+            tournament = axelrod.Tournament(
+                players, turns=6, repetitions=1, deterministic_cache=cache
+            )
+            results = tournament.play(progress_bar=False)
+            self.assertEqual(results.payoff_matrix, expected)
+            self.assertEqual(len(cache), 6)
+
+    def test_shared_deterministic_cache_in_parallel(self):
+        cache = axelrod.SharedDeterministicCache()
+        players = [axelrod.TitForTat(), axelrod.Alternator(), axelrod.Grudger()]
+        tournament = axelrod.Tournament(
+            players, turns=5, repetitions=2, deterministic_cache=cache
+        )
+        results = tournament.play(progress_bar=False, processes=2)
+        self.assertEqual(len(cache), 6)
+        self.assertEqual(
+            cache[(axelrod.TitForTat(), axelrod.Alternator())],
+            [(C, C), (C, D), (D, C), (C, D), (D, C)],
+        )
+
+        tournament = axelrod.Tournament(
+            players, turns=5, repetitions=2, deterministic_cache=cache
+        )
+        with patch.object(axelrod.Player, "play") as play:
+            cached_results = tournament.play(progress_bar=False)
+        play.assert_not_called()
+        self.assertEqual(results.scores, cached_results.scores)
+
     def test_write_interactions(self):
         tournament = axelrod.Tournament(
             name=self.test_name,
@@ -751,6 +1153,247 @@ class TestTournament(unittest.TestCase):
         )
         self.assertTrue(df.equals(expected_df))
 
+    def test_write_to_binary_log_with_results(self):
+        tournament = axelrod.Tournament(
+            name=self.test_name,
+            players=self.players,
+            game=self.game,
+            turns=2,
+            repetitions=2,
+        )
+        filename = "test_outputs/test_tournament.log"
+        results = tournament.play(
+            filename=filename, progress_bar=False, output_format="binary"
+        )
+        self.assertTrue(axelrod.interaction_log.is_interaction_log(filename))
+        df = axelrod.interaction_log.read_interaction_log(filename)
+        expected_df = pd.read_csv("test_outputs/expected_test_tournament.csv")
+        self.assertTrue(df.equals(expected_df))
+
+        expected_results = axelrod.ResultSet(
+            "test_outputs/expected_test_tournament.csv",
+            players=[str(p) for p in self.players],
+            repetitions=2,
+            progress_bar=False,
+        )
+        self.assertEqual(results, expected_results)
+
+    def test_write_to_binary_log_without_results(self):
+        tournament = axelrod.Tournament(
+            name=self.test_name,
+            players=self.players,
+            game=self.game,
+            turns=2,
+            repetitions=2,
+        )
+        filename = "test_outputs/test_tournament.log"
+        tournament.play(
+            filename=filename,
+            progress_bar=False,
+            build_results=False,
+            output_format="binary",
+        )
+        df = axelrod.interaction_log.read_interaction_log(filename)
+        expected_df = pd.read_csv(
+            "test_outputs/expected_test_tournament_no_results.csv"
+        )
+        self.assertTrue(df.equals(expected_df))
+
+    def test_binary_log_in_parallel(self):
+        tournament = axelrod.Tournament(
+            players=self.players, game=self.game, turns=20, repetitions=3
+        )
+        results = tournament.play(progress_bar=False, processes=2)
+        binary_results = tournament.play(
+            progress_bar=False, processes=2, output_format="binary"
+        )
+        self.assertEqual(tournament.output_format, "binary")
+        self.assertEqual(results, binary_results)
+
+    def test_play_raises_error_for_unknown_output_format(self):
+        with self.assertRaises(ValueError):
+            self.test_tournament.play(progress_bar=False, output_format="parquet")
+
+    def interrupted_play(self, tournament, chunks, **kwargs):
+        """Plays a tournament with a checkpoint, interrupting it after the
+        results of the given number of chunks are written."""
+        write_chunk_results = tournament._write_chunk_results
+        written = []
+
+        def interrupt(results, writer):
+            if len(written) == chunks:
+                raise KeyboardInterrupt
+            written.append(results)
+            return write_chunk_results(results, writer)
+
+        with patch.object(tournament, "_write_chunk_results", interrupt):
+            with self.assertRaises(KeyboardInterrupt):
+                tournament.play(
+                    progress_bar=False,
+                    checkpoint="test_outputs/test_tournament.checkpoint",
+                    checkpoint_interval=0,
+                    **kwargs
+                )
+
+    def test_seeded_play_does_not_depend_on_how_matches_are_played(self):
+        players = [
+            axelrod.StochasticCooperator(),
+            axelrod.GTFT(),
+            axelrod.TitForTat(),
+            axelrod.StochasticWSLS(),
+            axelrod.Grudger(),
+        ]
+
+        def play(seed=0, **kwargs):
+            tournament = axelrod.Tournament(
+                players=players, turns=10, repetitions=4, noise=0.1, seed=seed
+            )
+            return tournament.play(progress_bar=False, **kwargs)
+
+        results = play()
+        axelrod.seed(1)
+        self.assertEqual(play(), results)
+        self.assertEqual(play(processes=2), results)
+        self.assertEqual(play(adaptive_chunking=True), results)
+        with axelrod.BrokerExecutor(local_workers=2, workers=4) as executor:
+            self.assertEqual(play(executor=executor, adaptive_chunking=True), results)
+        self.assertNotEqual(play(seed=1), results)
+
+    def test_seeded_play_with_prob_end(self):
+        tournament = axelrod.Tournament(
+            players=[axelrod.StochasticCooperator(), axelrod.TitForTat()],
+            prob_end=0.2,
+            noise=0.1,
+            repetitions=5,
+            seed=3,
+        )
+        results = tournament.play(progress_bar=False)
+        adaptive_results = tournament.play(progress_bar=False, adaptive_chunking=True)
+        self.assertEqual(results, adaptive_results)
+
+    def test_play_matches_from_first_repetition(self):
+        tournament = axelrod.Tournament(
+            players=[axelrod.GTFT(), axelrod.StochasticWSLS()],
+            turns=10,
+            repetitions=4,
+            seed=5,
+        )
+        chunk = ((0, 1), {"turns": 10, "noise": 0.2}, 4)
+        interactions = tournament._play_matches(chunk)[(0, 1)]
+        match_params = {"turns": 10, "noise": 0.2, "first_repetition": 2}
+        later_interactions = tournament._play_matches(((0, 1), match_params, 2))
+        self.assertEqual(later_interactions[(0, 1)], interactions[2:])
+        self.assertEqual(
+            match_params, {"turns": 10, "noise": 0.2, "first_repetition": 2}
+        )
+
+    def test_resume_seeded_tournament_with_adaptive_chunking(self):
+        players = [axelrod.StochasticCooperator(), axelrod.GTFT(), axelrod.Cooperator()]
+        tournament = axelrod.Tournament(
+            players=players, turns=10, repetitions=6, noise=0.1, seed=2
+        )
+        expected_results = tournament.play(progress_bar=False)
+        filename = "test_outputs/test_tournament_resumed.csv"
+        self.interrupted_play(tournament, 3, filename=filename, adaptive_chunking=True)
+        tournament = axelrod.Tournament(
+            players=players, turns=10, repetitions=6, noise=0.1, seed=2
+        )
+        results = tournament.resume(
+            "test_outputs/test_tournament.checkpoint", progress_bar=False
+        )
+        self.assertEqual(results, expected_results)
+
+    def test_play_raises_error_for_checkpoint_without_filename(self):
+        with self.assertRaises(ValueError):
+            self.test_tournament.play(
+                progress_bar=False, checkpoint="test_outputs/test.checkpoint"
+            )
+
+    def test_checkpoint_and_resume(self):
+        players = [
+            axelrod.Cooperator(),
+            axelrod.Random(),
+            axelrod.TitForTat(),
+            axelrod.GTFT(),
+        ]
+        for output_format in ["csv", "binary"]:
+            filename = "test_outputs/test_tournament_resumed.{}".format(output_format)
+            tournament = axelrod.Tournament(
+                players=players, turns=10, repetitions=3, noise=0.1
+            )
+            axelrod.seed(0)
+            expected_results = tournament.play(
+                progress_bar=False, output_format=output_format
+            )
+            axelrod.seed(0)
+            self.interrupted_play(
+                tournament, 4, filename=filename, output_format=output_format
+            )
+
+            axelrod.seed(1)
+            tournament = axelrod.Tournament(
+                players=players, turns=10, repetitions=3, noise=0.1
+            )
+            results = tournament.resume(
+                "test_outputs/test_tournament.checkpoint", progress_bar=False
+            )
+            self.assertEqual(tournament.output_format, output_format)
+            self.assertEqual(tournament.filename, filename)
+            self.assertEqual(tournament.num_interactions, 30)
+            self.assertEqual(results, expected_results)
+
+    def test_resume_with_adaptive_chunking(self):
+        tournament = axelrod.Tournament(
+            players=self.players, game=self.game, turns=10, repetitions=4
+        )
+        expected_results = tournament.play(progress_bar=False)
+        filename = "test_outputs/test_tournament_resumed.csv"
+        self.interrupted_play(tournament, 2, filename=filename, adaptive_chunking=True)
+        # Some of the repetitions of a pair may have been written.
+        tournament = axelrod.Tournament(
+            players=self.players, game=self.game, turns=10, repetitions=4
+        )
+        results = tournament.resume(
+            "test_outputs/test_tournament.checkpoint", progress_bar=False
+        )
+        self.assertTrue(tournament.adaptive_chunking)
+        self.assertEqual(results, expected_results)
+
+        df = pd.read_csv(filename)
+        repetitions = df.groupby(["Player index", "Opponent index"])["Repetition"]
+        for _, values in repetitions:
+            self.assertEqual(sorted(set(values)), [0, 1, 2, 3])
+
+    def test_resume_a_complete_tournament(self):
+        tournament = axelrod.Tournament(
+            players=self.players, game=self.game, turns=10, repetitions=2
+        )
+        filename = "test_outputs/test_tournament_resumed.csv"
+        results = tournament.play(
+            progress_bar=False,
+            filename=filename,
+            checkpoint="test_outputs/test_tournament.checkpoint",
+        )
+        resumed_results = tournament.resume(
+            "test_outputs/test_tournament.checkpoint", progress_bar=False
+        )
+        self.assertEqual(results, resumed_results)
+
+    def test_resume_raises_error_for_another_tournament(self):
+        tournament = axelrod.Tournament(
+            players=self.players, game=self.game, turns=10, repetitions=2
+        )
+        tournament.play(
+            progress_bar=False,
+            filename="test_outputs/test_tournament_resumed.csv",
+            checkpoint="test_outputs/test_tournament.checkpoint",
+        )
+        tournament = axelrod.Tournament(
+            players=self.players, game=self.game, turns=10, repetitions=3
+        )
+        with self.assertRaises(ValueError):
+            tournament.resume("test_outputs/test_tournament.checkpoint")
+
 
 class TestProbEndTournament(unittest.TestCase):
     @classmethod
@@ -1,22 +1,39 @@
 import csv
 import logging
 import os
+import pickle
+import random
+import time
 import warnings
-from collections import defaultdict
+from collections import Counter, defaultdict
 from multiprocessing import Process, Queue, cpu_count
+from queue import Empty
 from tempfile import mkstemp
 from typing import List, Optional, Tuple
 
 import axelrod.interaction_utils as iu
+import numpy as np
 import tqdm
 from axelrod import DEFAULT_TURNS
 from axelrod.action import Action, actions_to_str, str_to_actions
 from axelrod.player import Player
 
+from .batch_match import BatchMatch
+from .deterministic_cache import (
+    DeterministicCache,
+    PersistentDeterministicCache,
+    SharedDeterministicCache,
+)
+from .executors import Executor
 from .game import Game
+from .history import ArrayHistory
+from .interaction_log import InteractionLogWriter
+from .markov_chain import is_memory_one_player
 from .match import Match
 from .match_generator import MatchGenerator
-from .result_set import ResultSet
+from .random_ import derive_seed, seed
+from .result_set import ResultAccumulator, ResultAggregator, ResultSet
+from .scheduler import estimate_costs, schedule_chunks
 
 C, D = Action.C, Action.D
 
@@ -33,6 +50,8 @@ class Tournament(object):
         noise: float = 0,
         edges: List[Tuple] = None,
         match_attributes: dict = None,
+        deterministic_cache: DeterministicCache = None,
+        seed: int = None,
     ) -> None:
         """
         Parameters
@@ -59,7 +78,32 @@ class Tournament(object):
             Mapping attribute names to values which should be passed to players.
             The default is to use the correct values for turns, game and noise
             but these can be overridden if desired.
+        deterministic_cache : axelrod.PersistentDeterministicCache
+            A cache of resulting actions for deterministic matches, used by all
+            matches of the tournament. By default each pair of players uses a
+            new cache. As it is shared by all pairs, the cache must be keyed on
+            the full representation of the players (a
+            PersistentDeterministicCache or a SharedDeterministicCache) rather
+            than on their names, as a DeterministicCache is. When playing in
+            parallel, use a SharedDeterministicCache (or a
+            PersistentDeterministicCache stored in a file) so that the matches
+            played by a worker are available to all the others.
+        seed : integer
+            A root seed from which the random states are seeded before each
+            repetition of each match (see axelrod.random_.derive_seed). The
+            results are then the same however the matches are played: in
+            serial, in parallel with any number of processes or resumed from
+            a checkpoint.
         """
+        hashed_caches = (PersistentDeterministicCache, SharedDeterministicCache)
+        if deterministic_cache is not None and not isinstance(
+            deterministic_cache, hashed_caches
+        ):
+            raise ValueError(
+                "A DeterministicCache is keyed on the names of the players and "
+                "can not be shared by the matches of a tournament: use a "
+                "PersistentDeterministicCache or a SharedDeterministicCache."
+            )
         if game is None:
             self.game = Game()
         else:
@@ -70,6 +114,8 @@ class Tournament(object):
         self.players = players
         self.repetitions = repetitions
         self.edges = edges
+        self.deterministic_cache = deterministic_cache
+        self.seed = seed
 
         if turns is None and prob_end is None:
             turns = DEFAULT_TURNS
@@ -89,8 +135,38 @@ class Tournament(object):
         self._logger = logging.getLogger(__name__)
 
         self.use_progress_bar = True
+        self.batch_memory_one = False
+        self.array_history = False
+        self.output_format = "csv"
+        self.in_memory = False
+        self._accumulator = None  # type: Optional[ResultAccumulator]
+        self.aggregator = None  # type: Optional[ResultAggregator]
+        self.adaptive_chunking = False
+        self.profile = None  # type: Optional[dict]
+        # The observed time (in seconds) of a repetition of the match of each
+        # pair of players, recorded when playing with adaptive chunking.
+        self.timings = {}  # type: dict
+        # The repetitions written for each pair of players, as a list of
+        # (first repetition, number of repetitions) tuples.
+        self._repetitions_written = defaultdict(list)  # type: defaultdict
         self.filename = None  # type: Optional[str]
         self._temp_file_descriptor = None  # type: Optional[int]
+        self.checkpoint = None  # type: Optional[str]
+        self.checkpoint_interval = 60.0
+        self._last_checkpoint = 0.0
+        self._build_results = True
+        # The position in the output file from which to append when resuming.
+        self._output_offset = None  # type: Optional[int]
+
+    def __getstate__(self):
+        """
+        Leaves out the objects collecting the results, which are only used by
+        the process writing them (and not by the workers playing the matches).
+        """
+        state = self.__dict__.copy()
+        state["_accumulator"] = None
+        state["aggregator"] = None
+        return state
 
     def setup_output(self, filename=None):
         """assign/create `filename` to `self`. If file should be deleted once
@@ -108,6 +184,16 @@ class Tournament(object):
         filename: str = None,
         processes: int = None,
         progress_bar: bool = True,
+        batch_memory_one: bool = False,
+        array_history: bool = False,
+        output_format: str = "csv",
+        in_memory: bool = False,
+        aggregator: ResultAggregator = None,
+        adaptive_chunking: bool = False,
+        profile: dict = None,
+        executor: Executor = None,
+        checkpoint: str = None,
+        checkpoint_interval: float = 60,
     ) -> ResultSet:
         """
         Plays the tournament and passes the results to the ResultSet class
@@ -122,6 +208,54 @@ class Tournament(object):
             The number of processes to be used for parallel processing
         progress_bar : bool
             Whether or not to create a progress bar which will be updated
+        batch_memory_one : bool
+            Whether or not to play all repetitions of matches between two
+            memory one players at once using axelrod.BatchMatch
+        array_history : bool
+            Whether or not the players should record their history in an
+            axelrod.ArrayHistory (which counts plays over any window of the
+            history in constant time) instead of an axelrod.History
+        output_format : string
+            The format of the file to which the interactions are written:
+            "csv" or "binary" (a binary log of the interactions, see
+            axelrod.interaction_log, which is much smaller and faster to write
+            and read back).
+        in_memory : bool
+            Whether or not to build the results set from summaries of the
+            interactions kept in memory instead of writing the interactions to
+            a temporary file and reading them back. This can not be used along
+            with a filename.
+        aggregator : axelrod.ResultAggregator
+            An aggregator to which the results of the interactions are added
+            as they are played, so that a snapshot of the results can be taken
+            before the end of the tournament. If its stop function returns
+            True, the remaining matches are not played and the results of
+            the interactions played so far are returned. This requires
+            build_results. Unless a filename is given or in_memory is True,
+            the interactions are then neither written nor kept: the results
+            set returned is a snapshot of the aggregator.
+        adaptive_chunking : bool
+            Whether or not to schedule the matches by their estimated cost
+            (see axelrod.scheduler): the matches of expensive pairs of players
+            are split across repetitions, those of cheap pairs are batched
+            together and the most expensive are played first. The time taken
+            by each pair is recorded in self.timings and used to schedule
+            later plays of the tournament.
+        profile : dict
+            A timing profile of the strategies (see
+            axelrod.scheduler.profile_strategies) used to estimate the cost of
+            the matches with adaptive chunking.
+        executor : axelrod.executors.Executor
+            An executor playing the chunks of matches instead of the current
+            process or its sub-processes (for example an
+            axelrod.BrokerExecutor handing them out to workers on other
+            machines). When given, processes is ignored.
+        checkpoint : string
+            The name of a file to which the progress of the tournament is
+            regularly saved, so that it can be resumed (see resume) if it is
+            interrupted. This requires a filename.
+        checkpoint_interval : float
+            The minimum time (in seconds) between two checkpoints
 
         Returns
         -------
@@ -130,8 +264,40 @@ class Tournament(object):
         self.num_interactions = 0
 
         self.use_progress_bar = progress_bar
-
-        self.setup_output(filename)
+        self.batch_memory_one = batch_memory_one
+        self.array_history = array_history
+        if output_format not in ("csv", "binary"):
+            raise ValueError(
+                "output_format must be 'csv' or 'binary', not {}".format(
+                    output_format
+                )
+            )
+        self.output_format = output_format
+        if in_memory and filename is not None:
+            raise ValueError("A filename can not be given when in_memory is True")
+        self.in_memory = in_memory
+        if aggregator is not None and not build_results:
+            raise ValueError("An aggregator requires build_results to be True")
+        self.aggregator = aggregator
+        self.adaptive_chunking = adaptive_chunking
+        self.profile = profile
+        self._repetitions_written = defaultdict(list)
+        if checkpoint is not None and filename is None:
+            raise ValueError("A checkpoint requires a filename")
+        self.checkpoint = checkpoint
+        self.checkpoint_interval = checkpoint_interval
+        self._output_offset = None
+
+        if in_memory:
+            self.filename = None
+            self._temp_file_descriptor = None
+            self._accumulator = ResultAccumulator() if build_results else None
+        elif aggregator is not None and filename is None:
+            # The results are only held by the aggregator.
+            self.filename = None
+            self._temp_file_descriptor = None
+        else:
+            self.setup_output(filename)
 
         if not build_results and not filename:
             warnings.warn(
@@ -139,13 +305,97 @@ class Tournament(object):
                 "build_results=False and no filename was supplied."
             )
 
-        if processes is None:
+        return self._play(build_results, processes, progress_bar, executor)
+
+    def resume(
+        self,
+        checkpoint: str,
+        processes: int = None,
+        progress_bar: bool = True,
+        executor: Executor = None,
+        checkpoint_interval: float = 60,
+    ) -> ResultSet:
+        """
+        Resumes a tournament interrupted after saving a checkpoint.
+
+        The matches recorded in the checkpoint are not played again: the
+        others are played with the options given to play and their
+        interactions are appended to the output file. The random states are
+        restored from the checkpoint.
+
+        Parameters
+        ----------
+        checkpoint : string
+            The checkpoint file given to play
+        processes : integer
+            The number of processes to be used for parallel processing
+        progress_bar : bool
+            Whether or not to create a progress bar which will be updated
+        executor : axelrod.executors.Executor
+            An executor playing the chunks of matches (see play)
+        checkpoint_interval : float
+            The minimum time (in seconds) between two checkpoints
+
+        Returns
+        -------
+        axelrod.ResultSet
+        """
+        with open(checkpoint, "rb") as file_obj:
+            state = pickle.load(file_obj)
+        if state["tournament"] != self._checkpoint_key():
+            raise ValueError(
+                "{} is not a checkpoint of this tournament.".format(checkpoint)
+            )
+
+        self.num_interactions = state["num_interactions"]
+        self.use_progress_bar = progress_bar
+        self.batch_memory_one = state["batch_memory_one"]
+        self.array_history = state["array_history"]
+        self.output_format = state["output_format"]
+        self.in_memory = False
+        self._accumulator = None
+        self.aggregator = None
+        self.adaptive_chunking = state["adaptive_chunking"]
+        self.profile = state["profile"]
+        self.timings.update(state["timings"])
+        self._repetitions_written = defaultdict(list, state["repetitions_written"])
+        self.filename = state["filename"]
+        self._temp_file_descriptor = None
+        self.checkpoint = checkpoint
+        self.checkpoint_interval = checkpoint_interval
+        self._output_offset = state["offset"]
+        random.setstate(state["random_state"])
+        np.random.set_state(state["numpy_random_state"])
+
+        return self._play(state["build_results"], processes, progress_bar, executor)
+
+    def _play(self, build_results, processes, progress_bar, executor) -> ResultSet:
+        """Plays the matches and builds the results set."""
+        self._build_results = build_results
+        self._last_checkpoint = time.perf_counter()
+        if executor is not None:
+            self._run_executor(executor, build_results=build_results)
+        elif processes is None:
             self._run_serial(build_results=build_results)
         else:
             self._run_parallel(build_results=build_results, processes=processes)
 
         result_set = None
-        if build_results:
+        if build_results and self.in_memory:
+            assert self._accumulator is not None
+            result_set = ResultSet(
+                filename=None,
+                players=[str(p) for p in self.players],
+                repetitions=self.repetitions,
+                processes=processes,
+                progress_bar=progress_bar,
+                dataframe=self._accumulator.dataframe(),
+            )
+            self._accumulator = None
+        elif build_results and self.filename is None:
+            assert self.aggregator is not None
+            result_set = self.aggregator.snapshot()
+        elif build_results:
             result_set = ResultSet(
                 filename=self.filename,
                 players=[str(p) for p in self.players],
@@ -160,31 +410,114 @@ class Tournament(object):
 
         return result_set
 
+    def _checkpoint_key(self) -> dict:
+        """Returns what identifies the tournament in a checkpoint."""
+        return {
+            "players": [str(p) for p in self.players],
+            "repetitions": self.repetitions,
+            "turns": self.turns,
+            "prob_end": self.prob_end,
+            "noise": self.noise,
+            "edges": self.edges,
+            "game": self.game.RPST(),
+            "seed": self.seed,
+        }
+
+    def _save_checkpoint(self, out_file, writer, final: bool = False) -> None:
+        """
+        Saves the progress of the tournament to the checkpoint file, if one is
+        used and the last checkpoint is older than the checkpoint interval.
+
+        The output written so far is flushed first, so that the checkpoint
+        never records interactions missing from the output file.
+        """
+        if self.checkpoint is None:
+            return
+        now = time.perf_counter()
+        if not final and now - self._last_checkpoint < self.checkpoint_interval:
+            return
+        if self.output_format == "binary":
+            offset = writer.tell()
+        else:
+            out_file.flush()
+            offset = out_file.tell()
+        state = {
+            "tournament": self._checkpoint_key(),
+            "filename": self.filename,
+            "offset": offset,
+            "num_interactions": self.num_interactions,
+            "repetitions_written": dict(self._repetitions_written),
+            "timings": self.timings,
+            "build_results": self._build_results,
+            "batch_memory_one": self.batch_memory_one,
+            "array_history": self.array_history,
+            "output_format": self.output_format,
+            "adaptive_chunking": self.adaptive_chunking,
+            "profile": self.profile,
+            "random_state": random.getstate(),
+            "numpy_random_state": np.random.get_state(),
+        }
+        # The checkpoint is replaced at once so that an interruption while
+        # saving it leaves the previous one.
+        temporary = self.checkpoint + ".tmp"
+        with open(temporary, "wb") as file_obj:
+            pickle.dump(state, file_obj)
+        os.replace(temporary, self.checkpoint)
+        self._last_checkpoint = now
+
     def _run_serial(self, build_results: bool = True) -> bool:
         """Run all matches in serial."""
 
-        chunks = self.match_generator.build_match_chunks()
+        chunks = self._build_chunks(workers=1)
 
         out_file, writer = self._get_file_objects(build_results)
         progress_bar = self._get_progress_bar()
 
         for chunk in chunks:
-            results = self._play_matches(chunk, build_results=build_results)
-            self._write_interactions_to_file(results, writer=writer)
+            results = self._play_chunk(chunk, build_results=build_results)
+            completed = self._write_chunk_results(results, writer)
 
             if self.use_progress_bar:
-                progress_bar.update(1)
+                progress_bar.update(completed)
+            self._save_checkpoint(out_file, writer)
+            if self._stop_requested():
+                break
 
+        self._save_checkpoint(out_file, writer, final=True)
         _close_objects(out_file, progress_bar)
 
         return True
 
+    def _stop_requested(self) -> bool:
+        """Whether the aggregator asks for the remaining matches not to be
+        played."""
+        return self.aggregator is not None and self.aggregator.should_stop()
+
     def _get_file_objects(self, build_results=True):
         """Returns the file object and writer for writing results or
-        (None, None) if self.filename is None"""
+        (None, None) if self.filename is None. For a binary output the writer
+        is also the file object (closing it writes the remaining rows). When
+        the results are kept in memory, the writer is a ResultAccumulator and
+        there is no file object. When resuming, the file is truncated to the
+        position recorded in the checkpoint and appended to."""
         file_obj = None
         writer = None
-        if self.filename is not None:
+        if self.in_memory:
+            writer = self._accumulator
+        elif self.filename is not None and self.output_format == "binary":
+            writer = InteractionLogWriter(
+                self.filename,
+                player_names=[str(p) for p in self.players],
+                build_results=build_results,
+                offset=self._output_offset,
+            )
+            file_obj = writer
+        elif self.filename is not None and self._output_offset is not None:
+            file_obj = open(self.filename, "r+")
+            file_obj.seek(self._output_offset)
+            file_obj.truncate()
+            writer = csv.writer(file_obj, lineterminator="\n")
+        elif self.filename is not None:
             file_obj = open(self.filename, "w")
             writer = csv.writer(file_obj, lineterminator="\n")
 
@@ -229,13 +562,37 @@ class Tournament(object):
 
     def _get_progress_bar(self):
         if self.use_progress_bar:
-            return tqdm.tqdm(total=self.match_generator.size, desc="Playing matches")
+            completed = sum(
+                self._count_written(index_pair) >= self.repetitions
+                for index_pair in self._repetitions_written
+            )
+            return tqdm.tqdm(
+                total=self.match_generator.size,
+                initial=completed,
+                desc="Playing matches",
+            )
         return None
 
-    def _write_interactions_to_file(self, results, writer):
-        """Write the interactions to csv."""
+    def _count_written(self, index_pair) -> int:
+        """Returns the number of repetitions written for a pair of players."""
+        return sum(count for _, count in self._repetitions_written[index_pair])
+
+    def _write_interactions_to_file(self, results, writer, first_repetition=0):
+        """
+        Write the interactions to csv.
+
+        The repetitions of the matches of a pair of players are numbered from
+        first_repetition, as the matches of a pair may be played in several
+        chunks.
+
+        Returns
+        -------
+        The number of pairs of players all the repetitions of which have now
+        been written.
+        """
+        completed = 0
         for index_pair, interactions in results.items():
-            repetition = 0
+            repetition = first_repetition
             for interaction, results in interactions:
 
                 if results is not None:
@@ -279,9 +636,22 @@ class Tournament(object):
 
                         row.append(int(cooperations[index] >= cooperations[index - 1]))
 
-                    writer.writerow(row)
+                    if writer is not None:
+                        writer.writerow(row)
+                    if results is not None and self.aggregator is not None:
+                        self.aggregator.writerow(row)
                 repetition += 1
                 self.num_interactions += 1
+            previous = self._count_written(index_pair)
+            self._repetitions_written[index_pair].append(
+                (first_repetition, repetition - first_repetition)
+            )
+            if self.repetitions:
+                written = previous + repetition - first_repetition
+                completed += written // self.repetitions - previous // self.repetitions
+            else:
+                completed += 1
+        return completed
 
     def _run_parallel(self, processes: int = 2, build_results: bool = True) -> bool:
         """
@@ -300,12 +670,12 @@ class Tournament(object):
         done_queue = Queue()  # type: Queue
         workers = self._n_workers(processes=processes)
 
-        chunks = self.match_generator.build_match_chunks()
+        chunks = self._build_chunks(workers)
         for chunk in chunks:
             work_queue.put(chunk)
 
         self._start_workers(workers, work_queue, done_queue, build_results)
-        self._process_done_queue(workers, done_queue, build_results)
+        self._process_done_queue(workers, done_queue, build_results, work_queue)
 
         return True
 
@@ -353,7 +723,11 @@ class Tournament(object):
         return True
 
     def _process_done_queue(
-        self, workers: int, done_queue: Queue, build_results: bool = True
+        self,
+        workers: int,
+        done_queue: Queue,
+        build_results: bool = True,
+        work_queue: Queue = None,
     ):
         """
         Retrieves the matches from the parallel sub-processes
@@ -366,24 +740,46 @@ class Tournament(object):
             A queue containing the output dictionaries from each round robin
         build_results : bool
             whether or not to build a results set
+        work_queue : multiprocessing.Queue
+            The queue of the chunks to play, emptied if the aggregator asks
+            for the tournament to stop. The results of the chunks still played
+            by the sub-processes are then ignored.
         """
         out_file, writer = self._get_file_objects(build_results)
         progress_bar = self._get_progress_bar()
 
         stops = 0
+        stopped = False
         while stops < workers:
             results = done_queue.get()
             if results == "STOP":
                 stops += 1
-            else:
-                self._write_interactions_to_file(results, writer)
-
+            elif not stopped:
+                completed = self._write_chunk_results(results, writer)
                 if self.use_progress_bar:
-                    progress_bar.update(1)
-
+                    progress_bar.update(completed)
+                self._save_checkpoint(out_file, writer)
+                if self._stop_requested():
+                    stopped = True
+                    if work_queue is not None:
+                        self._cancel_work(workers, work_queue)
+
+        self._save_checkpoint(out_file, writer, final=True)
         _close_objects(out_file, progress_bar)
         return True
 
+    @staticmethod
+    def _cancel_work(workers: int, work_queue: Queue) -> None:
+        """Removes the chunks not yet played from the work queue, so that
+        the sub-processes stop once they have played their current chunk."""
+        while True:
+            try:
+                work_queue.get_nowait()
+            except Empty:
+                break
+        for _ in range(workers):
+            work_queue.put("STOP")
+
     def _worker(self, work_queue: Queue, done_queue: Queue, build_results: bool = True):
         """
         The work for each parallel sub-process to execute.
@@ -398,11 +794,163 @@ class Tournament(object):
             whether or not to build a results set
         """
         for chunk in iter(work_queue.get, "STOP"):
-            interactions = self._play_matches(chunk, build_results)
-            done_queue.put(interactions)
+            done_queue.put(self._play_chunk(chunk, build_results))
         done_queue.put("STOP")
         return True
 
+    def _run_executor(self, executor: Executor, build_results: bool = True) -> bool:
+        """
+        Run all matches with an executor.
+
+        Parameters
+        ----------
+        executor : axelrod.executors.Executor
+            The executor playing the chunks of matches
+        build_results : bool
+            whether or not to build a results set
+        """
+        chunks = self._build_chunks(executor.workers)
+
+        out_file, writer = self._get_file_objects(build_results)
+        progress_bar = self._get_progress_bar()
+
+        results_iterator = iter(executor.run(self, chunks, build_results))
+        for results in results_iterator:
+            completed = self._write_chunk_results(results, writer)
+            if self.use_progress_bar:
+                progress_bar.update(completed)
+            self._save_checkpoint(out_file, writer)
+            if self._stop_requested():
+                # Closing the iterator lets the executor stop its workers.
+                if hasattr(results_iterator, "close"):
+                    results_iterator.close()
+                break
+
+        self._save_checkpoint(out_file, writer, final=True)
+        _close_objects(out_file, progress_bar)
+        return True
+
+    def _play_chunk(self, chunk, build_results=True):
+        """
+        Play a chunk of matches or a batch (list) of chunks.
+
+        Returns
+        -------
+        The interactions of a chunk (see _play_matches) or the interactions
+        and timings of a batch (see _play_batch).
+        """
+        if isinstance(chunk, list):
+            return self._play_batch(chunk, build_results)
+        return self._play_matches(chunk, build_results)
+
+    def _write_chunk_results(self, results, writer) -> int:
+        """
+        Writes the results of a chunk or a batch (see _play_chunk) and returns
+        the number of pairs of players completed.
+        """
+        if isinstance(results, tuple):
+            results, timings = results
+            self._record_timings(timings)
+            return sum(
+                self._write_interactions_to_file(interactions, writer, first)
+                for first, interactions in results
+            )
+        self._write_interactions_to_file(results, writer)
+        return 1
+
+    def _build_chunks(self, workers: int):
+        """
+        Returns the chunks of matches to play: those of the match generator,
+        or, with adaptive chunking, batches of chunks scheduled for the given
+        number of workers. The repetitions already written (when resuming) are
+        left out.
+        """
+        chunks = self.match_generator.build_match_chunks()
+        if self._repetitions_written:
+            chunks = self._remaining_chunks(chunks)
+        if not self.adaptive_chunking:
+            return chunks
+        return schedule_chunks(
+            chunks, self.players, workers, timings=self.timings, profile=self.profile
+        )
+
+    def _remaining_chunks(self, chunks):
+        """
+        Yields chunks of the repetitions not yet written: one for each range
+        of consecutive missing repetitions of a pair of players.
+        """
+        for index_pair, match_params, repetitions in chunks:
+            written = sorted(self._repetitions_written.get(index_pair, []))
+            first = 0
+            for start, count in written + [(repetitions, 0)]:
+                if start > first:
+                    params = dict(match_params)
+                    if first > 0:
+                        params["first_repetition"] = first
+                    yield index_pair, params, start - first
+                first = max(first, start + count)
+
+    def estimate_runtime(self, profile: dict, processes: int = None) -> float:
+        """
+        Returns the estimated time (in seconds) to play the matches of the
+        tournament, from a timing profile of the strategies. This does not
+        include the time taken to build the results.
+
+        Parameters
+        ----------
+        profile : dict
+            A timing profile of the strategies (see
+            axelrod.scheduler.profile_strategies)
+        processes : integer
+            The number of processes to be used for parallel processing (None
+            for serial processing)
+        """
+        chunks = list(self.match_generator.build_match_chunks())
+        costs = estimate_costs(chunks, self.players, profile=profile)
+        total = sum(
+            cost * repetitions for cost, (_, _, repetitions) in zip(costs, chunks)
+        )
+        if processes is None or not costs:
+            return total
+        # A single match is never split between processes.
+        return max(total / self._n_workers(processes), max(costs))
+
+    def _play_batch(self, batch, build_results=True):
+        """
+        Play the matches of a batch of chunks.
+
+        Parameters
+        ----------
+        batch : list
+            A list of chunks (see _play_matches)
+        build_results : bool
+            whether or not to build a results set
+
+        Returns
+        -------
+        interactions : list
+            Tuples of the form (first repetition, interactions) giving the
+            interactions of each chunk (see _play_matches) and the number of
+            the first of its repetitions
+        timings : list
+            Tuples of the form (index pair, repetitions, seconds) giving the
+            time taken by each chunk
+        """
+        interactions = []
+        timings = []
+        for chunk in batch:
+            start = time.perf_counter()
+            results = self._play_matches(chunk, build_results)
+            timings.append((chunk[0], chunk[2], time.perf_counter() - start))
+            interactions.append((chunk[1].get("first_repetition", 0), results))
+        return interactions, timings
+
+    def _record_timings(self, timings):
+        """Records the time of a repetition of the matches of each pair."""
+        for index_pair, repetitions, seconds in timings:
+            if repetitions:
+                self.timings[index_pair] = seconds / repetitions
+
     def _play_matches(self, chunk, build_results=True):
         """
         Play matches in a given chunk.
@@ -414,6 +962,13 @@ class Tournament(object):
         build_results : bool
             whether or not to build a results set
 
+        With a seed, the random states are seeded before each repetition from
+        the seed, the index pair and the number of the repetition (counted
+        from match_parameters["first_repetition"] if given), so that the
+        results do not depend on how the matches are split between chunks
+        and processes. With a batch of memory one players, each repetition
+        is played from its own generator seeded in the same way.
+
         Returns
         -------
         interactions : dictionary
@@ -423,58 +978,164 @@ class Tournament(object):
         """
         interactions = defaultdict(list)
         index_pair, match_params, repetitions = chunk
+        match_params = dict(match_params)
+        first_repetition = match_params.pop("first_repetition", 0)
         p1_index, p2_index = index_pair
         player1 = self.players[p1_index].clone()
         player2 = self.players[p2_index].clone()
+        if self.array_history:
+            player1.history_class = player2.history_class = ArrayHistory
         match_params["players"] = (player1, player2)
-        match = Match(**match_params)
-        for _ in range(repetitions):
-            match.play()
 
+        if self.batch_memory_one and all(
+            is_memory_one_player(player) for player in (player1, player2)
+        ):
+            match = BatchMatch(repetitions=repetitions, **match_params)
+            if self.seed is None:
+                plays = match.play()
+            else:
+                plays = match.play(
+                    seeds=[
+                        derive_seed(self.seed, *index_pair, repetition)
+                        for repetition in range(
+                            first_repetition, first_repetition + repetitions
+                        )
+                    ]
+                )
+        else:
+            match = Match(deterministic_cache=self.deterministic_cache, **match_params)
+            plays = self._play_repetitions(
+                match, index_pair, first_repetition, repetitions
+            )
+
+        for result in plays:
             if build_results:
-                results = self._calculate_results(match.result)
+                results = self._calculate_results(result)
             else:
                 results = None
 
-            interactions[index_pair].append([match.result, results])
+            interactions[index_pair].append([result, results])
         return interactions
 
-    def _calculate_results(self, interactions):
-        results = []
+    def _seed_match(self, index_pair, repetition):
+        """Seeds the random states for a repetition of the match of a pair."""
+        if self.seed is not None:
+            seed(derive_seed(self.seed, *index_pair, repetition))
 
-        scores = iu.compute_final_score(interactions, self.game)
-        results.append(scores)
+    def _play_repetitions(self, match, index_pair, first_repetition, repetitions):
+        """Yields the interactions of the repetitions of a match."""
+        for repetition in range(first_repetition, first_repetition + repetitions):
+            self._seed_match(index_pair, repetition)
+            yield match.play()
 
-        score_diffs = scores[0] - scores[1], scores[1] - scores[0]
-        results.append(score_diffs)
+    def _expected_matches(self):
+        """
+        Yields the index pair and an unplayed match for each pair of players
+        in the tournament.
+        """
+        for index_pair, match_params, _ in self.match_generator.build_match_chunks():
+            p1_index, p2_index = index_pair
+            player1 = self.players[p1_index].clone()
+            player2 = self.players[p2_index].clone()
+            match_params["players"] = (player1, player2)
+            yield index_pair, Match(**match_params)
+
+    def _build_expected_matrix(self, outcomes, default=int):
+        """
+        Builds a matrix from the expected outcomes of the match of each pair of
+        players.
 
-        turns = len(interactions)
-        results.append(turns)
+        Parameters
+        ----------
+        outcomes : function
+            Maps an unplayed match to the pair of expected outcomes of both
+            players
+        default : function
+            Returns the entry for pairs of players that do not interact
+        """
+        n = len(self.players)
+        matrix = [[default() for _ in range(n)] for _ in range(n)]
+        for (p1_index, p2_index), match in self._expected_matches():
+            outcome = outcomes(match)
+            matrix[p1_index][p2_index] = outcome[0]
+            matrix[p2_index][p1_index] = outcome[1]
+        return matrix
+
+    def expected_payoff_matrix(self, stationary: bool = False) -> List[List]:
+        """
+        Returns the expected mean payoff per turn of each player against each
+        opponent, computed exactly without playing the tournament. Only
+        available if all players are memory one players.
 
-        score_per_turns = iu.compute_final_score_per_turn(interactions, self.game)
-        results.append(score_per_turns)
+        Parameters
+        ----------
+        stationary : bool
+            Whether to use the long run (stationary) distribution of the states
+            of each match instead of the distribution over its turns.
+        """
+        return self._build_expected_matrix(
+            lambda match: match.expected_final_score_per_turn(stationary)
+        )
 
-        score_diffs_per_turns = score_diffs[0] / turns, score_diffs[1] / turns
-        results.append(score_diffs_per_turns)
+    def expected_normalised_cooperation(self, stationary: bool = False) -> List[List]:
+        """
+        Returns the expected cooperation rate of each player against each
+        opponent, computed exactly without playing the tournament. Only
+        available if all players are memory one players.
 
-        initial_coops = tuple(map(bool, iu.compute_cooperations(interactions[:1])))
-        results.append(initial_coops)
+        Parameters
+        ----------
+        stationary : bool
+            Whether to use the long run (stationary) distribution of the states
+            of each match instead of the distribution over its turns.
+        """
+        return self._build_expected_matrix(
+            lambda match: match.expected_normalised_cooperation(stationary)
+        )
 
-        cooperations = iu.compute_cooperations(interactions)
-        results.append(cooperations)
+    def expected_normalised_state_distribution(
+        self, stationary: bool = False
+    ) -> List[List]:
+        """
+        Returns the expected normalised state distribution of each player
+        against each opponent (from the point of view of the player), computed
+        exactly without playing the tournament. Only available if all players
+        are memory one players.
 
-        state_distribution = iu.compute_state_distribution(interactions)
-        results.append(state_distribution)
+        Parameters
+        ----------
+        stationary : bool
+            Whether to use the long run (stationary) distribution of the states
+            of each match instead of the distribution over its turns.
+        """
 
-        state_to_action_distributions = iu.compute_state_to_action_distribution(
-            interactions
-        )
-        results.append(state_to_action_distributions)
+        def outcomes(match):
+            distribution = match.expected_normalised_state_distribution(stationary)
+            reversed_distribution = Counter(
+                {state[::-1]: value for state, value in distribution.items()}
+            )
+            return distribution, reversed_distribution
 
-        winner_index = iu.compute_winner_index(interactions, self.game)
-        results.append(winner_index)
+        return self._build_expected_matrix(outcomes, default=Counter)
 
-        return results
+    def _calculate_results(self, interactions):
+        statistics = iu.compute_match_statistics(interactions, self.game)
+        scores = statistics.scores
+        turns = statistics.turns
+        score_diffs = scores[0] - scores[1], scores[1] - scores[0]
+        score_diffs_per_turns = score_diffs[0] / turns, score_diffs[1] / turns
+        return [
+            scores,
+            score_diffs,
+            turns,
+            statistics.scores_per_turn,
+            score_diffs_per_turns,
+            statistics.initial_cooperations,
+            statistics.cooperations,
+            statistics.state_distribution,
+            statistics.state_to_action_distributions,
+            statistics.winner_index,
+        ]
 
 
 def _close_objects(*objs):